@@ -1,4 +1,4 @@
-from flask import Flask, render_template, redirect, url_for, request
+from flask import Flask, render_template, redirect, url_for, request, jsonify
 import sqlite3
 import os
 from datetime import datetime, timedelta
@@ -10,11 +10,18 @@ import random
 import math
 from config import PLAYER_DB_PATH, COURSE_DB_PATH, TOURNAMENT_DB_PATH
 import pandas as pd
+import numpy as np
+from core.course_model import load_course_model
+from core.field_simulator import SKILL_COLUMNS
+from core.live_simulation import LiveTournament, tee_waves
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import hole_type_ratings
+from core.weather import tournament_weather
 
 app = Flask(__name__)
 
-# In-memory simulation state (for demo; will move to persistent storage later)
-sim_state = {}
+# Live simulation state is persisted in the tournaments DB (live_tournament_state),
+# so a restarted server resumes events where they stopped
 
 def get_all_players():
     conn = sqlite3.connect(PLAYER_DB_PATH)
@@ -612,6 +619,112 @@ def tournament_detail(tournament_id):
 
     return render_template('tournament_detail.html', tournament=tournament, groups=sorted_groups if not show_provisional else [], provisional_qualifiers=provisional_qualifiers, qualifier_columns=qualifier_columns if show_provisional else None, country_to_flag_iso=country_to_flag_iso, winner_points=winner_points, cut_line=cut_line, show_provisional=show_provisional, weather_forecast=weather_forecast)
 
+def start_live_tournament(tournament_id, seed=None):
+    """Start live simulation of a tournament from its field and course; None if it can't be started"""
+    tconn = sqlite3.connect(TOURNAMENT_DB_PATH)
+    tournament = None
+    try:
+        tcur = tconn.cursor()
+        tcur.execute('''
+            SELECT t.course_id, t.cut_line_type, t.cut_line_value, s.start_date
+            FROM tournaments t
+            JOIN tournament_schedule s ON t.id = s.tournament_id
+            WHERE t.id = ?
+        ''', (tournament_id,))
+        row = tcur.fetchone()
+        tcur.execute('''
+            SELECT player_id, group_number FROM tournament_fields
+            WHERE tournament_id = ?
+            ORDER BY starting_position
+        ''', (tournament_id,))
+        field = tcur.fetchall()
+        if not row or not field:
+            return None
+
+        player_ids = [player_id for player_id, _ in field]
+        pconn = sqlite3.connect(PLAYER_DB_PATH)
+        try:
+            q_marks = ','.join(['?'] * len(player_ids))
+            pcur = pconn.cursor()
+            pcur.execute(f"SELECT id, {', '.join(SKILL_COLUMNS)} FROM players WHERE id IN ({q_marks})", player_ids)
+            skills = {player[0]: player[1:] for player in pcur.fetchall()}
+        finally:
+            pconn.close()
+        if any(player_id not in skills for player_id in player_ids):
+            # A field player missing from the players DB
+            return None
+        skill_matrix = np.array([skills[player_id] for player_id in player_ids], dtype=np.float64)
+
+        # Weather is drawn once for the event (AM/PM waves) and saved with the live state;
+        # an event without a start date yet gets the default normals
+        streams = SimulationStreams(seed)
+        weather = tournament_weather(row[0], row[3], streams, (tournament_id,), waves=2, db_path=COURSE_DB_PATH)
+        tournament = LiveTournament.start(
+            tconn, tournament_id, load_course_model(row[0], COURSE_DB_PATH), player_ids,
+            hole_type_ratings(skill_matrix), waves=tee_waves([group for _, group in field]), seed=streams.seed,
+            cut_type=row[1] or 'none', cut_value=row[2], weather=weather
+        )
+        return tournament
+    finally:
+        # The live tournament keeps the connection open; every other path closes it
+        if tournament is None:
+            tconn.close()
+
+def live_response(tournament):
+    """JSON leaderboard for a live tournament"""
+    player_ids = [int(player_id) for player_id in tournament.player_ids]
+    conn = sqlite3.connect(PLAYER_DB_PATH)
+    q_marks = ','.join(['?'] * len(player_ids))
+    names = dict(conn.execute(f'SELECT id, name FROM players WHERE id IN ({q_marks})', player_ids).fetchall())
+    conn.close()
+    return jsonify({
+        'tournament_id': tournament.tournament_id,
+        'status': tournament.status,
+        'round': tournament.current_round,
+        'weather': tournament.weather.as_rows() if tournament.weather is not None else [],
+        'leaderboard': tournament.leaderboard(names)
+    })
+
+@app.route('/tournament/<int:tournament_id>/live')
+def live_leaderboard(tournament_id):
+    """Current live leaderboard, resumed from the persisted state"""
+    conn = sqlite3.connect(TOURNAMENT_DB_PATH)
+    try:
+        tournament = LiveTournament.resume(conn, tournament_id, course_db_path=COURSE_DB_PATH)
+        if tournament is None:
+            return jsonify({'error': 'Live simulation not started'}), 404
+        return live_response(tournament)
+    finally:
+        conn.close()
+
+@app.route('/tournament/<int:tournament_id>/live/start', methods=['POST'])
+def live_start(tournament_id):
+    """Start (or restart) the live simulation; optional ?seed=N"""
+    tournament = start_live_tournament(tournament_id, request.args.get('seed', type=int))
+    if tournament is None:
+        return jsonify({'error': 'Tournament or field not found'}), 404
+    try:
+        return live_response(tournament)
+    finally:
+        tournament.conn.close()
+
+@app.route('/tournament/<int:tournament_id>/live/step', methods=['POST'])
+def live_step(tournament_id):
+    """Advance one hole; ?wave=N limits it to one tee-time wave, ?through=round plays out the round"""
+    conn = sqlite3.connect(TOURNAMENT_DB_PATH)
+    try:
+        tournament = LiveTournament.resume(conn, tournament_id, course_db_path=COURSE_DB_PATH)
+        if tournament is None:
+            return jsonify({'error': 'Live simulation not started'}), 404
+        wave = request.args.get('wave', type=int)
+        if request.args.get('through') == 'round':
+            tournament.play_wave(wave)
+        else:
+            tournament.step(wave)
+        return live_response(tournament)
+    finally:
+        conn.close()
+
 @app.route('/standings')
 def standings():
     """Display real Season 10 final standings from the database"""
@@ -1,5 +1,24 @@
 from .event_types import event_type_manager, EventType, CutLine, PointsStructure
 from .tournament_logic import tournament_logic, TournamentLogic
+from .field_simulator import FieldSimulator, FieldModelParams, FieldResult
+from .rng_streams import SimulationStreams
+from .outcome_engine import OutcomeEngine, OutcomeProbabilities
+from .course_model import CourseModel, load_course_model
+from .tournament_simulator import TournamentSimulator, TournamentResult, hole_type_ratings
+from .skill_weights import load_skill_weights, effective_skills
+from .live_simulation import LiveTournament
+from .cut_rules import apply_cut
+from .weather import TournamentWeather, tournament_weather
+from .mental_state import MentalState, MentalParams
+from .scorecard_store import Scorecards, save_scorecards, load_scorecards
+from .leaderboard import LeaderboardSnapshot, LeaderboardTracker, stream_leaderboard
+from .playoff import PlayoffResult, settle_result, tied_positions
+from .qualifiers import Qualifier, QualifierResult, run_qualifiers, save_monday_qualifiers
+from .calibration import CalibrationTargets, calibrate_field_model, calibrate_stroke_model, parameter_grid
+from .score_distribution import ScoreDistribution, tournament_distribution
+from .score_table import ScoreTable, ScoreTableSpec, get_score_table
+from .result_writer import ResultTable, ResultWriter
+from .migrations import Migration, migrate, full_table_scans
 
 __all__ = [
     'event_type_manager',
@@ -7,5 +26,51 @@ __all__ = [
     'EventType',
     'CutLine',
     'PointsStructure',
-    'TournamentLogic'
-] 
\ No newline at end of file
+    'TournamentLogic',
+    'FieldSimulator',
+    'FieldModelParams',
+    'FieldResult',
+    'SimulationStreams',
+    'OutcomeEngine',
+    'OutcomeProbabilities',
+    'CourseModel',
+    'load_course_model',
+    'TournamentSimulator',
+    'TournamentResult',
+    'hole_type_ratings',
+    'load_skill_weights',
+    'effective_skills',
+    'LiveTournament',
+    'apply_cut',
+    'TournamentWeather',
+    'tournament_weather',
+    'MentalState',
+    'MentalParams',
+    'Scorecards',
+    'save_scorecards',
+    'load_scorecards',
+    'LeaderboardSnapshot',
+    'LeaderboardTracker',
+    'stream_leaderboard',
+    'PlayoffResult',
+    'settle_result',
+    'tied_positions',
+    'Qualifier',
+    'QualifierResult',
+    'run_qualifiers',
+    'save_monday_qualifiers',
+    'CalibrationTargets',
+    'calibrate_field_model',
+    'calibrate_stroke_model',
+    'parameter_grid',
+    'ScoreDistribution',
+    'tournament_distribution',
+    'ScoreTable',
+    'ScoreTableSpec',
+    'get_score_table',
+    'ResultTable',
+    'ResultWriter',
+    'Migration',
+    'migrate',
+    'full_table_scans'
+]
@@ -0,0 +1,185 @@
+"""
+Batched calibration of simulator parameters against target scoring distributions.
+
+Hand-tuned constants - the stroke model's randomness and performance points
+per stroke, the regular-season model's event luck and randomness factors -
+are fitted here by grid search instead of by rerunning whole seasons. Each
+evaluation simulates thousands of rounds as (runs x players x holes) arrays
+and reduces them to a few metrics:
+
+- scoring_average: strokes per round over the whole field
+- winning_to_par: the 72-hole winning score relative to par
+- top_rated_win_share: share of events won by the top-rated players
+
+Every parameter set sees the same uniforms (common random numbers): batches
+of runs are drawn once and replayed through each point of the grid, so
+differences between parameter sets are differences in the model, not in the
+draws, and the grid is searched with one pass over the random numbers.
+"""
+
+import itertools
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .course_model import CourseModel
+from .field_simulator import FieldModelParams, FieldSimulator
+from .rng_streams import SimulationStreams
+from .skill_weights import par_type_index
+from .tournament_simulator import PERFORMANCE_PER_STROKE, TournamentSimulator
+
+# Stroke-model parameters and their current values
+STROKE_MODEL_DEFAULTS = {'randomness': 15.0, 'performance_per_stroke': PERFORMANCE_PER_STROKE}
+
+# Metric scales: a miss of one scale unit adds 1 to the loss
+METRIC_SCALES = {'scoring_average': 0.5, 'winning_to_par': 2.0, 'top_rated_win_share': 0.05}
+
+# Stream key separating calibration draws from season simulation
+CALIBRATION_STREAM = 99
+
+
+@dataclass
+class CalibrationTargets:
+    """Target values of the metrics (None = not fitted)"""
+    scoring_average: Optional[float] = None      # strokes per round
+    winning_to_par: Optional[float] = None       # 72-hole winning score relative to par
+    top_rated_win_share: Optional[float] = None  # share of wins by the `top_rated` best-rated players
+    top_rated: int = 10
+    scales: Dict[str, float] = field(default_factory=lambda: dict(METRIC_SCALES))
+
+    def targets(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in METRIC_SCALES if getattr(self, name) is not None}
+
+    def loss(self, metrics: Dict[str, float]) -> float:
+        """Sum of squared scaled misses over the targeted metrics a model reports"""
+        return float(sum(((metrics[name] - target) / self.scales[name]) ** 2
+                         for name, target in self.targets().items() if name in metrics))
+
+
+@dataclass
+class CalibrationPoint:
+    """One evaluated parameter set"""
+    params: Dict[str, float]
+    metrics: Dict[str, float]
+    loss: float
+
+
+def parameter_grid(**values: Sequence[float]) -> List[Dict[str, float]]:
+    """All combinations of the given parameter values, e.g. parameter_grid(randomness=[10, 15, 20])"""
+    names = list(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*(values[name] for name in names))]
+
+
+def top_rated_mask(ratings: np.ndarray, top_rated: int) -> np.ndarray:
+    """Players among the `top_rated` best overall ratings (mean over par types)"""
+    overall = ratings.mean(axis=1) if ratings.ndim == 2 else ratings
+    mask = np.zeros(len(overall), dtype=bool)
+    mask[np.argsort(-overall, kind='stable')[:top_rated]] = True
+    return mask
+
+
+def _win_share(scores: np.ndarray, top: np.ndarray, lower_is_better: bool) -> float:
+    """Sum over runs of the top-rated share of each run's winners (ties split the win)"""
+    best = scores.min(axis=1, keepdims=True) if lower_is_better else scores.max(axis=1, keepdims=True)
+    winners = scores == best
+    return float(((winners & top).sum(axis=1) / winners.sum(axis=1)).sum())
+
+
+def _batches(runs: int, batch_runs: int):
+    for start in range(0, runs, batch_runs):
+        yield start // batch_runs, min(batch_runs, runs - start)
+
+
+def stroke_model_metrics(course: CourseModel, ratings: np.ndarray, grid: Sequence[Dict[str, float]],
+                         streams: SimulationStreams, runs: int = 1000, rounds: int = 4,
+                         top_rated: int = 10, batch_runs: int = 100) -> List[Dict[str, float]]:
+    """
+    Metrics of the TournamentSimulator stroke model for every parameter set.
+
+    Args:
+        course: course the events are played on
+        ratings: (n_players,) or (n_players x 3) ratings
+        grid: parameter sets over STROKE_MODEL_DEFAULTS keys
+        streams: random streams; every parameter set replays the same draws
+        runs: simulated events per parameter set
+        rounds: rounds per event (no cut, no weather, no mental state)
+        top_rated: size of the top-rated group for the win share
+        batch_runs: events simulated per array batch (bounds memory)
+
+    Returns:
+        One metrics dict per parameter set, in grid order
+    """
+    ratings = np.asarray(ratings, dtype=np.float64)
+    event_holes = course.event_holes(rounds)
+    par, difficulty = event_holes['par'], event_holes['difficulty']
+    hole_ratings = ratings[:, par_type_index(par)] if ratings.ndim == 2 else ratings[:, None]
+    top = top_rated_mask(ratings, top_rated)
+    n_players = len(ratings)
+    event_par = int(par.sum())
+
+    sums = np.zeros((len(grid), 3))
+    for batch, size in _batches(runs, batch_runs):
+        # One draw per batch, replayed through every parameter set
+        uniforms = streams.generator(CALIBRATION_STREAM, batch).random((size, n_players, len(par)))
+        for i, point in enumerate(grid):
+            params = dict(STROKE_MODEL_DEFAULTS, **point)
+            performance = TournamentSimulator.performance_score(hole_ratings, difficulty, uniforms, params['randomness'])
+            strokes = TournamentSimulator.performance_to_strokes(performance, par, params['performance_per_stroke'])
+            event_totals = strokes.sum(axis=2, dtype=np.int32)
+            sums[i] += (event_totals.sum(), (event_totals.min(axis=1) - event_par).sum(),
+                        _win_share(event_totals, top, lower_is_better=True))
+
+    return [
+        {'scoring_average': float(total / (runs * n_players * rounds)), 'winning_to_par': float(winning / runs),
+         'top_rated_win_share': float(share / runs)}
+        for total, winning, share in sums
+    ]
+
+
+def field_model_metrics(total_skill: np.ndarray, composure: np.ndarray, grid: Sequence[Dict[str, float]],
+                        streams: SimulationStreams, runs: int = 1000, base: Optional[FieldModelParams] = None,
+                        top_rated: int = 10, batch_runs: int = 100) -> List[Dict[str, float]]:
+    """
+    Metrics of the regular-season FieldSimulator model for every parameter set.
+
+    The model scores performance rather than strokes, so only
+    top_rated_win_share is reported. `grid` holds FieldModelParams fields
+    (e.g. event_luck_factor, randomness_factor) overriding `base`.
+    """
+    total_skill = np.asarray(total_skill, dtype=np.float64)
+    composure = np.asarray(composure, dtype=np.float64)
+    base = base or FieldModelParams()
+    top = top_rated_mask(total_skill, top_rated)
+    simulators = [FieldSimulator(replace(base, **point)) for point in grid]
+
+    shares = np.zeros(len(grid))
+    for batch, size in _batches(runs, batch_runs):
+        uniforms = simulators[0].draw_uniforms(streams.generator(CALIBRATION_STREAM, batch), len(total_skill), (size,))
+        for i, simulator in enumerate(simulators):
+            event_totals = simulator.hole_performance(total_skill, composure, *uniforms).sum(axis=-1)
+            shares[i] += _win_share(event_totals, top, lower_is_better=False)
+    return [{'top_rated_win_share': float(share / runs)} for share in shares]
+
+
+def rank_points(grid: Sequence[Dict[str, float]], metrics: Sequence[Dict[str, float]],
+                targets: CalibrationTargets) -> List[CalibrationPoint]:
+    """Evaluated parameter sets, best fit first"""
+    points = [CalibrationPoint(dict(params), values, targets.loss(values)) for params, values in zip(grid, metrics)]
+    return sorted(points, key=lambda point: point.loss)
+
+
+def calibrate_stroke_model(course: CourseModel, ratings: np.ndarray, grid: Sequence[Dict[str, float]],
+                           targets: CalibrationTargets, streams: SimulationStreams, runs: int = 1000,
+                           rounds: int = 4, batch_runs: int = 100) -> List[CalibrationPoint]:
+    """Grid search of the stroke model's parameters; best fit first"""
+    metrics = stroke_model_metrics(course, ratings, grid, streams, runs, rounds, targets.top_rated, batch_runs)
+    return rank_points(grid, metrics, targets)
+
+
+def calibrate_field_model(total_skill: np.ndarray, composure: np.ndarray, grid: Sequence[Dict[str, float]],
+                          targets: CalibrationTargets, streams: SimulationStreams, runs: int = 1000,
+                          base: Optional[FieldModelParams] = None, batch_runs: int = 100) -> List[CalibrationPoint]:
+    """Grid search of the regular-season model's parameters; best fit first"""
+    metrics = field_model_metrics(total_skill, composure, grid, streams, runs, base, targets.top_rated, batch_runs)
+    return rank_points(grid, metrics, targets)
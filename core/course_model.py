@@ -0,0 +1,157 @@
+"""
+Compiled course model for hole simulation.
+
+Loads a course's holes and characteristics from golf_courses.db once and
+compiles them into contiguous per-hole arrays (par, yardage, handicap index,
+difficulty) plus the course factors. Models are cached by course_id, so a
+tournament never queries SQLite or builds per-hole dicts while simulating.
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+# course_characteristics columns carried into the model (all on a 0-1 scale except elevation)
+COURSE_FACTOR_COLUMNS = [
+    'design_strategy', 'narrowness_factor', 'hazard_density', 'green_speed',
+    'turf_firmness', 'rough_length', 'terrain_difficulty', 'elevation'
+]
+
+# Factors that make every hole on the course play harder
+DIFFICULTY_FACTOR_COLUMNS = ['narrowness_factor', 'hazard_density', 'green_speed', 'rough_length', 'terrain_difficulty']
+
+# Typical tour length by par, used to scale difficulty by yardage
+PAR_LENGTH = {3: 190, 4: 430, 5: 560}
+
+_COURSE_CACHE: Dict[tuple, 'CourseModel'] = {}
+
+
+@dataclass(frozen=True)
+class CourseModel:
+    """Per-hole arrays for one course (index 0 = hole 1)"""
+    course_id: int
+    name: str
+    par: np.ndarray         # (18,) int
+    yardage: np.ndarray     # (18,) int
+    handicap: np.ndarray    # (18,) int, 1 = hardest
+    difficulty: np.ndarray  # (18,) float, 0-100
+    factors: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def holes(self) -> int:
+        return len(self.par)
+
+    @property
+    def total_par(self) -> int:
+        return int(self.par.sum())
+
+    def event_holes(self, rounds: int = 4) -> Dict[str, np.ndarray]:
+        """Par and difficulty tiled over all rounds of an event (index 0 = event hole 1)"""
+        return {
+            'par': np.tile(self.par, rounds),
+            'difficulty': np.tile(self.difficulty, rounds)
+        }
+
+    @classmethod
+    def from_holes(cls, course_id: int, name: str, par: Sequence[int], difficulty: Sequence[float],
+                   yardage: Optional[Sequence[int]] = None, handicap: Optional[Sequence[int]] = None,
+                   factors: Optional[Dict[str, float]] = None) -> 'CourseModel':
+        """Build a model from plain per-hole sequences (synthetic or test courses)"""
+        par = np.ascontiguousarray(par, dtype=np.int64)
+        if yardage is None:
+            yardage = [PAR_LENGTH[int(p)] for p in par]
+        if handicap is None:
+            # Rank holes by difficulty: hardest hole gets index 1
+            handicap = np.argsort(np.argsort(-np.asarray(difficulty), kind='stable')) + 1
+        return cls(
+            course_id=course_id,
+            name=name,
+            par=par,
+            yardage=np.ascontiguousarray(yardage, dtype=np.int64),
+            handicap=np.ascontiguousarray(handicap, dtype=np.int64),
+            difficulty=np.ascontiguousarray(difficulty, dtype=np.float64),
+            factors=dict(factors or {})
+        )
+
+
+def hole_difficulty(par: np.ndarray, yardage: np.ndarray, handicap: np.ndarray,
+                    difficulty_modifier: np.ndarray, factors: Dict[str, float]) -> np.ndarray:
+    """
+    Difficulty rating (0-100) of each hole.
+
+    The stroke index sets the base (hardest hole 85, easiest 30), long holes for
+    their par play harder, and the course factors shift the whole course by up
+    to +/-5 before the stored per-hole modifier is applied.
+    """
+    base = 30 + 55 * (18 - handicap) / 17
+    par_length = np.array([PAR_LENGTH.get(int(p), 430) for p in par])
+    length_adjustment = 10 * (yardage / par_length - 1)
+    course_values = [factors[name] for name in DIFFICULTY_FACTOR_COLUMNS if factors.get(name) is not None]
+    course_adjustment = 10 * np.mean(course_values) - 5 if course_values else 0.0
+    return np.clip((base + length_adjustment + course_adjustment) * difficulty_modifier, 0, 100)
+
+
+def compile_course(conn: sqlite3.Connection, course_id: int) -> CourseModel:
+    """Read one course from an open golf_courses.db connection and compile it"""
+    cursor = conn.cursor()
+    cursor.execute('SELECT name FROM courses WHERE id = ?', (course_id,))
+    row = cursor.fetchone()
+    if not row:
+        raise ValueError(f"Course {course_id} not found")
+    name = row[0]
+
+    cursor.execute('''
+        SELECT par, yardage, handicap, COALESCE(difficulty_modifier, 1.0)
+        FROM holes
+        WHERE course_id = ?
+        ORDER BY hole_number
+    ''', (course_id,))
+    holes = np.array(cursor.fetchall(), dtype=np.float64)
+    if len(holes) == 0:
+        raise ValueError(f"Course {course_id} has no holes")
+
+    cursor.execute(f'''
+        SELECT {', '.join(COURSE_FACTOR_COLUMNS)}
+        FROM course_characteristics
+        WHERE course_id = ?
+    ''', (course_id,))
+    characteristics = cursor.fetchone()
+    factors = dict(zip(COURSE_FACTOR_COLUMNS, characteristics)) if characteristics else {}
+
+    par = holes[:, 0].astype(np.int64)
+    yardage = holes[:, 1].astype(np.int64)
+    handicap = holes[:, 2].astype(np.int64)
+    difficulty = hole_difficulty(par, yardage, handicap, holes[:, 3], factors)
+    return CourseModel(
+        course_id=course_id,
+        name=name,
+        par=np.ascontiguousarray(par),
+        yardage=np.ascontiguousarray(yardage),
+        handicap=np.ascontiguousarray(handicap),
+        difficulty=np.ascontiguousarray(difficulty),
+        factors=factors
+    )
+
+
+def load_course_model(course_id: int, db_path: Optional[str] = None) -> CourseModel:
+    """Compiled model for a course, loaded from SQLite once and cached by course_id"""
+    if db_path is None:
+        import sys
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+        from config import COURSE_DB_PATH as db_path
+    cache_key = (os.path.abspath(db_path), course_id)
+    if cache_key not in _COURSE_CACHE:
+        conn = sqlite3.connect(db_path)
+        try:
+            _COURSE_CACHE[cache_key] = compile_course(conn, course_id)
+        finally:
+            conn.close()
+    return _COURSE_CACHE[cache_key]
+
+
+def clear_course_cache():
+    """Drop all cached course models (e.g. after regenerating courses)"""
+    _COURSE_CACHE.clear()
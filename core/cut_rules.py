@@ -0,0 +1,50 @@
+"""
+Cut rules for tournament simulation.
+
+Applies a tournament's configured cut (cut_line_type / cut_line_value in the
+tournaments table, cut_line in config/event_types.json) to scores after the
+cut round. 'position' keeps the top N and ties, 'none' keeps everyone.
+Scores can carry leading batch dimensions; the cut is applied along the last
+axis, so Monte Carlo batches are cut in one call.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+CUT_TYPES = ('position', 'none')
+
+# Rounds played before the cut
+CUT_AFTER_ROUNDS = 2
+
+
+def cut_line_score(scores: np.ndarray, cut_type: str = 'position', cut_value: Optional[int] = 65) -> np.ndarray:
+    """
+    Highest score that makes the cut (lower scores are better).
+
+    Returns an array over the batch dimensions; +inf where everyone makes it.
+    """
+    scores = np.asarray(scores)
+    if cut_type not in CUT_TYPES:
+        raise ValueError(f"Unknown cut type '{cut_type}' (expected one of {CUT_TYPES})")
+    n_players = scores.shape[-1]
+    if cut_type == 'none' or cut_value is None or cut_value >= n_players:
+        return np.full(scores.shape[:-1], np.inf)
+    # The score at position cut_value; everyone tied with it survives too
+    return np.partition(scores, cut_value - 1, axis=-1)[..., cut_value - 1]
+
+
+def apply_cut(scores: np.ndarray, cut_type: str = 'position', cut_value: Optional[int] = 65) -> np.ndarray:
+    """
+    Made-cut flags for each player.
+
+    Args:
+        scores: (..., n_players) totals after the cut round
+        cut_type: 'position' (top cut_value and ties) or 'none'
+        cut_value: cut position for 'position' cuts
+
+    Returns:
+        Boolean array shaped like `scores`
+    """
+    scores = np.asarray(scores)
+    return scores <= cut_line_score(scores, cut_type, cut_value)[..., None]
@@ -0,0 +1,159 @@
+"""
+Vectorized field simulator for the regular-season performance model.
+
+Computes every hole performance for a whole field as one (n_players x n_holes)
+array, then derives event totals and ranks with array operations. The model is
+the one the prehistory regular-season simulator used to evaluate hole by hole
+(tests/test_field_simulator.py keeps that loop as a reference):
+
+    base        = total_skill + total_skill * U(-luck, +luck)          (per event)
+    performance = base * (1 + U(-rand, +rand) + U(-hole, +hole))
+                       * fatigue(hole) * pressure(composure)           (per hole)
+
+clamped to 0-100 per hole. All random inputs are taken as uniforms in [0, 1)
+so callers can supply their own streams (or reuse the same numbers across
+parameter sets) instead of relying on the global `random` module.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Player attribute order used for skill matrices throughout the simulators
+SKILL_COLUMNS = [
+    'driving_power', 'driving_accuracy', 'approach_accuracy', 'short_game', 'putting',
+    'composure', 'confidence', 'focus', 'risk_tolerance', 'mental_fatigue',
+    'consistency', 'resilience'
+]
+
+# Weights of the overall skill rating (same as PlayerSkills._calculate_total_skill)
+TOTAL_SKILL_WEIGHTS = np.array([
+    0.10, 0.12, 0.15, 0.08, 0.18,
+    0.08, 0.08, 0.08, 0.05, 0.03,
+    0.03, 0.02
+])
+
+COMPOSURE_INDEX = SKILL_COLUMNS.index('composure')
+
+
+@dataclass
+class FieldModelParams:
+    """Tunable constants of the regular-season performance model"""
+    event_luck_factor: float = 0.25       # per-event luck, +/- share of total skill
+    randomness_factor: float = 0.80       # per-hole randomness, +/- share of base
+    hole_randomness_factor: float = 0.20  # additional per-hole randomness
+    fatigue_decline: float = 0.05         # max decline over the event
+    composure_baseline: float = 65.0
+    composure_scale: float = 1000.0
+    holes: int = 72
+
+
+@dataclass
+class FieldResult:
+    """Outcome of one simulated event for a field (arrays in field order)"""
+    hole_performance: np.ndarray  # (n_players, n_holes)
+    totals: np.ndarray            # (n_players,)
+    ranks: np.ndarray             # (n_players,) 1 = best
+    order: np.ndarray             # field indices from best to worst
+
+
+def total_skill(skill_matrix: np.ndarray) -> np.ndarray:
+    """Overall skill rating for each row of an (n_players x 12) skill matrix"""
+    return np.asarray(skill_matrix, dtype=np.float64) @ TOTAL_SKILL_WEIGHTS
+
+
+def rank_totals(totals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rank performance totals (higher is better) along the last axis.
+
+    Ties keep field order, matching a stable `sort(reverse=True)`.
+
+    Returns:
+        (order, ranks) where order lists field indices best to worst and
+        ranks gives each player's 1-based rank.
+    """
+    order = np.argsort(-totals, axis=-1, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, totals.shape[-1] + 1), axis=-1)
+    return order, ranks
+
+
+class FieldSimulator:
+    """Simulates whole fields with array operations instead of per-hole calls"""
+
+    def __init__(self, params: Optional[FieldModelParams] = None):
+        self.params = params or FieldModelParams()
+        holes = np.arange(1, self.params.holes + 1)
+        self.fatigue = 1.0 - (holes / self.params.holes) * self.params.fatigue_decline
+
+    def draw_uniforms(self, rng: np.random.Generator, n_players: int,
+                      batch: Tuple[int, ...] = ()) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Draw the luck, randomness and hole-randomness uniforms for a field"""
+        holes = self.params.holes
+        luck = rng.random(batch + (n_players,))
+        randomness = rng.random(batch + (n_players, holes))
+        hole_randomness = rng.random(batch + (n_players, holes))
+        return luck, randomness, hole_randomness
+
+    def stream_uniforms(self, streams, key: Tuple[int, ...],
+                        player_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Draw a field's uniforms from counter-based streams.
+
+        Each (key, player, hole) has its own draws, so a player's numbers do not
+        depend on who else is in the field or how the field is split up.
+        """
+        player_ids = np.asarray(player_ids)
+        holes = np.arange(1, self.params.holes + 1)
+        luck = streams.uniforms(key, player_ids, 0, slot=0)
+        randomness = streams.uniforms(key, player_ids[:, None], holes, slot=1)
+        hole_randomness = streams.uniforms(key, player_ids[:, None], holes, slot=2)
+        return luck, randomness, hole_randomness
+
+    def hole_performance(self, total_skill: np.ndarray, composure: np.ndarray,
+                         luck_u: np.ndarray, randomness_u: np.ndarray,
+                         hole_u: np.ndarray) -> np.ndarray:
+        """
+        Hole performances from uniforms in [0, 1).
+
+        Args:
+            total_skill: (n_players,) overall skill ratings
+            composure: (n_players,) composure ratings
+            luck_u: (..., n_players) per-event luck uniforms
+            randomness_u: (..., n_players, n_holes) per-hole randomness uniforms
+            hole_u: (..., n_players, n_holes) additional per-hole uniforms
+
+        Returns:
+            (..., n_players, n_holes) performances clamped to 0-100
+        """
+        p = self.params
+        luck = (2.0 * luck_u - 1.0) * p.event_luck_factor
+        base = total_skill + total_skill * luck
+        pressure = 1.0 + (composure - p.composure_baseline) / p.composure_scale
+
+        swing = 1.0 + (2.0 * randomness_u - 1.0) * p.randomness_factor \
+            + (2.0 * hole_u - 1.0) * p.hole_randomness_factor
+        performance = (base[..., None] * swing) * self.fatigue * pressure[:, None]
+        return np.clip(performance, 0, 100)
+
+    def simulate(self, total_skill: np.ndarray, composure: np.ndarray,
+                 rng: Optional[np.random.Generator] = None,
+                 uniforms: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> FieldResult:
+        """
+        Simulate one event for the whole field.
+
+        Either `rng` or pre-drawn `uniforms` (luck, randomness, hole randomness,
+        see `draw_uniforms` / `stream_uniforms`) must be given.
+        """
+        total_skill = np.asarray(total_skill, dtype=np.float64)
+        composure = np.asarray(composure, dtype=np.float64)
+        if uniforms is None:
+            if rng is None:
+                raise ValueError("simulate() needs either an rng or pre-drawn uniforms")
+            uniforms = self.draw_uniforms(rng, len(total_skill))
+
+        hole_performance = self.hole_performance(total_skill, composure, *uniforms)
+        totals = hole_performance.sum(axis=-1)
+        order, ranks = rank_totals(totals)
+        return FieldResult(hole_performance, totals, ranks, order)
@@ -0,0 +1,177 @@
+"""
+Streaming leaderboards.
+
+LeaderboardTracker keeps the field's ordering between updates: each update
+re-sorts the previous order with a stable sort on small integer keys
+(radix sort in NumPy), which is linear in the field size and keeps tied
+players in their previous order. stream_leaderboard wraps
+TournamentSimulator.play and yields a LeaderboardSnapshot after every hole or
+round - positions with ties, score to par, holes played and movement since
+the previous snapshot - so the web layer, reports and the odds engine can
+consume an event while it is being simulated.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .field_simulator import FieldResult
+from .mental_state import MentalState
+from .tournament_simulator import TournamentSimulator
+
+# Added to the key of players who missed the cut so they sort below the weekend field
+CUT_KEY_OFFSET = 10000
+
+
+@dataclass
+class LeaderboardSnapshot:
+    """Standings at one point of an event (arrays in field order unless noted)"""
+    event_hole: int
+    round_number: int
+    order: np.ndarray         # field indices from first to last
+    positions: np.ndarray     # 1 = leader; tied players share a position
+    to_par: np.ndarray        # score relative to par (or the score being ranked)
+    holes_played: np.ndarray
+    movement: np.ndarray      # positions gained since the previous snapshot
+    made_cut: np.ndarray
+    tied: np.ndarray          # position shared with another player
+
+    def leaders(self) -> np.ndarray:
+        """Field indices of everyone in first place"""
+        return np.flatnonzero(self.positions == 1)
+
+    def movers(self, count: int = 5) -> Dict[str, np.ndarray]:
+        """Field indices of the biggest climbers and fallers since the previous snapshot"""
+        by_movement = np.argsort(-self.movement, kind='stable')
+        climbers = by_movement[:count]
+        fallers = by_movement[::-1][:count]
+        return {'up': climbers[self.movement[climbers] > 0], 'down': fallers[self.movement[fallers] < 0]}
+
+    def rows(self, player_ids, names: Optional[Dict[int, str]] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Leaderboard rows in order, for display"""
+        rows = []
+        for i in self.order[:limit]:
+            player_id = int(player_ids[i])
+            position = int(self.positions[i])
+            rows.append({
+                'position': position,
+                'position_display': f"T{position}" if self.tied[i] else str(position),
+                'player_id': player_id,
+                'name': names.get(player_id) if names else None,
+                'to_par': int(self.to_par[i]),
+                'holes_played': int(self.holes_played[i]),
+                'movement': int(self.movement[i]),
+                'made_cut': bool(self.made_cut[i])
+            })
+        return rows
+
+
+class LeaderboardTracker:
+    """Maintains a field's leaderboard order incrementally across updates"""
+
+    def __init__(self, n_players: int):
+        self.order = np.arange(n_players)
+        self.positions = None
+
+    def update(self, scores: np.ndarray, made_cut: Optional[np.ndarray] = None, holes_played=None,
+               event_hole: int = 0, holes_per_round: int = 18) -> LeaderboardSnapshot:
+        """
+        Re-rank the field on new scores (lower is better) and take a snapshot.
+
+        Args:
+            scores: integer score per player, e.g. strokes relative to par
+            made_cut: players still in the event (default: everyone)
+            holes_played: holes played per player (for display)
+            event_hole: event hole the snapshot is taken after
+            holes_per_round: holes per round of the course
+        """
+        n_players = len(self.order)
+        scores = np.asarray(scores)
+        if made_cut is None:
+            made_cut = np.ones(n_players, dtype=bool)
+        keys = np.where(made_cut, scores, scores + CUT_KEY_OFFSET)
+
+        # Scores move a few strokes per hole, so the previous order is nearly sorted;
+        # a stable sort of the keys in that order keeps ties where they were
+        ranked_keys = keys[self.order].astype(np.int16)
+        step = np.argsort(ranked_keys, kind='stable')
+        self.order = self.order[step]
+        ranked_keys = ranked_keys[step]
+
+        new_score = np.concatenate([[True], ranked_keys[1:] != ranked_keys[:-1]])
+        ranked_positions = np.maximum.accumulate(np.where(new_score, np.arange(1, n_players + 1), 0))
+        ties_next = np.concatenate([~new_score[1:], [False]])
+        positions = np.empty(n_players, dtype=np.int64)
+        positions[self.order] = ranked_positions
+        tied = np.empty(n_players, dtype=bool)
+        tied[self.order] = ~new_score | ties_next
+
+        movement = np.zeros(n_players, dtype=np.int64) if self.positions is None else self.positions - positions
+        self.positions = positions
+        if holes_played is None:
+            holes_played = np.full(n_players, event_hole)
+        return LeaderboardSnapshot(
+            event_hole=event_hole,
+            round_number=max(event_hole - 1, 0) // holes_per_round + 1,
+            order=self.order,
+            positions=positions,
+            to_par=scores.copy(),
+            holes_played=np.asarray(holes_played).copy(),
+            movement=movement,
+            made_cut=made_cut.copy(),
+            tied=tied
+        )
+
+
+def stream_leaderboard(simulator: TournamentSimulator, player_ids, ratings, waves=0,
+                       mental: Optional[MentalState] = None, every: str = 'hole') -> Iterator[LeaderboardSnapshot]:
+    """
+    Simulate a tournament and yield leaderboard snapshots as it is played.
+
+    Args:
+        simulator: TournamentSimulator for the event
+        player_ids, ratings, waves, mental: as for TournamentSimulator.simulate
+        every: 'hole' for a snapshot after every event hole, 'round' after every round
+
+    Yields:
+        LeaderboardSnapshot; the last one is the final leaderboard
+    """
+    if every not in ('hole', 'round'):
+        raise ValueError("every must be 'hole' or 'round'")
+    player_ids = np.asarray(player_ids)
+    holes = simulator.course.holes
+    tracker = LeaderboardTracker(len(player_ids))
+    to_par = np.zeros(len(player_ids), dtype=np.int32)
+    holes_played = np.zeros(len(player_ids), dtype=np.int16)
+
+    for event_hole, strokes, made_cut in simulator.play(player_ids, ratings, waves, mental):
+        # Running totals: one column per hole, only players who played it
+        hole_strokes = strokes[:, event_hole - 1]
+        played = hole_strokes > 0
+        to_par += np.where(played, hole_strokes - simulator.par[event_hole - 1], 0)
+        holes_played += played
+        if every == 'hole' or event_hole % holes == 0:
+            yield tracker.update(to_par, made_cut, holes_played, event_hole, holes)
+
+
+def stream_field_result(result: FieldResult, holes_per_round: int = 18,
+                        every: str = 'round') -> Iterator[LeaderboardSnapshot]:
+    """
+    Replay a FieldSimulator event as leaderboard snapshots.
+
+    The regular-season model scores performance (higher is better), so the
+    ranked score is the negated running performance total, rounded to whole
+    points; the final snapshot's order matches the event ranking up to ties
+    within a point.
+    """
+    if every not in ('hole', 'round'):
+        raise ValueError("every must be 'hole' or 'round'")
+    n_players, n_holes = result.hole_performance.shape
+    tracker = LeaderboardTracker(n_players)
+    running = np.zeros(n_players)
+    for hole in range(1, n_holes + 1):
+        running += result.hole_performance[:, hole - 1]
+        if every == 'hole' or hole % holes_per_round == 0:
+            yield tracker.update(-np.rint(running).astype(np.int64), event_hole=hole,
+                                 holes_per_round=holes_per_round)
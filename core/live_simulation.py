@@ -0,0 +1,335 @@
+"""
+Resumable live tournament simulation.
+
+Advances a tournament one hole (or one tee-time wave) at a time with the
+TournamentSimulator and persists a compact state row to SQLite after every
+step: per-player holes played, cumulative strokes and round scores as packed
+arrays. Randomness is counter-based (keyed by tournament, player and event
+hole), so a player's holes played is also their stream position - a restart
+loads the row and carries on without replaying any holes. Each step touches
+every player once, so its cost is O(field size) however far the event is.
+Once the whole field has finished round 2 the configured cut is applied and
+only the survivors play on. Weather and the field's mental state, when used,
+are saved in the same row.
+"""
+
+import sqlite3
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .course_model import CourseModel, load_course_model
+from .cut_rules import CUT_AFTER_ROUNDS, apply_cut
+from .rng_streams import SimulationStreams
+from .mental_state import MentalState
+from .tournament_simulator import TournamentSimulator
+from .weather import TournamentWeather
+
+LIVE_STATE_TABLE = 'live_tournament_state'
+
+LIVE_STATE_SCHEMA = f'''
+    CREATE TABLE IF NOT EXISTS {LIVE_STATE_TABLE} (
+        tournament_id INTEGER PRIMARY KEY,
+        course_id INTEGER NOT NULL,
+        seed TEXT NOT NULL,
+        rounds INTEGER NOT NULL,
+        field_size INTEGER NOT NULL,
+        player_ids BLOB NOT NULL,
+        ratings BLOB NOT NULL,
+        rating_columns INTEGER NOT NULL,
+        waves BLOB NOT NULL,
+        holes_played BLOB NOT NULL,
+        strokes BLOB NOT NULL,
+        round_scores BLOB NOT NULL,
+        cut_type TEXT DEFAULT 'none',
+        cut_value INTEGER,
+        made_cut BLOB NOT NULL,
+        weather BLOB,
+        weather_waves INTEGER,
+        mental BLOB,
+        status TEXT DEFAULT 'in_progress',
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def tee_waves(group_numbers: Sequence[int], n_waves: int = 2) -> np.ndarray:
+    """
+    Tee-time wave of each player from their group number.
+
+    Groups go out in order, so the first half of the groups is the morning
+    wave (0) and the second half the afternoon wave (1).
+    """
+    groups = np.asarray(group_numbers, dtype=np.int64)
+    unique_groups = np.unique(groups)
+    group_wave = np.arange(len(unique_groups)) * n_waves // max(len(unique_groups), 1)
+    return group_wave[np.searchsorted(unique_groups, groups)].astype(np.int8)
+
+
+class LiveTournament:
+    """A tournament in progress, advanced step by step and saved after each step"""
+
+    def __init__(self, conn: sqlite3.Connection, tournament_id: int, course: CourseModel,
+                 streams: SimulationStreams, player_ids: np.ndarray, ratings: np.ndarray,
+                 waves: np.ndarray, holes_played: np.ndarray, strokes: np.ndarray,
+                 round_scores: np.ndarray, rounds: int = 4, cut_type: str = 'none',
+                 cut_value: Optional[int] = None, made_cut: Optional[np.ndarray] = None,
+                 status: str = 'in_progress', weather: Optional[TournamentWeather] = None,
+                 mental: Optional[MentalState] = None):
+        self.conn = conn
+        self.tournament_id = tournament_id
+        self.course = course
+        self.streams = streams
+        self.player_ids = player_ids
+        self.ratings = ratings
+        self.waves = waves
+        self.holes_played = holes_played
+        self.strokes = strokes
+        self.round_scores = round_scores
+        self.rounds = rounds
+        self.cut_type = cut_type
+        self.cut_value = cut_value
+        self.made_cut = np.ones(len(player_ids), dtype=bool) if made_cut is None else made_cut
+        self.status = status
+        self.weather = weather
+        self.mental = mental
+        self.simulator = TournamentSimulator(course, streams, (tournament_id,), rounds=rounds,
+                                             cut_type=cut_type, cut_value=cut_value, weather=weather)
+        # Par through each event hole, so score to par is one lookup per player
+        self.par_through = np.concatenate([[0], np.cumsum(self.simulator.par)])
+
+    @staticmethod
+    def create_table(conn: sqlite3.Connection):
+        conn.execute(LIVE_STATE_SCHEMA)
+        conn.commit()
+
+    @classmethod
+    def start(cls, conn: sqlite3.Connection, tournament_id: int, course: CourseModel,
+              player_ids: Sequence[int], ratings: np.ndarray, waves: Optional[Sequence[int]] = None,
+              seed: Optional[int] = None, rounds: int = 4, cut_type: str = 'none',
+              cut_value: Optional[int] = None, weather: Optional[TournamentWeather] = None,
+              mental: Optional[MentalState] = None) -> 'LiveTournament':
+        """
+        Start a new live tournament (replacing any saved state for it).
+
+        Args:
+            conn: connection to the database holding the live state table
+            tournament_id: tournament being played
+            course: compiled course model
+            player_ids: field player ids
+            ratings: (n_players,) overall or (n_players x 3) par-type ratings
+            waves: tee-time wave per player (default: everyone in wave 0)
+            seed: base seed for the tournament's random streams
+            rounds: number of rounds
+            cut_type: 'position' or 'none' (tournaments.cut_line_type)
+            cut_value: cut position (tournaments.cut_line_value)
+            weather: round weather, saved with the state
+            mental: the field's starting MentalState, updated every hole and saved with the state
+
+        Returns:
+            LiveTournament before the first hole
+        """
+        cls.create_table(conn)
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        n_players = len(player_ids)
+        if waves is None:
+            waves = np.zeros(n_players, dtype=np.int8)
+        tournament = cls(
+            conn, tournament_id, course, SimulationStreams(seed), player_ids,
+            np.asarray(ratings, dtype=np.float64), np.asarray(waves, dtype=np.int8),
+            holes_played=np.zeros(n_players, dtype=np.int16),
+            strokes=np.zeros(n_players, dtype=np.int32),
+            round_scores=np.zeros((n_players, rounds), dtype=np.int16),
+            rounds=rounds,
+            cut_type=cut_type,
+            cut_value=cut_value,
+            weather=weather,
+            mental=mental
+        )
+        tournament.save()
+        return tournament
+
+    @classmethod
+    def resume(cls, conn: sqlite3.Connection, tournament_id: int, course: Optional[CourseModel] = None,
+               course_db_path: Optional[str] = None) -> Optional['LiveTournament']:
+        """Load a saved live tournament; returns None if it was never started"""
+        cls.create_table(conn)
+        row = conn.execute(f'''
+            SELECT course_id, seed, rounds, field_size, player_ids, ratings, rating_columns,
+                   waves, holes_played, strokes, round_scores, cut_type, cut_value, made_cut,
+                   weather, weather_waves, mental, status
+            FROM {LIVE_STATE_TABLE}
+            WHERE tournament_id = ?
+        ''', (tournament_id,)).fetchone()
+        if not row:
+            return None
+
+        (course_id, seed, rounds, field_size, player_ids, ratings, rating_columns,
+         waves, holes_played, strokes, round_scores, cut_type, cut_value, made_cut,
+         weather, weather_waves, mental, status) = row
+        if course is None:
+            course = load_course_model(course_id, course_db_path)
+        ratings = np.frombuffer(ratings, dtype=np.float64)
+        if rating_columns > 1:
+            ratings = ratings.reshape(field_size, rating_columns)
+        if weather is not None:
+            weather = TournamentWeather(*np.frombuffer(weather, dtype=np.float64).reshape(5, rounds, weather_waves))
+        if mental is not None:
+            mental = MentalState.from_arrays(np.frombuffer(mental, dtype=np.float32).reshape(-1, field_size))
+        return cls(
+            conn, tournament_id, course, SimulationStreams(int(seed)),
+            np.frombuffer(player_ids, dtype=np.int64),
+            ratings,
+            np.frombuffer(waves, dtype=np.int8),
+            holes_played=np.frombuffer(holes_played, dtype=np.int16).copy(),
+            strokes=np.frombuffer(strokes, dtype=np.int32).copy(),
+            round_scores=np.frombuffer(round_scores, dtype=np.int16).reshape(field_size, rounds).copy(),
+            rounds=rounds,
+            cut_type=cut_type,
+            cut_value=cut_value,
+            made_cut=np.frombuffer(made_cut, dtype=bool).copy(),
+            status=status,
+            weather=weather,
+            mental=mental
+        )
+
+    def save(self):
+        """Write the compact state row (one statement, one commit)"""
+        weather = None
+        if self.weather is not None:
+            weather = np.stack([self.weather.temp, self.weather.wind, self.weather.rain,
+                                self.weather.humidity, self.weather.cloud_cover]).astype(np.float64)
+        self.conn.execute(f'''
+            INSERT OR REPLACE INTO {LIVE_STATE_TABLE}
+            (tournament_id, course_id, seed, rounds, field_size, player_ids, ratings, rating_columns,
+             waves, holes_played, strokes, round_scores, cut_type, cut_value, made_cut,
+             weather, weather_waves, mental, status, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (
+            self.tournament_id, self.course.course_id, str(self.streams.seed), self.rounds,
+            len(self.player_ids), self.player_ids.tobytes(), self.ratings.tobytes(),
+            1 if self.ratings.ndim == 1 else self.ratings.shape[1],
+            self.waves.tobytes(), self.holes_played.tobytes(), self.strokes.tobytes(),
+            self.round_scores.tobytes(), self.cut_type, self.cut_value, self.made_cut.tobytes(),
+            None if weather is None else weather.tobytes(),
+            None if self.weather is None else self.weather.waves,
+            None if self.mental is None else self.mental.to_arrays().tobytes(),
+            self.status
+        ))
+        self.conn.commit()
+
+    @property
+    def total_holes(self) -> int:
+        return self.simulator.total_holes
+
+    @property
+    def current_round(self) -> int:
+        """Round the slowest player still in the event is in (players who finish it wait for the rest)"""
+        return min(int(self.holes_played[self.made_cut].min()) // self.course.holes + 1, self.rounds)
+
+    @property
+    def is_complete(self) -> bool:
+        return bool(np.all(self.holes_played[self.made_cut] >= self.total_holes))
+
+    def _playing(self, wave: Optional[int], round_number: Optional[int] = None) -> np.ndarray:
+        """Mask of players due to play a hole in the current (or given) round"""
+        round_end = (round_number or self.current_round) * self.course.holes
+        playing = (self.holes_played < round_end) & self.made_cut
+        if wave is not None:
+            playing &= self.waves == wave
+        return playing
+
+    def _play_next_hole(self, playing: np.ndarray) -> int:
+        """Play one hole for every player in the mask; returns players advanced"""
+        indices = np.flatnonzero(playing)
+        # Players in different waves can be on different holes: one array pass per distinct hole
+        next_holes = self.holes_played[indices] + 1
+        for event_hole in np.unique(next_holes):
+            event_hole = int(event_hole)
+            on_hole = indices[next_holes == event_hole]
+            ratings = self.ratings[on_hole]
+            if self.mental is not None:
+                if (event_hole - 1) % self.course.holes == 0:
+                    self.mental.start_round(on_hole)
+                ratings = self.simulator.mental_ratings(ratings, self.mental, event_hole, on_hole)
+            hole_strokes = self.simulator.simulate_hole(self.player_ids[on_hole], ratings, event_hole,
+                                                        self.waves[on_hole])
+            if self.mental is not None:
+                self.mental.update(hole_strokes - self.simulator.par[event_hole - 1], on_hole)
+            round_index = (event_hole - 1) // self.course.holes
+            self.strokes[on_hole] += hole_strokes
+            self.round_scores[on_hole, round_index] += hole_strokes
+        self.holes_played[indices] += 1
+        return len(indices)
+
+    def _finish_step(self):
+        """Apply the cut once the field has finished the cut round, then save"""
+        cut_holes = CUT_AFTER_ROUNDS * self.course.holes
+        if self.rounds > CUT_AFTER_ROUNDS and np.all(self.holes_played >= cut_holes):
+            # Scores after the cut round never change, so re-applying it is a no-op
+            self.made_cut = apply_cut(self.round_scores[:, :CUT_AFTER_ROUNDS].sum(axis=1),
+                                      self.cut_type, self.cut_value)
+        if self.is_complete:
+            self.status = 'complete'
+        self.save()
+
+    def step(self, wave: Optional[int] = None) -> int:
+        """
+        Advance one hole and save.
+
+        Args:
+            wave: only advance players in this tee-time wave (default: whole field)
+
+        Returns:
+            Number of players who played a hole (0 once the round or event is done for them)
+        """
+        advanced = self._play_next_hole(self._playing(wave))
+        self._finish_step()
+        return advanced
+
+    def play_wave(self, wave: Optional[int] = None) -> int:
+        """Play the rest of the current round for one wave (or the field), then save once; returns holes played"""
+        holes = 0
+        round_number = self.current_round
+        playing = self._playing(wave, round_number)
+        while playing.any():
+            self._play_next_hole(playing)
+            holes += 1
+            playing = self._playing(wave, round_number)
+        self._finish_step()
+        return holes
+
+    def score_to_par(self) -> np.ndarray:
+        """Each player's score relative to par through the holes they have played"""
+        return self.strokes - self.par_through[self.holes_played]
+
+    def leaderboard(self, names: Optional[Dict[int, str]] = None) -> List[Dict]:
+        """Current standings: players still in the event first, then lowest to par, then most holes played"""
+        to_par = self.score_to_par()
+        order = np.lexsort((-self.holes_played, to_par, ~self.made_cut))
+        ranked_scores = to_par[order]
+        ranked_cut = self.made_cut[order]
+        # Tied players share the position of the first player on that score
+        first_at_score = np.concatenate([[True], (ranked_scores[1:] != ranked_scores[:-1]) |
+                                         (ranked_cut[1:] != ranked_cut[:-1])])
+        positions = np.maximum.accumulate(np.where(first_at_score, np.arange(1, len(order) + 1), 0))
+
+        rows = []
+        for position, i in zip(positions, order):
+            player_id = int(self.player_ids[i])
+            played = int(self.holes_played[i])
+            round_index = min(max(played - 1, 0) // self.course.holes, self.rounds - 1)
+            rows.append({
+                'position': int(position),
+                'player_id': player_id,
+                'name': names.get(player_id) if names else None,
+                'to_par': int(to_par[i]),
+                'total_strokes': int(self.strokes[i]),
+                'thru': played - round_index * self.course.holes,
+                'round': round_index + 1,
+                'today': int(self.round_scores[i, round_index]) - int(
+                    self.par_through[played] - self.par_through[round_index * self.course.holes]),
+                'holes_played': played,
+                'made_cut': bool(self.made_cut[i])
+            })
+        return rows
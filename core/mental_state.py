@@ -0,0 +1,126 @@
+"""
+Vectorized mental game for hole-by-hole simulation.
+
+Implements the mental mechanics from docs/TOURNAMENT_SIMULATION_NOTES.md as
+per-player float32 arrays that are updated after every hole:
+
+- confidence: starts from the confidence attribute, rises after birdies and
+  falls after bogeys (falls less for resilient players), and drifts back
+  towards the starting level
+- fatigue: builds every hole (slower for high mental_fatigue endurance),
+  partly recovers between rounds
+- pressure: the same for the whole field on a given hole - higher on the
+  closing holes of a round and in the final round, scaled by the event's
+  prestige - and felt less by players with high composure
+
+Each is combined into one rating multiplier per player per hole. A player's
+state only depends on their own holes, so live simulation (waves on
+different holes) matches a batch run exactly.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .field_simulator import SKILL_COLUMNS
+
+MENTAL_ATTRIBUTES = ['composure', 'confidence', 'focus', 'mental_fatigue', 'resilience']
+
+# Per-player arrays of a MentalState (attributes scaled to 0-1, then the dynamic state)
+STATE_ARRAYS = ['composure', 'focus', 'endurance', 'resilience', 'baseline', 'confidence', 'fatigue']
+
+
+@dataclass
+class MentalParams:
+    """Tunable constants of the mental game"""
+    confidence_gain: float = 0.20        # confidence change per stroke under/over par
+    confidence_reversion: float = 0.10   # share of the gap to the starting level closed each hole
+    resilience_damping: float = 0.50     # max share of a bad hole's confidence loss resilience absorbs
+    confidence_effect: float = 0.04      # rating change at confidence +/-1
+    fatigue_per_hole: float = 1 / 72     # fatigue gained per hole by an average player
+    fatigue_recovery: float = 0.50       # share of fatigue kept overnight
+    fatigue_effect: float = 0.05         # rating loss at full fatigue with no focus
+    closing_holes: int = 3               # last holes of each round played under extra pressure
+    closing_pressure: float = 0.5
+    final_round_pressure: float = 0.5
+    pressure_effect: float = 0.06        # rating loss at pressure 1 with no composure
+    event_pressure: float = 1.0          # prestige scaling (majors > 1)
+
+
+class MentalState:
+    """Per-player mental state arrays for one field"""
+
+    def __init__(self, composure: np.ndarray, confidence_skill: np.ndarray, focus: np.ndarray,
+                 endurance: np.ndarray, resilience: np.ndarray, params: Optional[MentalParams] = None,
+                 confidence: Optional[np.ndarray] = None, fatigue: Optional[np.ndarray] = None):
+        self.params = params or MentalParams()
+        self.composure = np.asarray(composure, dtype=np.float32) / 100
+        self.focus = np.asarray(focus, dtype=np.float32) / 100
+        self.endurance = np.asarray(endurance, dtype=np.float32) / 100
+        self.resilience = np.asarray(resilience, dtype=np.float32) / 100
+        # Starting confidence in [-0.25, 0.25] from the confidence attribute
+        self.baseline = (np.asarray(confidence_skill, dtype=np.float32) - 50) / 200
+        self.confidence = self.baseline.copy() if confidence is None else np.asarray(confidence, dtype=np.float32)
+        self.fatigue = np.zeros_like(self.baseline) if fatigue is None else np.asarray(fatigue, dtype=np.float32)
+
+    @classmethod
+    def from_skills(cls, skill_matrix: np.ndarray, params: Optional[MentalParams] = None) -> 'MentalState':
+        """Fresh state from an (n_players x 12) skill matrix in SKILL_COLUMNS order"""
+        skills = np.asarray(skill_matrix, dtype=np.float32)
+        columns = [skills[:, SKILL_COLUMNS.index(name)] for name in MENTAL_ATTRIBUTES]
+        return cls(*columns, params=params)
+
+    def __len__(self):
+        return len(self.confidence)
+
+    def subset(self, index: np.ndarray) -> 'MentalState':
+        """State for some players only (e.g. the players who made the cut)"""
+        return MentalState.from_arrays(self.to_arrays()[:, index], self.params)
+
+    def to_arrays(self) -> np.ndarray:
+        """All per-player arrays stacked as (7 x n_players) float32"""
+        return np.stack([getattr(self, name) for name in STATE_ARRAYS]).astype(np.float32)
+
+    @classmethod
+    def from_arrays(cls, arrays: np.ndarray, params: Optional[MentalParams] = None) -> 'MentalState':
+        """Rebuild a state from to_arrays() output (e.g. unpacked from SQLite)"""
+        state = cls.__new__(cls)
+        state.params = params or MentalParams()
+        for name, values in zip(STATE_ARRAYS, np.array(arrays, dtype=np.float32)):
+            setattr(state, name, values)
+        return state
+
+    def hole_pressure(self, hole_in_round: int, round_number: int, rounds: int, holes_per_round: int = 18) -> float:
+        """Field-wide pressure (0 = none) on a hole (1-based within the round)"""
+        p = self.params
+        pressure = 0.0
+        if hole_in_round > holes_per_round - p.closing_holes:
+            pressure += p.closing_pressure
+        if round_number == rounds:
+            pressure += p.final_round_pressure
+        return pressure * p.event_pressure
+
+    def rating_multiplier(self, pressure: float, index=slice(None)) -> np.ndarray:
+        """Multiplier on each player's rating for the next hole"""
+        p = self.params
+        return (1
+                + p.confidence_effect * self.confidence[index]
+                - p.fatigue_effect * self.fatigue[index] * (1 - self.focus[index] / 2)
+                - p.pressure_effect * pressure * (1 - self.composure[index]))
+
+    def update(self, strokes_to_par: np.ndarray, index=slice(None)):
+        """Update confidence and fatigue after a hole (strokes relative to par per player)"""
+        p = self.params
+        swing = -np.asarray(strokes_to_par, dtype=np.float32) * p.confidence_gain
+        # Resilient players shrug off part of a bad hole
+        swing = np.where(swing < 0, swing * (1 - p.resilience_damping * self.resilience[index]), swing)
+        confidence = self.confidence[index]
+        confidence += swing + p.confidence_reversion * (self.baseline[index] - confidence)
+        self.confidence[index] = np.clip(confidence, -1, 1)
+        fatigue = self.fatigue[index] + p.fatigue_per_hole * (1.5 - self.endurance[index])
+        self.fatigue[index] = np.minimum(fatigue, 1)
+
+    def start_round(self, index=slice(None)):
+        """Overnight recovery before a new round"""
+        self.fatigue[index] *= self.params.fatigue_recovery
@@ -0,0 +1,185 @@
+"""
+Versioned schema migrations.
+
+Our SQLite databases were created by scripts that never declared secondary
+indexes, so every lookup of an event's results, a player's history or a
+season's standings scanned the whole table. Migrations are numbered and
+applied in order, each in its own transaction, and recorded in a
+schema_migrations table; migrate() applies the pending ones.
+
+The databases do not share one schema (prehistory.db, the live tournament
+and player databases), so an index is only created where its table and
+columns exist. migrate() also re-creates the indexes of applied migrations
+whose tables appeared later, which is a no-op when they are all there.
+Migrating is an explicit step: scripts that only use a database check
+schema_version() against SCHEMA_VERSION and never change its schema.
+
+HOT_QUERIES are the lookups the simulators and utilities run most;
+full_table_scans() runs EXPLAIN QUERY PLAN on them and reports every one
+that still scans a whole table. scripts/utilities/migrate_databases.py
+applies the migrations to every database and runs the check.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Sequence, Tuple
+
+MIGRATIONS_TABLE = 'schema_migrations'
+
+
+@dataclass(frozen=True)
+class Index:
+    """A secondary index on a table's columns"""
+    table: str
+    columns: Tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        return f"idx_{self.table}_{'_'.join(self.columns)}"
+
+    @property
+    def create_sql(self) -> str:
+        return f"CREATE INDEX IF NOT EXISTS {self.name} ON {self.table} ({', '.join(self.columns)})"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema version: the indexes it adds"""
+    version: int
+    description: str
+    indexes: Tuple[Index, ...]
+
+
+MIGRATIONS = (
+    Migration(1, 'Indexes for result, standings and event lookups', (
+        Index('tournament_results', ('tournament_id',)),
+        Index('tournament_results', ('player_id',)),
+        Index('season_event_results', ('tournament_id',)),
+        Index('season_event_results', ('player_id',)),
+        Index('season_event_results', ('season_id', 'player_id')),
+        Index('season_player_stats', ('season_id', 'player_id')),
+        Index('season_player_stats', ('player_id',)),
+        Index('tournaments', ('season_number', 'event_number')),
+        Index('tournament_fields', ('tournament_id',)),
+    )),
+)
+
+# Version a fully migrated database is at
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """A frequent lookup that must be served by an index"""
+    name: str
+    sql: str
+
+
+HOT_QUERIES = (
+    HotQuery('event results', "SELECT * FROM tournament_results WHERE tournament_id = ?"),
+    HotQuery('player history', "SELECT * FROM tournament_results WHERE player_id = ?"),
+    HotQuery('season event', "SELECT id FROM tournaments WHERE season_number = ? AND event_number = ?"),
+    HotQuery('season tournaments', "SELECT COUNT(*) FROM tournaments WHERE season_number = ?"),
+    HotQuery('saved event read-back', """
+        SELECT tr.player_id, p.name, tr.position
+        FROM tournaments t
+        JOIN tournament_results tr ON tr.tournament_id = t.id
+        JOIN players p ON p.id = tr.player_id
+        WHERE t.season_number = ? AND t.event_number = ?
+    """),
+    HotQuery('season standings', """
+        SELECT p.id, p.name, sps.total_season_points
+        FROM players p
+        JOIN season_player_stats sps ON p.id = sps.player_id
+        WHERE sps.season_id = ? AND p.current_status = 'active'
+        ORDER BY sps.total_season_points DESC
+    """),
+    HotQuery('player season stats', "SELECT * FROM season_player_stats WHERE player_id = ? AND season_id = ?"),
+    HotQuery('player seasons', "SELECT * FROM season_player_stats WHERE player_id = ?"),
+    HotQuery('player event results', "SELECT * FROM season_event_results WHERE season_id = ? AND player_id = ?"),
+    HotQuery('event season results', "SELECT * FROM season_event_results WHERE tournament_id = ?"),
+    HotQuery('tournament field', "SELECT player_id FROM tournament_fields WHERE tournament_id = ?"),
+)
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Highest migration applied (0 for a database never migrated); read-only"""
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                        (MIGRATIONS_TABLE,)).fetchone():
+        return 0
+    return conn.execute(f"SELECT COALESCE(MAX(version), 0) FROM {MIGRATIONS_TABLE}").fetchone()[0]
+
+
+def create_indexes(conn: sqlite3.Connection, indexes: Sequence[Index]) -> List[str]:
+    """Create the indexes whose table and columns exist; returns the names of those created"""
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    created = []
+    for index in indexes:
+        if index.name in existing or not set(index.columns) <= set(_columns(conn, index.table)):
+            continue
+        conn.execute(index.create_sql)
+        created.append(index.name)
+    return created
+
+
+def migrate(conn: sqlite3.Connection, migrations: Sequence[Migration] = MIGRATIONS) -> List[str]:
+    """
+    Bring a database up to the latest schema version.
+
+    Each pending migration runs and is recorded in one transaction, so an
+    interrupted migration is simply run again. Commits; call it outside
+    any open transaction.
+
+    Returns:
+        Names of the indexes created
+    """
+    with conn:
+        version = schema_version(conn)
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TEXT
+            )
+        ''')
+    created = []
+    for migration in migrations:
+        with conn:
+            created += create_indexes(conn, migration.indexes)
+            if migration.version > version:
+                conn.execute(f"INSERT INTO {MIGRATIONS_TABLE} (version, description, applied_at) VALUES (?, ?, ?)",
+                             (migration.version, migration.description, datetime.now().isoformat()))
+                print(f"🗂️  Schema migration {migration.version}: {migration.description}")
+    if created:
+        # Refresh planner statistics for the new indexes
+        conn.execute("ANALYZE")
+        conn.commit()
+    return created
+
+
+def full_table_scans(conn: sqlite3.Connection, queries: Sequence[HotQuery] = HOT_QUERIES) -> Dict[str, List[str]]:
+    """
+    Query plan steps that scan a whole table, per hot query.
+
+    Queries on tables this database does not have are skipped.
+    """
+    # sqlite3's statement cache would return a plan prepared before the last
+    # schema change; keying the statement on the schema version avoids it
+    schema = conn.execute("PRAGMA schema_version").fetchone()[0]
+    scans = {}
+    for query in queries:
+        try:
+            plan = conn.execute(f"EXPLAIN QUERY PLAN /* schema {schema} */ {query.sql}",
+                                (None,) * query.sql.count('?')).fetchall()
+        except sqlite3.OperationalError:
+            continue
+        steps = [row[3] for row in plan if row[3].startswith('SCAN ') and row[3] != 'SCAN CONSTANT ROW']
+        if steps:
+            scans[query.name] = steps
+    return scans
+
@@ -0,0 +1,158 @@
+"""
+Monte Carlo tournament outcome engine.
+
+Simulates one field thousands of times with the FieldSimulator player model,
+in batches of whole events as (batch x players x holes) arrays, and turns the
+finishing positions into per-player probabilities for the betting markets:
+win, top-N, made cut and the full finishing-position distribution.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .cut_rules import apply_cut
+from .field_simulator import FieldSimulator, rank_totals
+from .rng_streams import SimulationStreams
+
+# Throughput the engine is expected to sustain for a 156-player, 72-hole field
+THROUGHPUT_TARGET = 1000  # simulations per second
+THROUGHPUT_FIELD_SIZE = 156
+
+# Working memory for one batch of simulated events
+BATCH_MEMORY_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class OutcomeProbabilities:
+    """Per-player outcome probabilities from a Monte Carlo run (arrays in field order)"""
+    player_ids: np.ndarray
+    win: np.ndarray
+    top_n: Dict[int, np.ndarray]
+    made_cut: np.ndarray
+    position_distribution: np.ndarray  # (n_players, n_players): P(finish k+1)
+    simulations: int
+    elapsed: float = 0.0
+    seed: Optional[int] = None
+    expected_position: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        positions = np.arange(1, self.position_distribution.shape[1] + 1)
+        self.expected_position = self.position_distribution @ positions
+
+    @property
+    def simulations_per_second(self) -> float:
+        return self.simulations / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def as_rows(self, names: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Outcome rows sorted by win probability, for reports and odds"""
+        rows = []
+        for i, player_id in enumerate(self.player_ids):
+            row = {
+                'player_id': int(player_id),
+                'win': float(self.win[i]),
+                'made_cut': float(self.made_cut[i]),
+                'expected_position': float(self.expected_position[i])
+            }
+            if names is not None:
+                row['name'] = names[i]
+            for n, probabilities in self.top_n.items():
+                row[f'top_{n}'] = float(probabilities[i])
+            rows.append(row)
+        rows.sort(key=lambda r: r['win'], reverse=True)
+        return rows
+
+
+class OutcomeEngine:
+    """Runs a field many times in batches and aggregates finishing positions"""
+
+    def __init__(self, simulator: Optional[FieldSimulator] = None, top_n: Sequence[int] = (5, 10, 20),
+                 cut_size: Optional[int] = 65, cut_after_holes: int = 36,
+                 batch_size: Optional[int] = None):
+        self.simulator = simulator or FieldSimulator()
+        self.top_n = tuple(top_n)
+        self.cut_size = cut_size
+        self.cut_after_holes = cut_after_holes
+        self.batch_size = batch_size
+
+    def _batch_size_for(self, n_players: int) -> int:
+        """Largest batch that keeps the batch arrays inside the memory budget"""
+        if self.batch_size:
+            return self.batch_size
+        bytes_per_event = n_players * self.simulator.params.holes * 8 * 6
+        return max(1, BATCH_MEMORY_BYTES // bytes_per_event)
+
+    def run(self, player_ids: Sequence[int], total_skill: Sequence[float], composure: Sequence[float],
+            simulations: int = 10000, seed: Optional[int] = None) -> OutcomeProbabilities:
+        """
+        Simulate the field `simulations` times.
+
+        Results are reproducible for a fixed seed and a fixed batch size only:
+        every batch draws from its own stream, so a different `batch_size`
+        (the default one depends on the field size) gives different draws.
+
+        Args:
+            player_ids: field player ids
+            total_skill: overall skill rating per player
+            composure: composure rating per player
+            simulations: number of simulated events (typically 10k-100k)
+            seed: base seed; each batch draws from its own stream
+
+        Returns:
+            OutcomeProbabilities for the field
+        """
+        player_ids = np.asarray(player_ids)
+        total_skill = np.asarray(total_skill, dtype=np.float64)
+        composure = np.asarray(composure, dtype=np.float64)
+        n_players = len(player_ids)
+        streams = SimulationStreams(seed)
+        batch_size = self._batch_size_for(n_players)
+
+        position_counts = np.zeros(n_players * n_players, dtype=np.int64)
+        cut_counts = np.zeros(n_players, dtype=np.int64)
+        player_index = np.arange(n_players)
+
+        start = time.perf_counter()
+        done = 0
+        batch_number = 0
+        while done < simulations:
+            batch = min(batch_size, simulations - done)
+            rng = streams.generator(batch_number)
+            uniforms = self.simulator.draw_uniforms(rng, n_players, batch=(batch,))
+            hole_performance = self.simulator.hole_performance(total_skill, composure, *uniforms)
+
+            totals = hole_performance.sum(axis=-1)
+            if self.cut_size is not None and self.cut_size < n_players:
+                # Performance is higher-is-better, so cut on its negative (top N and ties)
+                cut_totals = -hole_performance[..., :self.cut_after_holes].sum(axis=-1)
+                made_cut = apply_cut(cut_totals, 'position', self.cut_size)
+                cut_counts += made_cut.sum(axis=0)
+                # Players who missed the cut rank below the whole weekend field
+                span = np.ptp(totals, axis=-1, keepdims=True) + 1
+                totals = np.where(made_cut, totals, totals - span)
+            else:
+                cut_counts += batch
+
+            _, ranks = rank_totals(totals)
+            position_counts += np.bincount((player_index * n_players + ranks - 1).ravel(),
+                                           minlength=n_players * n_players)
+
+            done += batch
+            batch_number += 1
+        elapsed = time.perf_counter() - start
+
+        position_distribution = position_counts.reshape(n_players, n_players) / simulations
+        cumulative = np.cumsum(position_distribution, axis=1)
+        top_n = {n: cumulative[:, min(n, n_players) - 1] for n in self.top_n}
+        return OutcomeProbabilities(
+            player_ids=player_ids,
+            win=position_distribution[:, 0],
+            top_n=top_n,
+            made_cut=cut_counts / simulations,
+            position_distribution=position_distribution,
+            simulations=simulations,
+            elapsed=elapsed,
+            seed=streams.seed
+        )
@@ -0,0 +1,128 @@
+"""
+Sudden-death playoffs and tied finishing positions.
+
+A tie for first after 72 holes is settled by sudden-death holes played by the
+tied players only: every survivor plays the next playoff hole and anyone who
+does not make the lowest score is eliminated. Playoff holes replay the
+course's finishing hole(s) through TournamentSimulator, so they use the same
+course model and the same counter-based streams, continued past the last
+event hole. Everyone else keeps a tied position ("T5") instead of an
+arbitrary sort-order rank, so the extra work is O(tied players).
+"""
+
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .tournament_simulator import TournamentResult, TournamentSimulator
+
+# Safety limit; sudden death almost never lasts more than a handful of holes
+MAX_PLAYOFF_HOLES = 50
+
+
+@dataclass
+class PlayoffResult:
+    """Outcome of a sudden-death playoff (indices are field indices)"""
+    players: np.ndarray           # field indices of everyone in the playoff
+    winner: int                   # field index of the winner
+    holes_played: int
+    hole_scores: List[np.ndarray]  # strokes of the players still in, per playoff hole
+    eliminated_on: np.ndarray     # playoff hole each player went out on (0 = winner)
+
+
+def tied_positions(totals: np.ndarray, made_cut: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Finishing positions with ties sharing the best position (1, 2, 2, 4, ...).
+
+    Players who missed the cut are placed below everyone who made it.
+    """
+    totals = np.asarray(totals)
+    if made_cut is None:
+        made_cut = np.ones(len(totals), dtype=bool)
+    order = np.lexsort((totals, ~made_cut))
+    ranked = np.stack([~made_cut[order], totals[order]])
+    new_score = np.concatenate([[True], np.any(ranked[:, 1:] != ranked[:, :-1], axis=0)])
+    ranked_positions = np.maximum.accumulate(np.where(new_score, np.arange(1, len(order) + 1), 0))
+    positions = np.empty(len(order), dtype=np.int64)
+    positions[order] = ranked_positions
+    return positions
+
+
+def shared_points(positions: np.ndarray, first_place_points: int) -> np.ndarray:
+    """
+    Points per player for places worth first_place_points, one less per place.
+
+    Players tied on a position split the points of the places they share,
+    rounded down: a 2-way tie for 5th averages 5th and 6th place.
+    """
+    positions = np.asarray(positions)
+    tied_count = np.bincount(positions)[positions]
+    # Mean of first_place_points - (p - 1) ... first_place_points - (p + k - 2), floored
+    return first_place_points - (positions - 1) - tied_count // 2
+
+
+def sudden_death(simulator: TournamentSimulator, player_ids: np.ndarray, ratings: np.ndarray,
+                 players: np.ndarray, waves=0, holes: Optional[Sequence[int]] = None,
+                 max_holes: int = MAX_PLAYOFF_HOLES) -> PlayoffResult:
+    """
+    Play sudden-death holes until one player is left.
+
+    Args:
+        simulator: the event's TournamentSimulator
+        player_ids: field player ids
+        ratings: field ratings (as passed to simulate)
+        players: field indices of the tied players
+        waves: tee-time wave per field player (for weather)
+        holes: course holes to play in turn (default: the finishing hole, again and again)
+        max_holes: after this many holes the first remaining player in field order wins
+
+    Returns:
+        PlayoffResult
+    """
+    player_ids = np.asarray(player_ids)
+    ratings = np.asarray(ratings, dtype=np.float64)
+    waves = np.broadcast_to(waves, player_ids.shape)
+    players = np.asarray(players)
+    holes = holes or (simulator.course.holes,)
+    remaining = players
+    eliminated_on = np.zeros(len(players), dtype=np.int64)
+    hole_scores = []
+
+    playoff_hole = 0
+    while len(remaining) > 1 and playoff_hole < max_holes:
+        playoff_hole += 1
+        course_hole = holes[(playoff_hole - 1) % len(holes)]
+        strokes = simulator.simulate_playoff_hole(player_ids[remaining], ratings[remaining], playoff_hole,
+                                                  course_hole, waves[remaining])
+        hole_scores.append(strokes)
+        out = remaining[strokes > strokes.min()]
+        eliminated_on[np.isin(players, out)] = playoff_hole
+        remaining = remaining[strokes == strokes.min()]
+
+    return PlayoffResult(players=players, winner=int(remaining[0]), holes_played=playoff_hole,
+                         hole_scores=hole_scores, eliminated_on=eliminated_on)
+
+
+def settle_result(simulator: TournamentSimulator, result: TournamentResult, ratings: np.ndarray,
+                  waves=0) -> Tuple[TournamentResult, Optional[PlayoffResult]]:
+    """
+    Final positions for a simulated tournament.
+
+    Ties get shared positions; a tie for first is played off and the winner
+    moved to the top of `order`, with the other playoff players tied second.
+
+    Returns:
+        (result with tied positions, PlayoffResult or None)
+    """
+    positions = tied_positions(result.totals, result.made_cut)
+    leaders = np.flatnonzero(positions == 1)
+    if len(leaders) < 2:
+        return replace(result, positions=positions), None
+
+    playoff = sudden_death(simulator, result.player_ids, ratings, leaders, waves)
+    positions[leaders] = 2
+    positions[playoff.winner] = 1
+    # Winner first; everyone else keeps their place in the stable order
+    order = np.concatenate([[playoff.winner], result.order[result.order != playoff.winner]])
+    return replace(result, positions=positions, order=order), playoff
@@ -0,0 +1,219 @@
+"""
+Batched Monday qualifiers and Q-School.
+
+Monday qualifying (docs/Qualifying_Priority.md) is a single 18-hole round for
+players not already in a Standard event's field; the top four advance into
+the field. Q-School is the same thing over more rounds with the top five
+earning status. A season has dozens of qualifiers with hundreds of entrants
+each, so run_qualifiers stacks every entrant of every qualifier into one
+(entrants x holes) array and scores them all at once with the
+TournamentSimulator stroke model: per-entrant course pars and difficulties
+are gathered from the qualifiers' courses, and the counter-based streams are
+offset per qualifier so each one reproduces on its own, whatever it was
+batched with.
+
+Ties for the last advancing spot are broken by matching cards (back nine,
+last six, last three, last hole of the final round), then by a draw.
+Only the advancers of Monday qualifiers are written to tournament_fields.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .course_model import CourseModel
+from .rng_streams import SimulationStreams
+from .skill_weights import par_type_index
+from .tournament_simulator import TournamentSimulator
+
+MONDAY_ROUNDS = 1
+MONDAY_SPOTS = 4
+Q_SCHOOL_ROUNDS = 4
+Q_SCHOOL_SPOTS = 5
+
+MONDAY_ENTRY_METHOD = 'monday_qualifier'
+
+# Stream counters reserved per qualifier (qualifier_id * stride + event hole)
+QUALIFIER_COUNTER_STRIDE = 1 << 16
+# Stream slots separating qualifier scoring and tie-break draws from event scoring
+QUALIFIER_SLOT = 3
+TIEBREAK_SLOT = 4
+
+# Holes compared from the end of the final round when matching cards
+CARD_OFF_HOLES = (9, 6, 3, 1)
+
+
+@dataclass
+class Qualifier:
+    """One qualifying event"""
+    qualifier_id: int        # unique within a run, e.g. the tournament a Monday qualifier feeds
+    course: CourseModel
+    player_ids: np.ndarray   # (n_entrants,)
+    ratings: np.ndarray      # (n_entrants,) or (n_entrants x 3) from hole_type_ratings
+    spots: int = MONDAY_SPOTS
+    rounds: int = MONDAY_ROUNDS
+
+
+@dataclass
+class QualifierResult:
+    """Outcome of one qualifier (arrays in entrant order unless noted)"""
+    qualifier_id: int
+    player_ids: np.ndarray
+    strokes: np.ndarray      # (n_entrants, rounds * holes)
+    totals: np.ndarray
+    positions: np.ndarray    # 1 = medalist; ties broken by card-off, so positions are unique
+    advanced: np.ndarray     # bool
+
+    @property
+    def order(self) -> np.ndarray:
+        """Entrant indices from first to last"""
+        return np.argsort(self.positions, kind='stable')
+
+    def advancers(self) -> np.ndarray:
+        """Player ids of the advancing players, in finishing order"""
+        order = self.order
+        return self.player_ids[order[self.advanced[order]]]
+
+
+def monday_qualifier(tournament_id: int, course: CourseModel, player_ids, ratings) -> Qualifier:
+    """Monday qualifier for a Standard event: one round, top four advance"""
+    return Qualifier(tournament_id, course, np.asarray(player_ids), np.asarray(ratings, dtype=np.float64),
+                     MONDAY_SPOTS, MONDAY_ROUNDS)
+
+
+def q_school(qualifier_id: int, course: CourseModel, player_ids, ratings, spots: int = Q_SCHOOL_SPOTS,
+             rounds: int = Q_SCHOOL_ROUNDS) -> Qualifier:
+    """Q-School final stage: four rounds, top five earn exempt status"""
+    return Qualifier(qualifier_id, course, np.asarray(player_ids), np.asarray(ratings, dtype=np.float64),
+                     spots, rounds)
+
+
+def run_qualifiers(qualifiers: Sequence[Qualifier], streams: SimulationStreams, key: Tuple[int, ...],
+                   randomness: float = 15.0) -> List[QualifierResult]:
+    """
+    Simulate many qualifiers in one batch.
+
+    Qualifiers with the same number of rounds and course length are scored
+    together as one array; each qualifier's results only depend on its own
+    entrants, id and the stream key.
+
+    Args:
+        qualifiers: qualifiers to play (qualifier_id unique within `key`)
+        streams: random streams
+        key: stream key for the batch, e.g. (season, week)
+        randomness: per-hole randomness, as for TournamentSimulator
+
+    Returns:
+        QualifierResult per qualifier, in input order
+    """
+    results: Dict[int, QualifierResult] = {}
+    batches: Dict[Tuple[int, int], List[int]] = {}
+    for i, qualifier in enumerate(qualifiers):
+        batches.setdefault((qualifier.rounds, qualifier.course.holes), []).append(i)
+
+    for indices in batches.values():
+        batch = [qualifiers[i] for i in indices]
+        for i, result in zip(indices, _play_batch(batch, streams, key, randomness)):
+            results[i] = result
+    return [results[i] for i in range(len(qualifiers))]
+
+
+def _play_batch(batch: List[Qualifier], streams: SimulationStreams, key: Tuple[int, ...],
+                randomness: float) -> List[QualifierResult]:
+    """Score qualifiers of the same length as one (all entrants x holes) array"""
+    sizes = np.array([len(q.player_ids) for q in batch])
+    event = np.repeat(np.arange(len(batch)), sizes)
+    player_ids = np.concatenate([q.player_ids for q in batch]).astype(np.int64)
+    ratings = np.concatenate([_per_par_type(q.ratings) for q in batch])
+    qualifier_ids = np.array([q.qualifier_id for q in batch], dtype=np.int64)
+
+    # Course arrays per qualifier, gathered per entrant
+    par = np.stack([q.course.event_holes(q.rounds)['par'] for q in batch])[event]
+    difficulty = np.stack([q.course.event_holes(q.rounds)['difficulty'] for q in batch])[event]
+    hole_ratings = np.take_along_axis(ratings, par_type_index(par), axis=1)
+
+    holes = par.shape[1]
+    counters = qualifier_ids[event][:, None] * QUALIFIER_COUNTER_STRIDE + np.arange(1, holes + 1)
+    randomness_u = streams.uniforms(key, player_ids[:, None], counters, QUALIFIER_SLOT)
+    performance = TournamentSimulator.performance_score(hole_ratings, difficulty, randomness_u, randomness)
+    strokes = TournamentSimulator.performance_to_strokes(performance, par)
+    totals = strokes.sum(axis=1)
+
+    draw = streams.uniforms(key, player_ids, qualifier_ids[event] * QUALIFIER_COUNTER_STRIDE, TIEBREAK_SLOT)
+    positions = _rank(strokes, event, draw)
+    advanced = positions <= np.array([q.spots for q in batch])[event]
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+    results = []
+    for q, start, size in zip(batch, starts, sizes):
+        rows = slice(start, start + size)
+        results.append(QualifierResult(q.qualifier_id, q.player_ids, strokes[rows], totals[rows],
+                                       positions[rows], advanced[rows]))
+    return results
+
+
+def _rank(strokes: np.ndarray, event: np.ndarray, draw: np.ndarray) -> np.ndarray:
+    """
+    Positions within each qualifier: total, then matching cards, then the draw.
+
+    `strokes` holds the entrants of consecutive qualifiers (`event` gives each
+    entrant's qualifier index, in order); lower totals, card-offs and draws win.
+    """
+    holes = strokes.shape[1]
+    card_off = [strokes[:, holes - n:].sum(axis=1) for n in CARD_OFF_HOLES]
+    order = np.lexsort((draw, *card_off[::-1], strokes.sum(axis=1), event))
+    starts = np.concatenate([[0], np.cumsum(np.bincount(event))[:-1]])
+    positions = np.empty(len(order), dtype=np.int64)
+    positions[order] = np.arange(len(order)) - starts[event[order]] + 1
+    return positions
+
+
+def _per_par_type(ratings: np.ndarray) -> np.ndarray:
+    """Ratings as (n x 3); one overall rating applies to every par type"""
+    ratings = np.asarray(ratings, dtype=np.float64)
+    return ratings if ratings.ndim == 2 else np.repeat(ratings[:, None], 3, axis=1)
+
+
+def _tee_time(group_number: int) -> str:
+    """Tee time of a group: every group of 3 starts 3 minutes apart from 09:00"""
+    start_minute = (group_number - 1) * 3
+    return f"{9 + start_minute // 60:02d}:{start_minute % 60:02d}"
+
+
+def save_monday_qualifiers(conn: sqlite3.Connection, results: Sequence[QualifierResult]) -> int:
+    """
+    Add each Monday qualifier's advancers to the field of the tournament it feeds.
+
+    The advancers (qualifier_id = tournament_id) are appended after the
+    players already in tournament_fields, in finishing order and in new
+    groups of three; earlier Monday qualifier entries for the tournament are
+    replaced. The caller commits.
+
+    Returns:
+        Number of players added
+    """
+    cur = conn.cursor()
+    rows = []
+    for result in results:
+        tournament_id = result.qualifier_id
+        cur.execute('DELETE FROM tournament_fields WHERE tournament_id = ? AND entry_method = ?',
+                    (tournament_id, MONDAY_ENTRY_METHOD))
+        cur.execute('''
+            SELECT COALESCE(MAX(starting_position), 0), COALESCE(MAX(group_number), 0)
+            FROM tournament_fields
+            WHERE tournament_id = ?
+        ''', (tournament_id,))
+        last_position, last_group = cur.fetchone()
+        for i, player_id in enumerate(result.advancers()):
+            group_number = last_group + i // 3 + 1
+            rows.append((tournament_id, int(player_id), MONDAY_ENTRY_METHOD, last_position + i + 1,
+                         group_number, i % 3 + 1, _tee_time(group_number)))
+
+    cur.executemany('''
+        INSERT INTO tournament_fields (tournament_id, player_id, entry_method,
+                                       starting_position, group_number, group_position, tee_time)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+    return len(rows)
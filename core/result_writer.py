@@ -0,0 +1,120 @@
+"""
+Buffered bulk writes of simulation results.
+
+Simulators used to open a connection per save call and run one INSERT per
+row. A ResultWriter buffers rows per table as tuples in a prepared column
+order (ResultTable) and flushes each table with a single executemany, so an
+event's or a whole season's results reach SQLite as a few statements in one
+transaction. Parent rows whose ids are needed by the buffered rows (a
+tournament) are inserted straight away with insert().
+
+The writer never commits: it runs inside the caller's transaction - a
+connection used as a context manager, or a shared connection whose owner
+commits - and its buffer is flushed when its block exits without an error.
+Every row of a writer shares one created_at timestamp.
+
+connect() optionally applies a pragma profile when the connection is
+opened; BULK_LOAD_PRAGMAS trades durability (no fsync, in-memory rollback
+journal) for load speed and suits runs that can simply be repeated after a
+crash.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Pragmas for bulk loads; applied outside any transaction
+BULK_LOAD_PRAGMAS = (
+    ('synchronous', 'OFF'),
+    ('journal_mode', 'MEMORY'),
+    ('temp_store', 'MEMORY'),
+    ('cache_size', -65536)  # KiB
+)
+
+
+@dataclass(frozen=True)
+class ResultTable:
+    """A table and the column order its rows are buffered in"""
+    name: str
+    columns: Tuple[str, ...]
+
+    @property
+    def insert_sql(self) -> str:
+        return f"INSERT INTO {self.name} ({', '.join(self.columns)}) VALUES ({', '.join('?' * len(self.columns))})"
+
+
+TOURNAMENTS = ResultTable('tournaments', ('season_number', 'event_number', 'name', 'field_size', 'status'))
+
+REGULAR_SEASON_RESULTS = ResultTable(
+    'tournament_results', ('tournament_id', 'player_id', 'position', 'total_score', 'points_earned'))
+
+GAUNTLET_RESULTS = ResultTable('tournament_results', (
+    'tournament_id', 'player_id', 'position', 'total_score',
+    'round_1_score', 'round_2_score', 'round_3_score', 'round_4_score',
+    'points_earned', 'made_cut', 'created_at'))
+
+SEASON_STANDINGS = ResultTable(
+    'season_player_stats', ('season_id', 'player_id', 'total_season_points', 'final_rank', 'events_played'))
+
+GAUNTLET_SEASON_STATS = ResultTable('season_player_stats', (
+    'season_id', 'player_id', 'total_season_points', 'final_rank',
+    'events_played', 'wins', 'top_10s', 'made_cuts', 'created_at'))
+
+SEASON_EVENT_RESULTS = ResultTable('season_event_results', (
+    'season_id', 'tournament_id', 'player_id', 'event_rank', 'points_earned', 'total_score', 'created_at'))
+
+
+def apply_pragmas(conn: sqlite3.Connection, pragmas: Sequence[Tuple[str, object]]):
+    """Apply (name, value) pragmas; some (synchronous) cannot change inside a transaction"""
+    for name, value in pragmas:
+        conn.execute(f'PRAGMA {name} = {value}')
+
+
+def connect(db_path: str, pragmas: Optional[Sequence[Tuple[str, object]]] = None) -> sqlite3.Connection:
+    """Open a connection, applying an optional pragma profile"""
+    conn = sqlite3.connect(db_path)
+    if pragmas:
+        apply_pragmas(conn, pragmas)
+    return conn
+
+
+class ResultWriter:
+    """Buffers result rows per table and flushes them with executemany"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.timestamp = datetime.now().isoformat()
+        self.rows_written = 0
+        self._buffers: Dict[ResultTable, List[tuple]] = {}
+
+    def insert(self, table: ResultTable, row: tuple) -> int:
+        """Insert one row now (e.g. a parent whose id later rows need); returns its rowid"""
+        self.rows_written += 1
+        return self.conn.execute(table.insert_sql, row).lastrowid
+
+    def add(self, table: ResultTable, row: tuple):
+        self._buffers.setdefault(table, []).append(row)
+
+    def extend(self, table: ResultTable, rows: Iterable[tuple]):
+        self._buffers.setdefault(table, []).extend(rows)
+
+    def flush(self) -> int:
+        """Write every buffered row, one executemany per table; returns rows written"""
+        written = 0
+        for table, rows in self._buffers.items():
+            self.conn.executemany(table.insert_sql, rows)
+            written += len(rows)
+        self._buffers.clear()
+        self.rows_written += written
+        return written
+
+    def __enter__(self) -> 'ResultWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._buffers.clear()
+        return False
@@ -0,0 +1,232 @@
+"""
+Analytical tournament score distributions.
+
+Under the TournamentSimulator stroke model a player's strokes on a hole are
+a deterministic function of one uniform draw:
+
+    performance = clip(clip(rating / (difficulty + 1) * 50, 0, 100) + (2u - 1) * R, 0, 100)
+    strokes     = max(1, rint(par + (100 - performance) / performance_per_stroke))
+
+so the probability mass function (PMF) of strokes on every hole follows
+exactly from the course model and the player's ratings: the uniform part
+spreads evenly over the stroke bins, and the clipping at 0 and 100 adds
+point masses. Hole PMFs are convolved (FFT, or direct cumulative
+convolution) into round and 72-hole total distributions, and P(win) and
+P(top N) are integrated exactly over the order statistics of the field:
+
+- win: P(i wins) = sum_t p_i(t) * int_0^1 prod_{j != i} (P(T_j > t) + P(T_j = t) x) dx,
+  which splits ties for first evenly (the integral of x^m is 1 / (m + 1));
+  the x integral is exact Gauss-Legendre quadrature
+- top N: P(fewer than N players strictly better than i), a Poisson-binomial
+  tail over the rest of the field, computed with prefix/suffix DP so each
+  player's "everyone else" distribution is exact
+
+Players are independent under the model (no cut and no mental state, which
+make scores path dependent), so no sampling is needed.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+import numpy as np
+
+from .tournament_simulator import TournamentSimulator
+
+
+@dataclass
+class ScoreDistribution:
+    """Exact distributions of strokes for a field (arrays in field order)"""
+    player_ids: np.ndarray
+    par: int                  # total par of the event; index 0 of `pmf` is this score
+    pmf: np.ndarray           # (n_players, n_totals) P(total = par + k)
+    round_pmf: np.ndarray     # (n_players, rounds, n_round_totals) P(round = round par + k)
+    round_par: np.ndarray     # (rounds,)
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Total strokes of each column of `pmf`"""
+        return self.par + np.arange(self.pmf.shape[1])
+
+    def mean(self) -> np.ndarray:
+        return self.pmf @ self.totals
+
+    def std(self) -> np.ndarray:
+        return np.sqrt(np.maximum(self.pmf @ self.totals ** 2 - self.mean() ** 2, 0))
+
+    def cdf(self) -> np.ndarray:
+        """(n_players, n_totals) P(total <= par + k)"""
+        return np.minimum(np.cumsum(self.pmf, axis=1), 1.0)
+
+    def win_probability(self) -> np.ndarray:
+        """Exact P(win) per player, ties for first split evenly"""
+        pmf = self.pmf
+        better_or_tied = self.cdf()
+        worse = 1.0 - better_or_tied
+        nodes, weights = np.polynomial.legendre.leggauss(len(pmf) // 2 + 1)
+        win = np.zeros_like(pmf)
+        for x, weight in zip((nodes + 1) / 2, weights / 2):
+            # P(T_j > t) + P(T_j = t) x for every player j and total t
+            win += weight * _exclusive_product(worse + pmf * x)
+        return np.clip((pmf * win).sum(axis=1), 0, 1)
+
+    def top_n_probability(self, n: int) -> np.ndarray:
+        """Exact P(finishing position <= n) per player; tied players share the best position"""
+        strictly_better = np.concatenate([np.zeros((len(self.pmf), 1)), self.cdf()[:, :-1]], axis=1)
+        return np.clip((self.pmf * _at_most_others(strictly_better, n - 1)).sum(axis=1), 0, 1)
+
+    def outcomes(self, top_n: Sequence[int] = (5, 10, 20)) -> Dict[str, np.ndarray]:
+        """Win and top-N probabilities, keyed 'win' and 'top_<n>'"""
+        outcomes = {'win': self.win_probability()}
+        for n in top_n:
+            outcomes[f'top_{n}'] = self.top_n_probability(n)
+        return outcomes
+
+
+def _exclusive_product(factors: np.ndarray) -> np.ndarray:
+    """Product over all other rows (axis 0) for every row, without division"""
+    ones = np.ones((1,) + factors.shape[1:])
+    prefix = np.cumprod(np.concatenate([ones, factors[:-1]]), axis=0)
+    suffix = np.cumprod(np.concatenate([ones, factors[:0:-1]]), axis=0)[::-1]
+    return prefix * suffix
+
+
+def _at_most_others(probabilities: np.ndarray, limit: int) -> np.ndarray:
+    """
+    P(at most `limit` of the other players have an event), for every player and total.
+
+    `probabilities` is (n_players, n_totals): each player's probability of
+    the event (e.g. beating the total). Counts above `limit` are dropped,
+    so the DP is O(players x totals x limit).
+    """
+    n_players, n_totals = probabilities.shape
+    size = limit + 1
+
+    def counts(rows):
+        """Capped count distributions of the first 0..len(rows) players of `rows`"""
+        dist = np.zeros((len(rows) + 1, n_totals, size))
+        dist[0, :, 0] = 1.0
+        for i, q in enumerate(rows):
+            dist[i + 1] = dist[i] * (1 - q)[:, None]
+            dist[i + 1, :, 1:] += dist[i, :, :-1] * q[:, None]
+        return dist
+
+    prefix = counts(probabilities)[:-1]                   # players before i
+    suffix = counts(probabilities[::-1])[:-1][::-1]       # players after i
+    suffix_cdf = np.cumsum(suffix, axis=2)
+    # Sum over a + b <= limit of prefix(a) * suffix(b)
+    return np.einsum('ita,ita->it', prefix, suffix_cdf[:, :, ::-1])
+
+
+def hole_pmfs(simulator: TournamentSimulator, ratings: np.ndarray, waves=0) -> np.ndarray:
+    """
+    Strokes PMF of every player on every event hole.
+
+    Args:
+        simulator: the event's TournamentSimulator (course, randomness, weather)
+        ratings: (n_players,) or (n_players x 3) ratings, as passed to simulate
+        waves: tee-time wave per player (for weather)
+
+    Returns:
+        (n_players, event holes, n_bins) P(strokes = par + k); strokes never
+        fall below par under the model
+    """
+    ratings = np.asarray(ratings, dtype=np.float64)
+    par = simulator.par
+    hole_ratings = ratings[:, simulator.par_type] if ratings.ndim == 2 else np.repeat(ratings[:, None], len(par), axis=1)
+    difficulty = np.broadcast_to(simulator.difficulty, hole_ratings.shape)
+    if simulator.weather is not None:
+        difficulty_multiplier, player_multiplier = simulator.weather.hole_multipliers(
+            simulator.course.holes, np.broadcast_to(waves, (len(ratings),)))
+        difficulty = difficulty * difficulty_multiplier
+        hole_ratings = hole_ratings * player_multiplier
+
+    base = np.clip(hole_ratings / (difficulty + 1) * 50, 0, 100)
+    return stroke_pmf(base, simulator.randomness, simulator.performance_per_stroke)
+
+
+def stroke_pmf(base: np.ndarray, randomness: float, performance_per_stroke: float) -> np.ndarray:
+    """
+    Strokes PMF for base performances (0-100, before the uniform spread).
+
+    Returns:
+        (*base.shape, n_bins) P(strokes = par + k)
+    """
+    base = np.asarray(base, dtype=np.float64)[..., None]
+    per_stroke = performance_per_stroke
+    spread = randomness
+    over_par = np.arange(int(np.ceil(100 / per_stroke + 0.5)) + 1)
+    worst_atom = int(np.rint(100 / per_stroke))
+    if spread == 0:
+        # No randomness: all mass on the base performance's score
+        strokes_over = np.rint((100 - base) / per_stroke)
+        return (strokes_over == over_par).astype(np.float64)
+
+    low, high = base - spread, base + spread
+    # Performance range of each stroke bin, inside (0, 100) and the uniform's range
+    bin_low = np.maximum(np.maximum(100 - per_stroke * (over_par + 0.5), 0), low)
+    bin_high = np.minimum(np.minimum(100 - per_stroke * (over_par - 0.5), 100), high)
+    pmf = np.maximum(bin_high - bin_low, 0) / (2 * spread)
+    # Point masses where performance is clipped at 100 (par) and 0 (par + 100 / per_stroke)
+    pmf[..., 0] += np.clip((high[..., 0] - 100) / (2 * spread), 0, 1)
+    pmf[..., worst_atom] += np.clip(-low[..., 0] / (2 * spread), 0, 1)
+    return pmf
+
+
+def convolve_holes(pmfs: np.ndarray, method: str = 'fft') -> np.ndarray:
+    """
+    Distribution of the sum over holes (axis 1) of per-hole PMFs.
+
+    Args:
+        pmfs: (n_players, holes, n_bins) per-hole PMFs
+        method: 'fft' (one transform per player) or 'direct' (cumulative convolution)
+
+    Returns:
+        (n_players, holes * (n_bins - 1) + 1) PMF of the total
+    """
+    n_players, holes, n_bins = pmfs.shape
+    size = holes * (n_bins - 1) + 1
+    if method == 'fft':
+        spectrum = np.prod(np.fft.rfft(pmfs, n=size, axis=-1), axis=1)
+        total = np.maximum(np.fft.irfft(spectrum, n=size, axis=-1), 0)
+        return total / total.sum(axis=1, keepdims=True)
+    if method == 'direct':
+        total = np.zeros((n_players, size))
+        total[:, 0] = 1.0
+        for hole in range(holes):
+            shifted = np.zeros_like(total)
+            for k in range(n_bins):
+                shifted[:, k:] += total[:, :size - k] * pmfs[:, hole, k, None]
+            total = shifted
+        return total
+    raise ValueError("method must be 'fft' or 'direct'")
+
+
+def tournament_distribution(simulator: TournamentSimulator, player_ids, ratings, waves=0,
+                            method: str = 'fft') -> ScoreDistribution:
+    """
+    Exact round and 72-hole total distributions for a field.
+
+    The cut and mental state are not modelled (every player plays every round).
+
+    Args:
+        simulator: the event's TournamentSimulator
+        player_ids: field player ids
+        ratings: (n_players,) or (n_players x 3) ratings
+        waves: tee-time wave per player (for weather)
+        method: convolution method, 'fft' or 'direct'
+
+    Returns:
+        ScoreDistribution
+    """
+    pmfs = hole_pmfs(simulator, ratings, waves)
+    holes = simulator.course.holes
+    round_pmf = np.stack([
+        convolve_holes(pmfs[:, r * holes:(r + 1) * holes], method) for r in range(simulator.rounds)
+    ], axis=1)
+    return ScoreDistribution(
+        player_ids=np.asarray(player_ids),
+        par=int(simulator.par.sum()),
+        pmf=convolve_holes(pmfs, method),
+        round_pmf=round_pmf,
+        round_par=simulator.par.reshape(simulator.rounds, holes).sum(axis=1)
+    )
@@ -0,0 +1,166 @@
+"""
+Lookup-table score model.
+
+The TournamentSimulator turns a rating, a hole difficulty and one uniform
+into strokes with float arithmetic and two clamps per player per hole. The
+stroke distribution only depends on the rating and the difficulty, so it is
+precomputed once on a 2-D grid of rating bins x difficulty bins: each cell
+holds the cumulative distribution of strokes relative to par, from eagle up
+to the model's worst score (par + 100 / performance_per_stroke, a quadruple
+bogey at the default 25 points per stroke). A hole outcome is then a binned
+lookup plus a comparison of the player's uniform against the cell's CDF,
+vectorized across the field.
+
+Cells come from the exact per-hole PMF of the analytical model
+(score_distribution.stroke_pmf) at each bin's centre. Eagle and birdie
+columns are zero under the current model (strokes never fall below par);
+they are kept so the table layout does not depend on the model.
+
+Draws are inverted as 1 - u, so a high uniform is a good score exactly as
+in the arithmetic model: with the same streams, table and arithmetic
+strokes only differ for players whose rating or difficulty falls near a
+bin edge of a stroke boundary.
+
+Tables are built once per process and cached in memory; pass `cache_dir`
+to get_score_table to also keep them on disk between runs.
+
+Under NumPy the lookup is a handful of array passes, like the arithmetic it
+replaces, so it is not faster on its own; it makes the stroke rule data
+rather than code, so a different score model (e.g. one with birdies) only
+needs a different table.
+"""
+
+import hashlib
+import os
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from .score_distribution import stroke_pmf
+from .tournament_simulator import PERFORMANCE_PER_STROKE
+
+# Strokes relative to par of the table's first column (eagle)
+SCORE_MIN = -2
+
+# Bump when the cell computation changes, to invalidate tables cached on disk
+SCORE_TABLE_VERSION = 1
+
+_TABLE_CACHE: Dict['ScoreTableSpec', 'ScoreTable'] = {}
+
+
+@dataclass(frozen=True)
+class ScoreTableSpec:
+    """Grid and model parameters of a score table"""
+    randomness: float = 15.0
+    performance_per_stroke: float = PERFORMANCE_PER_STROKE
+    rating_max: float = 120.0      # weather and mental state can push ratings above 100
+    rating_step: float = 0.25
+    difficulty_max: float = 150.0  # hole difficulty up to 100, times the worst weather multiplier
+    difficulty_step: float = 0.25
+
+    def cache_key(self) -> str:
+        """Short digest of the spec, used in cache file names"""
+        values = dict(asdict(self), version=SCORE_TABLE_VERSION)
+        return hashlib.sha256(repr(sorted(values.items())).encode()).hexdigest()[:16]
+
+
+class ScoreTable:
+    """P(strokes - par <= k | rating bin, difficulty bin) for k from SCORE_MIN"""
+
+    def __init__(self, spec: ScoreTableSpec, cdf: np.ndarray):
+        self.spec = spec
+        self.cdf = cdf  # (rating bins, difficulty bins, outcomes)
+        # Lookup layout: one contiguous float32 row of cells per outcome that can go
+        # either way; outcomes with zero probability in every cell (eagle and birdie
+        # under the current model) are always passed and only shift the result
+        flat = cdf.reshape(-1, cdf.shape[2])[:, :-1]
+        varying = flat.any(axis=0)
+        self._columns = np.ascontiguousarray(flat[:, varying].T, dtype=np.float32)
+        self._passed = int((~varying).sum())
+
+    @classmethod
+    def build(cls, spec: Optional[ScoreTableSpec] = None) -> 'ScoreTable':
+        """Compute every cell from the analytical model"""
+        spec = spec or ScoreTableSpec()
+        ratings = np.arange(int(round(spec.rating_max / spec.rating_step)) + 1) * spec.rating_step
+        difficulty = np.arange(int(round(spec.difficulty_max / spec.difficulty_step)) + 1) * spec.difficulty_step
+        base = np.clip(ratings[:, None] / (difficulty[None, :] + 1) * 50, 0, 100)
+        pmf = stroke_pmf(base, spec.randomness, spec.performance_per_stroke)
+        pmf = np.concatenate([np.zeros(pmf.shape[:2] + (-SCORE_MIN,)), pmf], axis=2)
+        cdf = np.minimum(np.cumsum(pmf, axis=2), 1.0)
+        cdf[..., -1] = 1.0
+        return cls(spec, cdf)
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        """Strokes relative to par of each CDF column"""
+        return SCORE_MIN + np.arange(self.cdf.shape[2])
+
+    def matches(self, randomness: float, performance_per_stroke: float) -> bool:
+        return self.spec.randomness == randomness and self.spec.performance_per_stroke == performance_per_stroke
+
+    def bins(self, ratings, difficulty) -> np.ndarray:
+        """Flat cell index of ratings and difficulties (broadcast), rounded to the nearest bin"""
+        spec = self.spec
+        n_ratings, n_difficulty, _ = self.cdf.shape
+        rating_bin = np.clip(np.asarray(ratings) / spec.rating_step + 0.5, 0, n_ratings - 1).astype(np.intp)
+        difficulty_bin = np.clip(np.asarray(difficulty) / spec.difficulty_step + 0.5, 0, n_difficulty - 1).astype(np.intp)
+        return rating_bin * n_difficulty + difficulty_bin
+
+    def cells(self, ratings, difficulty) -> np.ndarray:
+        """CDF rows for ratings and difficulties (broadcast)"""
+        return self.cdf.reshape(-1, self.cdf.shape[2])[self.bins(ratings, difficulty)]
+
+    def strokes(self, ratings, difficulty, par, randomness_u: np.ndarray) -> np.ndarray:
+        """
+        Strokes from ratings, hole difficulty, par and uniforms in [0, 1) (all broadcast).
+
+        Same convention as TournamentSimulator.performance_score: a higher
+        uniform is a better performance. Minimum 1 stroke.
+        """
+        cells = self.bins(ratings, difficulty)
+        # Inverse CDF: count the outcomes whose cumulative probability is <= 1 - u
+        threshold = (1.0 - np.asarray(randomness_u)).astype(np.float32)
+        passed = (self._columns.take(cells, axis=1) <= threshold).sum(axis=0, dtype=np.int16)
+        return np.maximum(par + SCORE_MIN + self._passed + passed, 1).astype(np.int16)
+
+    def save(self, path: str):
+        np.savez(path, cdf=self.cdf, **asdict(self.spec))
+
+    @classmethod
+    def load(cls, path: str) -> 'ScoreTable':
+        with np.load(path) as data:
+            spec = ScoreTableSpec(**{name: float(data[name]) for name in asdict(ScoreTableSpec())})
+            return cls(spec, data['cdf'])
+
+
+def get_score_table(spec: Optional[ScoreTableSpec] = None, cache_dir: Optional[str] = None) -> ScoreTable:
+    """
+    Score table for a spec, built once per process.
+
+    Args:
+        spec: grid and model parameters (default: the simulator's defaults)
+        cache_dir: directory of tables cached on disk; loaded from there if
+            present, otherwise built and saved there
+
+    Returns:
+        ScoreTable
+    """
+    spec = spec or ScoreTableSpec()
+    if spec not in _TABLE_CACHE:
+        path = os.path.join(cache_dir, f'score_table_{spec.cache_key()}.npz') if cache_dir else None
+        if path and os.path.exists(path):
+            table = ScoreTable.load(path)
+        else:
+            table = ScoreTable.build(spec)
+            if path:
+                os.makedirs(cache_dir, exist_ok=True)
+                table.save(path)
+        _TABLE_CACHE[spec] = table
+    return _TABLE_CACHE[spec]
+
+
+def clear_score_table_cache():
+    """Drop all score tables cached in memory"""
+    _TABLE_CACHE.clear()
@@ -0,0 +1,167 @@
+"""
+Packed hole-by-hole scorecard storage.
+
+Stores every simulated tournament's scores as one row in
+tournament_scorecards: an int8 BLOB of strokes relative to par in
+(field x event hole) order, with the field's player ids and the par of each
+event hole alongside. A 156-player, 72-hole event takes about 11 KB, where a
+row per hole would take 11,232 rows. Scorecards decodes a row back into
+arrays, so leaderboards as of any hole, scoring averages and hole statistics
+are array operations instead of row scans.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+SCORECARD_TABLE = 'tournament_scorecards'
+
+SCORECARD_SCHEMA = f'''
+    CREATE TABLE IF NOT EXISTS {SCORECARD_TABLE} (
+        tournament_id INTEGER PRIMARY KEY,
+        field_size INTEGER NOT NULL,
+        holes INTEGER NOT NULL,
+        holes_per_round INTEGER NOT NULL,
+        player_ids BLOB NOT NULL,
+        par BLOB NOT NULL,
+        scores BLOB NOT NULL,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+# Marker for holes a player did not play (missed cut, withdrawal)
+NOT_PLAYED = -128
+
+# Score names for hole statistics, by strokes relative to par
+SCORE_TYPES = {'eagle_or_better': (-127, -2), 'birdie': (-1, -1), 'par': (0, 0),
+               'bogey': (1, 1), 'double_or_worse': (2, 127)}
+
+
+def encode_scores(strokes: np.ndarray, par: np.ndarray) -> np.ndarray:
+    """(n_players x holes) strokes, 0 = not played, to int8 strokes relative to par"""
+    strokes = np.asarray(strokes)
+    to_par = np.clip(strokes.astype(np.int16) - np.asarray(par, dtype=np.int16), -127, 127)
+    return np.where(strokes > 0, to_par, NOT_PLAYED).astype(np.int8)
+
+
+@dataclass
+class Scorecards:
+    """Decoded scorecards for one tournament (rows in field order)"""
+    tournament_id: int
+    player_ids: np.ndarray  # (n_players,)
+    par: np.ndarray         # (holes,) par of each event hole
+    to_par: np.ndarray      # (n_players, holes) int8, NOT_PLAYED where not played
+    holes_per_round: int = 18
+
+    @property
+    def played(self) -> np.ndarray:
+        return self.to_par != NOT_PLAYED
+
+    @property
+    def holes_played(self) -> np.ndarray:
+        return self.played.sum(axis=1)
+
+    def strokes(self) -> np.ndarray:
+        """(n_players x holes) strokes, 0 where not played"""
+        return np.where(self.played, self.to_par.astype(np.int16) + self.par, 0).astype(np.int16)
+
+    def round_scores(self) -> np.ndarray:
+        """(n_players x rounds) strokes per round, 0 for rounds not played"""
+        rounds = self.to_par.shape[1] // self.holes_per_round
+        return self.strokes().reshape(len(self.player_ids), rounds, self.holes_per_round).sum(axis=2)
+
+    def to_par_through(self, hole: int) -> np.ndarray:
+        """Each player's score relative to par after `hole` event holes"""
+        to_par = np.where(self.played[:, :hole], self.to_par[:, :hole], 0)
+        return to_par.sum(axis=1, dtype=np.int32)
+
+    def leaderboard_at(self, hole: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Standings after `hole` event holes.
+
+        Returns:
+            (order, positions): field indices best to worst, and each player's
+            position with ties sharing the best position; players who stopped
+            before `hole` rank below everyone still playing
+        """
+        score = self.to_par_through(hole)
+        stopped = self.holes_played < hole
+        order = np.lexsort((score, stopped))
+        ranked = np.stack([stopped[order], score[order]])
+        first_of_tie = np.concatenate([[True], np.any(ranked[:, 1:] != ranked[:, :-1], axis=0)])
+        ranked_positions = np.maximum.accumulate(np.where(first_of_tie, np.arange(1, len(order) + 1), 0))
+        positions = np.empty_like(ranked_positions)
+        positions[order] = ranked_positions
+        return order, positions
+
+    def scoring_average(self) -> np.ndarray:
+        """Average strokes per completed round for each player"""
+        round_scores = self.round_scores()
+        rounds_played = (round_scores > 0).sum(axis=1)
+        return round_scores.sum(axis=1) / np.maximum(rounds_played, 1)
+
+    def hole_stats(self) -> Dict[str, np.ndarray]:
+        """Per course hole (1-18): average to par and share of each score type"""
+        rounds = self.to_par.shape[1] // self.holes_per_round
+        by_hole = self.to_par.reshape(-1, rounds, self.holes_per_round).transpose(2, 0, 1).reshape(self.holes_per_round, -1)
+        played = by_hole != NOT_PLAYED
+        count = np.maximum(played.sum(axis=1), 1)
+        stats = {'average_to_par': np.where(played, by_hole, 0).sum(axis=1) / count}
+        for name, (low, high) in SCORE_TYPES.items():
+            stats[name] = (played & (by_hole >= low) & (by_hole <= high)).sum(axis=1) / count
+        return stats
+
+
+def create_scorecard_table(conn: sqlite3.Connection):
+    conn.execute(SCORECARD_SCHEMA)
+
+
+def save_scorecards(conn: sqlite3.Connection, tournament_id: int, player_ids: np.ndarray,
+                    strokes: np.ndarray, par: np.ndarray, holes_per_round: int = 18):
+    """
+    Store a tournament's hole-by-hole scores (replacing any previous scorecards).
+
+    Args:
+        conn: open database connection; the caller commits
+        tournament_id: tournament the scores belong to
+        player_ids: field player ids, in the row order of `strokes`
+        strokes: (n_players x event holes) strokes, 0 = not played
+        par: par of each event hole
+        holes_per_round: holes per round of the course
+    """
+    create_scorecard_table(conn)
+    scores = encode_scores(strokes, par)
+    conn.execute(f'''
+        INSERT OR REPLACE INTO {SCORECARD_TABLE}
+        (tournament_id, field_size, holes, holes_per_round, player_ids, par, scores)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        tournament_id, scores.shape[0], scores.shape[1], holes_per_round,
+        np.asarray(player_ids, dtype=np.int64).tobytes(),
+        np.asarray(par, dtype=np.int8).tobytes(),
+        np.ascontiguousarray(scores).tobytes()
+    ))
+
+
+def load_scorecards(conn: sqlite3.Connection, tournament_id: int) -> Optional[Scorecards]:
+    """Decode a tournament's scorecards; None if none were stored (read-only: no table is created)"""
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                        (SCORECARD_TABLE,)).fetchone():
+        return None
+    row = conn.execute(f'''
+        SELECT field_size, holes, holes_per_round, player_ids, par, scores
+        FROM {SCORECARD_TABLE}
+        WHERE tournament_id = ?
+    ''', (tournament_id,)).fetchone()
+    if not row:
+        return None
+    field_size, holes, holes_per_round, player_ids, par, scores = row
+    return Scorecards(
+        tournament_id=tournament_id,
+        player_ids=np.frombuffer(player_ids, dtype=np.int64),
+        par=np.frombuffer(par, dtype=np.int8).astype(np.int16),
+        to_par=np.frombuffer(scores, dtype=np.int8).reshape(field_size, holes),
+        holes_per_round=holes_per_round
+    )
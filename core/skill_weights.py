@@ -0,0 +1,55 @@
+"""
+Skill weighting by hole type.
+
+The simulation spec weights the five physical skills differently on par 3s,
+par 4s and par 5s. The 3x5 weight matrix lives in config/skill_weights.json;
+the roster's skill matrix is multiplied by it once, giving a per-player,
+per-par-type effective skill table, so hole simulation only has to index by
+the hole's par type.
+"""
+
+import json
+import os
+from typing import Optional
+
+import numpy as np
+
+PAR_TYPES = (3, 4, 5)
+PHYSICAL_SKILLS = ['driving_power', 'driving_accuracy', 'approach_accuracy', 'short_game', 'putting']
+
+SKILL_WEIGHTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'skill_weights.json')
+
+
+def load_skill_weights(path: Optional[str] = None) -> np.ndarray:
+    """Load the (3 par types x 5 physical skills) weight matrix from config"""
+    with open(path or SKILL_WEIGHTS_PATH, 'r') as f:
+        config = json.load(f)
+
+    if config['skills'] != PHYSICAL_SKILLS:
+        raise ValueError(f"Skill weights must be given in the order {PHYSICAL_SKILLS}")
+    weights = np.array([config[f'par_{par}']['weights'] for par in PAR_TYPES], dtype=np.float64)
+    if not np.allclose(weights.sum(axis=1), 1.0):
+        raise ValueError("Skill weights for each par type must sum to 1.0")
+    return weights
+
+
+def par_type_index(par: np.ndarray) -> np.ndarray:
+    """Row of the weight matrix for each hole's par (3 -> 0, 4 -> 1, 5 -> 2)"""
+    return np.clip(np.asarray(par) - PAR_TYPES[0], 0, len(PAR_TYPES) - 1)
+
+
+def effective_skills(skill_matrix: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Per-player, per-par-type effective physical skill.
+
+    Args:
+        skill_matrix: (n_players x 5+) skills; the first five columns are the physical skills
+        weights: (3 x 5) weight matrix, loaded from config when omitted
+
+    Returns:
+        (n_players x 3) table, column 0 = par 3, 1 = par 4, 2 = par 5
+    """
+    if weights is None:
+        weights = load_skill_weights()
+    physical = np.asarray(skill_matrix, dtype=np.float64)[:, :len(PHYSICAL_SKILLS)]
+    return physical @ weights.T
@@ -0,0 +1,250 @@
+"""
+Course-driven tournament simulator.
+
+Simulates stroke play for a whole field, hole by hole, directly from a
+compiled CourseModel. Each step is one array operation across the field:
+a player's rating against the hole's difficulty, plus uniform randomness,
+converted to strokes relative to the hole's par. Randomness comes from
+counter-based streams keyed by (event key, player, event hole), so any hole
+can be simulated on its own and reproduces exactly.
+
+The configured cut is applied after round 2 of events longer than two
+rounds; only the players who make it are simulated over the weekend rounds. Optional round weather scales hole
+difficulty and player ratings by (round, tee-time wave), and an optional
+MentalState adjusts each player's rating hole by hole.
+"""
+
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from .course_model import CourseModel
+from .cut_rules import CUT_AFTER_ROUNDS, apply_cut
+from .mental_state import MentalState
+from .rng_streams import SimulationStreams
+from .skill_weights import effective_skills, par_type_index
+from .weather import TournamentWeather
+
+# Physical skills: driving power, driving accuracy, approach, short game, putting
+PHYSICAL_WEIGHTS = np.array([0.25, 0.25, 0.20, 0.15, 0.15])
+# Mental skills: composure, confidence, focus, risk tolerance, mental fatigue, consistency, resilience
+MENTAL_WEIGHTS = np.array([0.20, 0.15, 0.20, 0.10, 0.10, 0.15, 0.10])
+PHYSICAL_SHARE = 0.7
+MENTAL_SHARE = 0.3
+
+# Performance points per stroke over par (performance 100 = par, 0 = par + 4)
+PERFORMANCE_PER_STROKE = 25.0
+
+
+def player_ratings(skill_matrix: np.ndarray) -> np.ndarray:
+    """Overall rating (70% physical, 30% mental) for each row of an (n_players x 12) skill matrix"""
+    skills = np.asarray(skill_matrix, dtype=np.float64)
+    physical_score = skills[:, :5] @ PHYSICAL_WEIGHTS
+    mental_score = skills[:, 5:] @ MENTAL_WEIGHTS
+    return physical_score * PHYSICAL_SHARE + mental_score * MENTAL_SHARE
+
+
+def hole_type_ratings(skill_matrix: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Ratings per par type for each row of an (n_players x 12) skill matrix.
+
+    The physical part uses the par-3/4/5 skill weights (config/skill_weights.json),
+    the mental part is the same on every hole. Returns (n_players x 3).
+    """
+    skills = np.asarray(skill_matrix, dtype=np.float64)
+    mental_score = skills[:, 5:] @ MENTAL_WEIGHTS
+    return effective_skills(skills, weights) * PHYSICAL_SHARE + (mental_score * MENTAL_SHARE)[:, None]
+
+
+@dataclass
+class TournamentResult:
+    """Outcome of a simulated tournament (arrays in field order unless noted)"""
+    player_ids: np.ndarray
+    strokes: np.ndarray       # (n_players, holes) strokes per event hole, 0 = not played
+    round_scores: np.ndarray  # (n_players, rounds), 0 = not played
+    totals: np.ndarray        # (n_players,)
+    order: np.ndarray         # field indices from best to worst
+    positions: np.ndarray     # (n_players,) 1 = best
+    made_cut: np.ndarray      # (n_players,) bool
+
+
+class TournamentSimulator:
+    """Simulates a tournament on one course for a whole field at once"""
+
+    def __init__(self, course: CourseModel, streams: SimulationStreams, key: Tuple[int, ...],
+                 rounds: int = 4, randomness: float = 15.0, cut_type: str = 'none',
+                 cut_value: Optional[int] = None, weather: Optional[TournamentWeather] = None,
+                 performance_per_stroke: float = PERFORMANCE_PER_STROKE, score_table=None):
+        if score_table is not None and not score_table.matches(randomness, performance_per_stroke):
+            raise ValueError("score_table was built for a different randomness or performance_per_stroke")
+        self.course = course
+        self.streams = streams
+        self.key = tuple(key)
+        self.rounds = rounds
+        self.randomness = randomness
+        self.cut_type = cut_type
+        self.cut_value = cut_value
+        self.weather = weather
+        self.performance_per_stroke = performance_per_stroke
+        self.score_table = score_table  # optional ScoreTable: strokes by lookup instead of arithmetic
+
+        event_holes = course.event_holes(rounds)
+        self.par = event_holes['par']
+        self.par_type = par_type_index(self.par)
+        self.difficulty = event_holes['difficulty']
+
+    @property
+    def total_holes(self) -> int:
+        return len(self.par)
+
+    def hole_performance(self, player_ids: np.ndarray, ratings: np.ndarray, event_hole: int,
+                         waves=0) -> np.ndarray:
+        """
+        Performance score (0-100) of every player on one event hole (1-based).
+
+        `ratings` is either one overall rating per player (n_players,) or a
+        per-par-type table (n_players x 3) from hole_type_ratings, in which
+        case the hole's column is looked up. `waves` (scalar or per player)
+        selects the tee-time wave's weather.
+        """
+        return self._performance(player_ids, ratings, self.par_type[event_hole - 1], self.difficulty[event_hole - 1],
+                                 (event_hole - 1) // self.course.holes, event_hole, waves)
+
+    def _performance(self, player_ids: np.ndarray, ratings: np.ndarray, par_type: int, difficulty: float,
+                     round_index: int, counter: int, waves) -> np.ndarray:
+        """Performance on a hole given its par type and difficulty; `counter` is the stream position"""
+        ratings, difficulty = self._hole_conditions(ratings, par_type, difficulty, round_index, waves)
+        randomness_u = self.streams.uniforms(self.key, player_ids, counter)
+        return self.performance_score(ratings, difficulty, randomness_u, self.randomness)
+
+    def _strokes(self, player_ids: np.ndarray, ratings: np.ndarray, par_type: int, difficulty: float, par: int,
+                 round_index: int, counter: int, waves) -> np.ndarray:
+        """Strokes on a hole, from the score table when one is set"""
+        ratings, difficulty = self._hole_conditions(ratings, par_type, difficulty, round_index, waves)
+        randomness_u = self.streams.uniforms(self.key, player_ids, counter)
+        if self.score_table is not None:
+            return self.score_table.strokes(ratings, difficulty, par, randomness_u)
+        performance = self.performance_score(ratings, difficulty, randomness_u, self.randomness)
+        return self.performance_to_strokes(performance, par, self.performance_per_stroke)
+
+    def _hole_conditions(self, ratings: np.ndarray, par_type: int, difficulty: float, round_index: int, waves):
+        """Players' ratings for the hole's par type and the hole difficulty, after weather"""
+        if ratings.ndim == 2:
+            ratings = ratings[:, par_type]
+        if self.weather is not None:
+            difficulty_multiplier, player_multiplier = self.weather.multipliers(round_index, waves)
+            difficulty = difficulty * difficulty_multiplier
+            ratings = ratings * player_multiplier
+        return ratings, difficulty
+
+    @staticmethod
+    def performance_score(ratings: np.ndarray, difficulty, randomness_u: np.ndarray,
+                          randomness: float) -> np.ndarray:
+        """Performance (0-100) from ratings, hole difficulty and uniforms in [0, 1) (all broadcast)"""
+        # Higher player rating and lower hole difficulty = better performance
+        performance_score = np.clip(ratings / (difficulty + 1) * 50, 0, 100)
+        return np.clip(performance_score + (2.0 * randomness_u - 1.0) * randomness, 0, 100)
+
+    @staticmethod
+    def performance_to_strokes(performance_score: np.ndarray, hole_par,
+                               performance_per_stroke: float = PERFORMANCE_PER_STROKE) -> np.ndarray:
+        """
+        Convert performance scores to stroke counts.
+
+        Performance 100 = par, 0 = par + 4 (at the default 25 points per
+        stroke); rounded half to even, minimum 1.
+        """
+        strokes = hole_par + (100 - performance_score) / performance_per_stroke
+        return np.maximum(1, np.rint(strokes)).astype(np.int16)
+
+    def simulate_hole(self, player_ids: np.ndarray, ratings: np.ndarray, event_hole: int,
+                      waves=0) -> np.ndarray:
+        """Strokes for every player on one event hole"""
+        hole = event_hole - 1
+        return self._strokes(player_ids, ratings, self.par_type[hole], self.difficulty[hole], self.par[hole],
+                             hole // self.course.holes, event_hole, waves)
+
+    def simulate_playoff_hole(self, player_ids: np.ndarray, ratings: np.ndarray, playoff_hole: int,
+                              course_hole: int, waves=0) -> np.ndarray:
+        """
+        Strokes for the players in a playoff on one extra hole.
+
+        `playoff_hole` (1-based) continues each player's stream after the last
+        event hole; `course_hole` is the course hole being replayed. Final
+        round weather applies.
+        """
+        hole = course_hole - 1
+        return self._strokes(player_ids, ratings, par_type_index(self.course.par[hole]), self.course.difficulty[hole],
+                             self.course.par[hole], self.rounds - 1, self.total_holes + playoff_hole, waves)
+
+    def mental_ratings(self, ratings: np.ndarray, mental: MentalState, event_hole: int, index=slice(None)):
+        """Ratings adjusted by each player's current mental state for one event hole"""
+        round_number = (event_hole - 1) // self.course.holes + 1
+        hole_in_round = event_hole - (round_number - 1) * self.course.holes
+        pressure = mental.hole_pressure(hole_in_round, round_number, self.rounds, self.course.holes)
+        multiplier = mental.rating_multiplier(pressure, index)
+        return ratings * (multiplier[:, None] if ratings.ndim == 2 else multiplier)
+
+    def play(self, player_ids: np.ndarray, ratings: np.ndarray, waves=0,
+             mental: Optional[MentalState] = None) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Play the event hole by hole, cutting after round 2.
+
+        Yields (event_hole, strokes, made_cut) after each event hole: `strokes`
+        is the (n_players x holes) array filled in so far (0 = not played) and
+        `made_cut` is all True until the cut is made at the end of round 2.
+        Both are updated in place, so copy them to keep a snapshot. `mental`
+        is the field's MentalState (updated in place through the cut round).
+        """
+        player_ids = np.asarray(player_ids)
+        ratings = np.asarray(ratings, dtype=np.float64)
+        waves = np.broadcast_to(waves, player_ids.shape)
+        n_players = len(player_ids)
+        holes = self.course.holes
+        # Events of two rounds or fewer end before the cut would be made
+        cut_hole = CUT_AFTER_ROUNDS * holes if self.rounds > CUT_AFTER_ROUNDS else None
+
+        strokes = np.zeros((n_players, self.rounds * holes), dtype=np.int16)
+        made_cut = np.ones(n_players, dtype=bool)
+        active = slice(None)
+        for round_number in range(1, self.rounds + 1):
+            if mental is not None:
+                mental.start_round()
+            for event_hole in range((round_number - 1) * holes + 1, round_number * holes + 1):
+                hole_ratings = ratings[active]
+                if mental is not None:
+                    hole_ratings = self.mental_ratings(hole_ratings, mental, event_hole)
+                hole_strokes = self.simulate_hole(player_ids[active], hole_ratings, event_hole, waves[active])
+                strokes[active, event_hole - 1] = hole_strokes
+                if mental is not None:
+                    mental.update(hole_strokes - self.par[event_hole - 1])
+
+                if event_hole == cut_hole:
+                    made_cut[:] = apply_cut(strokes.sum(axis=1), self.cut_type, self.cut_value)
+                    if not made_cut.all():
+                        # Only the survivors play the weekend
+                        active = np.flatnonzero(made_cut)
+                        if mental is not None:
+                            mental = mental.subset(active)
+                yield event_hole, strokes, made_cut
+
+    def simulate(self, player_ids: np.ndarray, ratings: np.ndarray, waves=0,
+                 mental: Optional[MentalState] = None) -> TournamentResult:
+        """
+        Simulate all rounds for the field, cutting after round 2.
+
+        Players who make the cut rank ahead of those who miss it; within each
+        group lower total is better and ties stay in field order. `mental` is
+        the field's MentalState (updated in place through the cut round).
+        """
+        player_ids = np.asarray(player_ids)
+        for _, strokes, made_cut in self.play(player_ids, ratings, waves, mental):
+            pass
+
+        round_scores = strokes.reshape(len(player_ids), self.rounds, self.course.holes).sum(axis=2)
+        totals = round_scores.sum(axis=1)
+        order = np.lexsort((totals, ~made_cut))
+        positions = np.empty_like(order)
+        positions[order] = np.arange(1, len(order) + 1)
+        return TournamentResult(player_ids, strokes, round_scores, totals, order, positions, made_cut)
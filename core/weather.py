@@ -0,0 +1,199 @@
+"""
+Round weather for tournament simulation.
+
+Generates weather once per tournament - per round, and optionally per AM/PM
+tee-time wave - from the course's monthly normals in course_monthly_weather,
+then reduces it to the 0-1 weather factors from docs/SIMULATION_LOGIC.md and
+two multipliers per (round, wave):
+
+    hole difficulty  X = X_base * (1 + 0.15 * wind + 0.20 * rain + 0.05 * cloudiness)
+    player rating    Y = Y_base * (1 - (0.25 * wind + 0.20 * rain + 0.15 * temp + 0.05 * humidity) / 4)
+
+The multipliers are small (rounds x waves) arrays; simulators index them with
+each player's wave and broadcast over the field, so weather costs no
+per-player Python work.
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .rng_streams import SimulationStreams
+
+WEATHER_COLUMNS = ['cloud_cover', 'wind_speed', 'rain_probability', 'humidity', 'min_temp', 'mean_temp', 'max_temp']
+
+# Used when a course has no normals for the month
+DEFAULT_NORMALS = {
+    'cloud_cover': 30.0, 'wind_speed': 10.0, 'rain_probability': 20.0, 'humidity': 50.0,
+    'min_temp': 60.0, 'mean_temp': 70.0, 'max_temp': 80.0
+}
+
+# Environmental weights from docs/SIMULATION_LOGIC.md
+DIFFICULTY_WEIGHTS = {'wind': 0.15, 'rain': 0.20, 'cloudiness': 0.05}
+PLAYER_PENALTY_WEIGHTS = {'wind': 0.25, 'rain': 0.20, 'temp': 0.15, 'humidity': 0.05}
+# The spec's penalty weights sum to 0.65; scale so a worst-case day costs ~16% of a rating
+PLAYER_PENALTY_SCALE = 0.25
+
+WIND_FACTOR_MPH = 30.0       # wind at which wind_factor reaches 1
+COMFORT_TEMP = 70.0          # temperature with no temp_factor penalty
+TEMP_FACTOR_RANGE = 35.0     # degrees from comfort at which temp_factor reaches 1
+PM_WIND_INCREASE = 1.2       # afternoon wind relative to morning
+
+# Stream slot separating weather draws from scoring draws
+WEATHER_STREAM = 7
+
+
+@dataclass
+class TournamentWeather:
+    """Weather and its multipliers for every (round, wave) of a tournament"""
+    temp: np.ndarray         # (rounds, waves) degrees F
+    wind: np.ndarray         # (rounds, waves) mph
+    rain: np.ndarray         # (rounds, waves) 0-1 intensity, 0 = dry
+    humidity: np.ndarray     # (rounds, waves) %
+    cloud_cover: np.ndarray  # (rounds, waves) %
+    factors: Dict[str, np.ndarray] = field(init=False)
+    difficulty_multiplier: np.ndarray = field(init=False)
+    player_multiplier: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        self.factors = {
+            'wind': np.clip(self.wind / WIND_FACTOR_MPH, 0, 1),
+            'rain': np.clip(self.rain, 0, 1),
+            'temp': np.clip(np.abs(self.temp - COMFORT_TEMP) / TEMP_FACTOR_RANGE, 0, 1),
+            'humidity': np.clip((self.humidity - 50) / 50, 0, 1),
+            'cloudiness': np.clip(self.cloud_cover / 100, 0, 1)
+        }
+        self.difficulty_multiplier = 1 + sum(
+            weight * self.factors[name] for name, weight in DIFFICULTY_WEIGHTS.items())
+        self.player_multiplier = 1 - PLAYER_PENALTY_SCALE * sum(
+            weight * self.factors[name] for name, weight in PLAYER_PENALTY_WEIGHTS.items())
+
+    @property
+    def rounds(self) -> int:
+        return self.temp.shape[0]
+
+    @property
+    def waves(self) -> int:
+        return self.temp.shape[1]
+
+    def multipliers(self, round_index: int, waves=0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (difficulty, player) multipliers for one round.
+
+        `waves` is a scalar or each player's wave array; the result broadcasts
+        against the field.
+        """
+        waves = np.minimum(waves, self.waves - 1)
+        return self.difficulty_multiplier[round_index, waves], self.player_multiplier[round_index, waves]
+
+    def hole_multipliers(self, holes_per_round: int, waves=0) -> Tuple[np.ndarray, np.ndarray]:
+        """Multipliers over every event hole: shape (..., rounds * holes) for field x hole arrays"""
+        waves = np.minimum(np.asarray(waves), self.waves - 1)[..., None]
+        difficulty = np.repeat(self.difficulty_multiplier.T, holes_per_round, axis=1)
+        player = np.repeat(self.player_multiplier.T, holes_per_round, axis=1)
+        return difficulty[waves, np.arange(difficulty.shape[1])], player[waves, np.arange(player.shape[1])]
+
+    def as_rows(self):
+        """Per-round, per-wave weather for display"""
+        return [
+            {
+                'round': r + 1, 'wave': w, 'temp': round(float(self.temp[r, w]), 1),
+                'wind': round(float(self.wind[r, w]), 1), 'rain': round(float(self.rain[r, w]), 2),
+                'humidity': round(float(self.humidity[r, w])), 'cloud_cover': round(float(self.cloud_cover[r, w]))
+            }
+            for r in range(self.rounds) for w in range(self.waves)
+        ]
+
+
+def generate_weather(normals, rng: np.random.Generator, waves: int = 1) -> TournamentWeather:
+    """
+    Draw round weather around monthly normals.
+
+    Args:
+        normals: one dict of WEATHER_COLUMNS per round (the month each round is played in)
+        rng: random generator for the tournament's weather
+        waves: 1, or 2 for separate AM/PM wave conditions
+
+    Returns:
+        TournamentWeather with (rounds, waves) arrays
+    """
+    table = {column: np.array([[n[column]] for n in normals], dtype=np.float64) for column in WEATHER_COLUMNS}
+    rounds = len(normals)
+    shape = (rounds, waves)
+
+    # One daily draw per round, shared by both waves...
+    daily_temp = table['mean_temp'] + rng.normal(0, 1, (rounds, 1)) * (table['max_temp'] - table['min_temp']) / 4
+    daily_wind = table['wind_speed'] * rng.gamma(8.0, 1 / 8.0, (rounds, 1))
+    raining = rng.random((rounds, 1)) < table['rain_probability'] / 100
+    daily_rain = np.where(raining, rng.uniform(0.2, 1.0, (rounds, 1)), 0.0)
+    humidity = np.clip(table['humidity'] + rng.normal(0, 5, (rounds, 1)), 20, 100)
+    cloud_cover = np.clip(table['cloud_cover'] + rng.normal(0, 10, (rounds, 1)), 0, 100)
+
+    # ...then the afternoon wave is warmer and windier than the morning
+    if waves > 1:
+        wave_position = np.linspace(-1, 1, waves)
+        spread = (table['max_temp'] - table['min_temp']) / 4
+        temp = daily_temp + spread * wave_position
+        wind = daily_wind * np.linspace(1.0, PM_WIND_INCREASE, waves)
+    else:
+        temp, wind = daily_temp, daily_wind
+
+    return TournamentWeather(
+        temp=np.broadcast_to(temp, shape).copy(),
+        wind=np.broadcast_to(np.maximum(wind, 0), shape).copy(),
+        rain=np.broadcast_to(daily_rain, shape).copy(),
+        humidity=np.broadcast_to(humidity, shape).copy(),
+        cloud_cover=np.broadcast_to(cloud_cover, shape).copy()
+    )
+
+
+def load_monthly_normals(conn: sqlite3.Connection, course_id: int) -> Dict[int, Dict[str, float]]:
+    """Monthly weather normals for a course from course_monthly_weather, keyed by month (1-12)"""
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT month, {', '.join(WEATHER_COLUMNS)}
+        FROM course_monthly_weather
+        WHERE course_id = ?
+    ''', (course_id,))
+    return {row[0]: dict(zip(WEATHER_COLUMNS, row[1:])) for row in cursor.fetchall()}
+
+
+def tournament_weather(course_id: int, start_date: Optional[str], streams: SimulationStreams, key: Tuple[int, ...],
+                       rounds: int = 4, waves: int = 1, db_path: Optional[str] = None) -> TournamentWeather:
+    """
+    Weather for a whole tournament, created once before the first round.
+
+    Args:
+        course_id: course the event is played on
+        start_date: first round date (YYYY-MM-DD); later rounds are on consecutive days.
+            None (not scheduled yet) uses DEFAULT_NORMALS for every round
+        streams: the tournament's random streams
+        key: the tournament's stream key; weather draws use their own stream under it
+        rounds: number of rounds
+        waves: 1, or 2 for AM/PM waves
+        db_path: golf_courses.db (defaults to config.COURSE_DB_PATH)
+
+    Returns:
+        TournamentWeather for the event
+    """
+    if start_date is None:
+        # No month to take the course's normals from
+        return generate_weather([DEFAULT_NORMALS] * rounds, streams.generator(*key, WEATHER_STREAM), waves)
+
+    if db_path is None:
+        import sys
+        sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+        from config import COURSE_DB_PATH as db_path
+    conn = sqlite3.connect(db_path)
+    try:
+        monthly = load_monthly_normals(conn, course_id)
+    finally:
+        conn.close()
+
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    normals = [monthly.get((start + timedelta(days=r)).month, DEFAULT_NORMALS) for r in range(rounds)]
+    return generate_weather(normals, streams.generator(*key, WEATHER_STREAM), waves)
@@ -6,6 +6,10 @@ Creates the comprehensive prehistory database with all required tables.
 
 import sqlite3
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+from core.migrations import migrate
 
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), '../../../data/prehistory.db')
@@ -185,6 +189,7 @@ def create_prehistory_database():
         ''')
         
         conn.commit()
+        migrate(conn)
         print("✅ Prehistory database created successfully!")
         print(f"   Database path: {DB_PATH}")
         print("   Tables created:")
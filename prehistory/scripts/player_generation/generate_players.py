@@ -239,58 +239,73 @@ def insert_player(conn, player_data):
         player_data['introduction_season'], player_data['introduction_event'], player_data['current_status'],
         player_data['created_at'], player_data['last_updated']
     ))
-    conn.commit()
 
 def generate_players(
     num_players=600, 
     age_min=19, age_max=22, 
     introduction_season=0, introduction_event=0, 
-    name_suffix=None
+    name_suffix=None, age_players=True, conn=None, report=True
 ):
-    conn = sqlite3.connect(DB_PATH)
+    """
+    Generate and insert new players; returns their ids.
     
-    # Age up all existing players by 1 year before generating new ones
-    cursor = conn.cursor()
-    cursor.execute("UPDATE players SET age = age + 1")
-    aged_count = cursor.rowcount
-    print(f"✅ Aged up {aged_count} existing players by 1 year")
+    With `age_players` every existing player is first aged by 1 year (pass
+    False when aging is a separate step, as in a complete season run). With
+    `conn` the inserts run on the caller's connection and transaction;
+    otherwise the prehistory database is opened and committed here.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(DB_PATH)
     
-    created = 0
-    new_player_ids = []
-    for _ in range(num_players):
-        nationality = weighted_random_nationality()
-        name = generate_player_name(nationality)
-        if name_suffix:
-            name = f"{name} {name_suffix}"
-        age = random.randint(age_min, age_max)
-        attrs = generate_player_attributes()
-        now = datetime.now().isoformat()
-        player_data = {
-            'name': name,
-            'age': age,
-            'nationality': nationality,
-            **attrs,
-            'introduction_season': introduction_season,
-            'introduction_event': introduction_event,
-            'current_status': 'active',
-            'created_at': now,
-            'last_updated': now
-        }
-        insert_player(conn, player_data)
-        # Get the last inserted player id
-        new_player_ids.append(conn.execute('SELECT last_insert_rowid()').fetchone()[0])
-        created += 1
-    conn.close()
-    print(f"✅ Generated and inserted {created} players into the prehistory database.")
-    # Generate markdown report
-    generate_full_player_pool_report(new_player_ids)
+    try:
+        if age_players:
+            # Age up all existing players by 1 year before generating new ones
+            cursor = conn.cursor()
+            cursor.execute("UPDATE players SET age = age + 1")
+            aged_count = cursor.rowcount
+            print(f"✅ Aged up {aged_count} existing players by 1 year")
+        
+        created = 0
+        new_player_ids = []
+        for _ in range(num_players):
+            nationality = weighted_random_nationality()
+            name = generate_player_name(nationality)
+            if name_suffix:
+                name = f"{name} {name_suffix}"
+            age = random.randint(age_min, age_max)
+            attrs = generate_player_attributes()
+            now = datetime.now().isoformat()
+            player_data = {
+                'name': name,
+                'age': age,
+                'nationality': nationality,
+                **attrs,
+                'introduction_season': introduction_season,
+                'introduction_event': introduction_event,
+                'current_status': 'active',
+                'created_at': now,
+                'last_updated': now
+            }
+            insert_player(conn, player_data)
+            # Get the last inserted player id
+            new_player_ids.append(conn.execute('SELECT last_insert_rowid()').fetchone()[0])
+            created += 1
+        print(f"✅ Generated and inserted {created} players into the prehistory database.")
+        if report:
+            # Generate markdown report
+            generate_full_player_pool_report(new_player_ids, conn)
+        if own_conn:
+            conn.commit()
+    finally:
+        if own_conn:
+            conn.close()
+    return new_player_ids
 
 
-def generate_full_player_pool_report(new_player_ids):
+def generate_full_player_pool_report(new_player_ids, conn):
     """Generate a markdown report of the full player pool, highlighting new players."""
-    db_path = DB_PATH
     output_path = os.path.join(os.path.dirname(__file__), '..', '..', 'reports', 'player_pool_with_new_players_latest.md')
-    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     cursor.execute('''
         SELECT id, name, age, nationality, introduction_season, introduction_event, created_at
@@ -299,7 +314,6 @@ def generate_full_player_pool_report(new_player_ids):
         ORDER BY introduction_season, introduction_event, created_at
     ''')
     players = cursor.fetchall()
-    conn.close()
     
     # Prepare markdown
     markdown = []
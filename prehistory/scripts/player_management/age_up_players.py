@@ -7,12 +7,15 @@ Increments the age of all players (active and inactive) by 1 year in the prehist
 import sqlite3
 import os
 
+def age_players(conn: sqlite3.Connection) -> int:
+    """Age every player by 1 year on `conn` (the caller commits); returns the number of players aged"""
+    return conn.execute("UPDATE players SET age = age + 1").rowcount
+
 def age_up_players():
     db_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'prehistory.db')
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
     try:
-        cursor.execute("UPDATE players SET age = age + 1")
+        age_players(conn)
         conn.commit()
         print("✅ All players have been aged up by 1 year.")
     except Exception as e:
@@ -22,4 +25,4 @@ def age_up_players():
         conn.close()
 
 if __name__ == "__main__":
-    age_up_players() 
\ No newline at end of file
+    age_up_players() 
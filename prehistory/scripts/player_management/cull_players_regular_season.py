@@ -62,63 +62,75 @@ def generate_post_culling_report(advancing_players, relegated_players, season_nu
         print(f"📊 Players remaining: 0")
         print("⚠️  All players were relegated!")
 
+def relegate_players(conn, season_num=1, num_to_relegate=50, report=True):
+    """
+    Mark the bottom `num_to_relegate` players of the season inactive on `conn`.
+    
+    The caller commits. Returns False (nothing written) when the season has
+    no standings or too few players. With `report` the post-culling
+    leaderboard is written to the reports directory.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM players WHERE current_status = 'active'")
+    total_players = cursor.fetchone()[0]
+    print(f"📊 Current active player count: {total_players}")
+    
+    # Get all players with their season stats, ordered by points
+    cursor.execute(f"""
+        SELECT p.id, p.name, p.age, p.nationality, sps.total_season_points
+        FROM players p
+        JOIN season_player_stats sps ON p.id = sps.player_id
+        WHERE sps.season_id = ? AND p.current_status = 'active'
+        ORDER BY sps.total_season_points DESC
+    """, (season_num,))
+    all_players = cursor.fetchall()
+    
+    if len(all_players) == 0:
+        print("❌ No players found with season stats!")
+        return False
+    
+    if len(all_players) <= num_to_relegate:
+        print(f"⚠️  Warning: Only {len(all_players)} players found, but {num_to_relegate} requested to relegate")
+        print("   This would relegate ALL players, which is not allowed.")
+        print("   Please reduce the number of players to relegate.")
+        return False
+    
+    # Split into advancing and relegated players
+    advancing_players = all_players[:-num_to_relegate]  # Top players
+    relegated_players = all_players[-num_to_relegate:]  # Bottom players
+    
+    relegated_player_ids = [row[0] for row in relegated_players]
+    print(f"\n⚠️  About to mark {len(relegated_player_ids)} players as inactive")
+    print(f"   Bottom player: {relegated_players[-1][1]} ({relegated_players[-1][4]} points)")
+    print(f"   Top relegated: {relegated_players[0][1]} ({relegated_players[0][4]} points)")
+    print(f"   Players advancing: {len(advancing_players)}")
+    print(f"   DEBUG: Total players with stats: {len(all_players)}")
+    print(f"   DEBUG: Advancing players count: {len(advancing_players)}")
+    print(f"   DEBUG: Relegated players count: {len(relegated_players)}")
+    
+    # Mark relegated players as inactive (preserve all historical data)
+    placeholders = ','.join(['?' for _ in relegated_player_ids])
+    cursor.execute(f"UPDATE players SET current_status = 'inactive' WHERE id IN ({placeholders})", relegated_player_ids)
+    
+    cursor.execute("SELECT COUNT(*) FROM players WHERE current_status = 'active'")
+    new_total = cursor.fetchone()[0]
+    print(f"\n✅ Player culling complete!")
+    print(f"   Players relegated: {len(relegated_player_ids)}")
+    print(f"   Players remaining: {new_total}")
+    print(f"   Historical data preserved for relegated players")
+    if report:
+        generate_post_culling_report(advancing_players, relegated_players, season_num)
+    return True
+
 def cull_players_regular_season(season_num=1, num_to_relegate=50):
     db_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'prehistory.db')
     print(f"🗑️  REGULAR SEASON {season_num} PLAYER CULLING PROCESS")
     print("=" * 60)
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT COUNT(*) FROM players WHERE current_status = 'active'")
-        total_players = cursor.fetchone()[0]
-        print(f"📊 Current active player count: {total_players}")
-        
-        # Get all players with their season stats, ordered by points
-        cursor.execute(f"""
-            SELECT p.id, p.name, p.age, p.nationality, sps.total_season_points
-            FROM players p
-            JOIN season_player_stats sps ON p.id = sps.player_id
-            WHERE sps.season_id = ? AND p.current_status = 'active'
-            ORDER BY sps.total_season_points DESC
-        """, (season_num,))
-        all_players = cursor.fetchall()
-        
-        if len(all_players) == 0:
-            print("❌ No players found with season stats!")
-            return False
-        
-        if len(all_players) <= num_to_relegate:
-            print(f"⚠️  Warning: Only {len(all_players)} players found, but {num_to_relegate} requested to relegate")
-            print("   This would relegate ALL players, which is not allowed.")
-            print("   Please reduce the number of players to relegate.")
-            return False
-        
-        # Split into advancing and relegated players
-        advancing_players = all_players[:-num_to_relegate]  # Top players
-        relegated_players = all_players[-num_to_relegate:]  # Bottom players
-        
-        relegated_player_ids = [row[0] for row in relegated_players]
-        print(f"\n⚠️  About to mark {len(relegated_player_ids)} players as inactive")
-        print(f"   Bottom player: {relegated_players[-1][1]} ({relegated_players[-1][4]} points)")
-        print(f"   Top relegated: {relegated_players[0][1]} ({relegated_players[0][4]} points)")
-        print(f"   Players advancing: {len(advancing_players)}")
-        print(f"   DEBUG: Total players with stats: {len(all_players)}")
-        print(f"   DEBUG: Advancing players count: {len(advancing_players)}")
-        print(f"   DEBUG: Relegated players count: {len(relegated_players)}")
-        
-        # Mark relegated players as inactive (preserve all historical data)
-        placeholders = ','.join(['?' for _ in relegated_player_ids])
-        cursor.execute(f"UPDATE players SET current_status = 'inactive' WHERE id IN ({placeholders})", relegated_player_ids)
-        
+        success = relegate_players(conn, season_num, num_to_relegate)
         conn.commit()
-        cursor.execute("SELECT COUNT(*) FROM players WHERE current_status = 'active'")
-        new_total = cursor.fetchone()[0]
-        print(f"\n✅ Player culling complete!")
-        print(f"   Players relegated: {len(relegated_player_ids)}")
-        print(f"   Players remaining: {new_total}")
-        print(f"   Historical data preserved for relegated players")
-        generate_post_culling_report(advancing_players, relegated_players, season_num)
-        return True
+        return success
     except Exception as e:
         print(f"❌ Error during player culling: {e}")
         conn.rollback()
@@ -7,11 +7,21 @@ It incorporates all player skills into a performance formula for realistic resul
 """
 
 import sqlite3
-import random
 import os
+import sys
 import csv
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+from core.field_simulator import FieldSimulator
+from core.result_writer import (BULK_LOAD_PRAGMAS, REGULAR_SEASON_RESULTS, SEASON_STANDINGS, TOURNAMENTS,
+                                ResultWriter, connect)
+from core.rng_streams import SimulationStreams
 
 class PlayerSkills:
     """Represents a player's golf skills and attributes"""
@@ -71,69 +81,51 @@ class PlayerSkills:
             self.resilience * weights['resilience']
         )
         return total
-    
-    def get_event_performance(self, event_id: int, seed: int = None) -> float:
-        """Calculate total performance for a 72-hole event, with per-event luck"""
-        # Use a unique seed for this event/player combination
-        if seed is not None:
-            event_player_seed = seed + event_id * 1000 + self.player_id
-            random.seed(event_player_seed)
-        
-        # Per-event luck modifier (±25% of total skill) - increased randomness
-        event_luck_factor = random.uniform(-0.25, 0.25)
-        event_luck = self.total_skill * event_luck_factor
-        
-        total_performance = 0
-        for hole in range(1, 73):
-            hole_performance = self.get_hole_performance(hole, seed, event_luck, event_id)
-            total_performance += hole_performance
-        return total_performance
 
-    def get_hole_performance(self, hole_number: int, seed: int = None, event_luck: float = 0.0, event_id: int = None) -> float:
-        """Calculate performance for a single hole, with increased randomness and event luck"""
-        # Use a unique seed for each hole to ensure maximum randomness
-        if seed is not None and event_id is not None:
-            hole_seed = seed + event_id * 1000 + self.player_id * 100 + hole_number
-            random.seed(hole_seed)
-        
-        base_performance = self.total_skill + event_luck
-        
-        # Increase randomness factor (±80% of base skill) - much more randomness
-        randomness_factor = random.uniform(-0.80, 0.80)
-        random_adjustment = base_performance * randomness_factor
-        
-        # Add additional per-hole randomness
-        hole_randomness = random.uniform(-0.20, 0.20) * base_performance
-        
-        fatigue_factor = 1.0 - (hole_number / 72) * 0.05  # Max 5% decline
-        pressure_factor = 1.0 + (self.composure - 65) / 1000  # ±3.5%
-        
-        hole_performance = (base_performance + random_adjustment + hole_randomness) * fatigue_factor * pressure_factor
-        return max(0, min(100, hole_performance))
+def _simulate_event_worker(args: Tuple) -> List[Dict]:
+    """Process-pool entry point: simulate one event of a season"""
+    db_path, season_num, event_num, players, season_seed = args
+    return RegularSeasonSimulator(db_path, season_num).simulate_event(event_num, players, season_seed)
 
 class RegularSeasonSimulator:
     """Simulates a regular season with 35 events"""
     
-    def __init__(self, db_path: str, season_num: int = 1):
+    def __init__(self, db_path: str, season_num: int = 1, conn: sqlite3.Connection = None, bulk_load: bool = False):
         self.db_path = db_path
         self.season_num = season_num
+        self.conn = conn  # shared connection; its owner commits, e.g. SeasonRunner's stage transaction
+        self.bulk_load = bulk_load  # open own connections with the bulk-load pragma profile
         self.players = []
         self.season_results = {}
+        self.season_standings = []
+        self.field_simulator = FieldSimulator()
+    
+    @contextmanager
+    def _connection(self):
+        """The shared connection, or a new one committed on success and closed"""
+        if self.conn is not None:
+            yield self.conn
+            return
+        conn = connect(self.db_path, BULK_LOAD_PRAGMAS if self.bulk_load else None)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
         
     def load_active_players(self, seed: int = None) -> List[PlayerSkills]:
         """Load all active players and their skills (skills fixed for the season)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, name, age, nationality, driving_power, driving_accuracy, approach_accuracy, 
-                   short_game, putting, composure, confidence, focus, risk_tolerance, 
-                   mental_fatigue, consistency, resilience
-            FROM players 
-            WHERE current_status = 'active'
-            ORDER BY id
-        """)
+        with self._connection() as conn:
+            rows = conn.execute("""
+                SELECT id, name, age, nationality, driving_power, driving_accuracy, approach_accuracy, 
+                       short_game, putting, composure, confidence, focus, risk_tolerance, 
+                       mental_fatigue, consistency, resilience
+                FROM players 
+                WHERE current_status = 'active'
+                ORDER BY id
+            """).fetchall()
         players = []
-        for row in cursor.fetchall():
+        for row in rows:
             player_data = {
                 'id': row[0],
                 'name': row[1],
@@ -153,53 +145,87 @@ class RegularSeasonSimulator:
                 'resilience': row[15]
             }
             players.append(PlayerSkills(player_data))
-        conn.close()
         print(f"📊 Loaded {len(players)} active players")
         return players
     
     def simulate_event(self, event_num: int, players: List[PlayerSkills], season_seed: int = None) -> List[Dict]:
         """Simulate a single event (72 holes) with unique randomness per event"""
         print(f"🏌️  Simulating Event {event_num}...")
-        event_seed = (season_seed or 0) + event_num
+        # Each (season, event, player, hole) draws from its own stream of the season seed
+        streams = SimulationStreams(season_seed or 0)
+        player_ids = np.array([p.player_id for p in players])
+        total_skill = np.array([p.total_skill for p in players])
+        composure = np.array([p.composure for p in players])
+        uniforms = self.field_simulator.stream_uniforms(streams, (self.season_num, event_num), player_ids)
+        field = self.field_simulator.simulate(total_skill, composure, uniforms=uniforms)
         event_results = []
-        for player in players:
-            performance = player.get_event_performance(event_num, event_seed)
+        for i, idx in enumerate(field.order):
+            player = players[idx]
             event_results.append({
                 'player_id': player.player_id,
                 'name': player.name,
                 'nationality': player.nationality,
-                'performance': performance
+                'performance': float(field.totals[idx]),
+                'rank': i + 1,
+                'points': 151 - (i + 1)
             })
-        event_results.sort(key=lambda x: x['performance'], reverse=True)
-        for i, result in enumerate(event_results):
-            result['rank'] = i + 1
-            result['points'] = 151 - (i + 1)
         return event_results
     
+    def simulate_events(self, players: List[PlayerSkills], season_seed: int = None,
+                        num_events: int = 35, workers: int = 1, first_event: int = 1) -> List[List[Dict]]:
+        """
+        Simulate events first_event..num_events of the season, optionally across a process pool.
+        
+        Skills are fixed for the season and every event draws from its own
+        streams, so events are independent and the merged results (in event
+        order) are identical to a serial run.
+        """
+        event_nums = range(first_event, num_events + 1)
+        if workers <= 1:
+            return [self.simulate_event(event_num, players, season_seed) for event_num in event_nums]
+        
+        print(f"⚙️  Simulating {len(event_nums)} events across {workers} worker processes")
+        tasks = [(self.db_path, self.season_num, event_num, players, season_seed) for event_num in event_nums]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_simulate_event_worker, tasks))
+    
     def save_event_results(self, event_results: List[Dict], event_num: int):
         """Save event results to database using correct schema columns"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        try:
-            cursor.execute("""
-                INSERT INTO tournaments (season_number, event_number, name, field_size, status)
-                VALUES (?, ?, ?, ?, ?)
-            """, (self.season_num, event_num, f"Season {self.season_num} Event {event_num}", len(event_results), 'completed'))
-            tournament_id = cursor.lastrowid
-            for result in event_results:
-                cursor.execute("""
-                    INSERT INTO tournament_results (tournament_id, player_id, position, total_score, points_earned)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (tournament_id, result['player_id'], result['rank'], int(result['performance']), result['points']))
-            conn.commit()
-            print(f"✅ Event {event_num} results saved to database")
-        except Exception as e:
-            print(f"❌ Error saving event results: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
+        with self._connection() as conn, ResultWriter(conn) as writer:
+            self._write_event_results(writer, event_results, event_num)
+        print(f"✅ Event {event_num} results saved to database")
     
-
+    def load_event_results(self, event_num: int) -> List[Dict]:
+        """Read a saved event back in simulate_event's format (performance as saved, rounded down)"""
+        with self._connection() as conn:
+            rows = conn.execute("""
+                SELECT tr.player_id, p.name, p.nationality, tr.total_score, tr.position, tr.points_earned
+                FROM tournaments t
+                JOIN tournament_results tr ON tr.tournament_id = t.id
+                JOIN players p ON p.id = tr.player_id
+                WHERE t.season_number = ? AND t.event_number = ?
+                ORDER BY tr.position
+            """, (self.season_num, event_num)).fetchall()
+        return [{'player_id': row[0], 'name': row[1], 'nationality': row[2], 'performance': float(row[3]),
+                 'rank': row[4], 'points': row[5]} for row in rows]
+    
+    def _write_event_results(self, writer: ResultWriter, event_results: List[Dict], event_num: int):
+        tournament_id = writer.insert(TOURNAMENTS, (self.season_num, event_num, f"Season {self.season_num} Event {event_num}",
+                                                    len(event_results), 'completed'))
+        writer.extend(REGULAR_SEASON_RESULTS, [
+            (tournament_id, result['player_id'], result['rank'], int(result['performance']), result['points'])
+            for result in event_results
+        ])
+    
+    def save_season_results(self, all_event_results: List[List[Dict]], season_standings: List[Dict],
+                            first_event: int = 1):
+        """Save the events from first_event on and the season standings in one transaction"""
+        with self._connection() as conn, ResultWriter(conn) as writer:
+            for event_num, event_results in enumerate(all_event_results, first_event):
+                self._write_event_results(writer, event_results, event_num)
+            self._write_season_standings(writer, season_standings)
+        print(f"✅ Season {self.season_num}: {len(all_event_results)} events and standings saved to database "
+              f"({writer.rows_written} rows)")
     
     def calculate_season_standings(self, all_event_results: List[List[Dict]]) -> List[Dict]:
         """Calculate final season standings"""
@@ -228,35 +254,21 @@ class RegularSeasonSimulator:
     
     def save_season_standings(self, season_standings: List[Dict]):
         """Save season standings to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            for i, player in enumerate(season_standings):
-                cursor.execute("""
-                    INSERT INTO season_player_stats (season_id, player_id, total_season_points, final_rank, events_played)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (self.season_num, player['player_id'], player['total_points'], i + 1, player['events_played']))
-            
-            conn.commit()
-            print(f"✅ Season {self.season_num} standings saved to database")
-            
-        except Exception as e:
-            print(f"❌ Error saving season standings: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
+        with self._connection() as conn, ResultWriter(conn) as writer:
+            self._write_season_standings(writer, season_standings)
+        print(f"✅ Season {self.season_num} standings saved to database")
     
-
+    def _write_season_standings(self, writer: ResultWriter, season_standings: List[Dict]):
+        writer.extend(SEASON_STANDINGS, [
+            (self.season_num, player['player_id'], player['total_points'], i + 1, player['events_played'])
+            for i, player in enumerate(season_standings)
+        ])
     
     def generate_final_ranking_csv(self, season_standings: List[Dict], all_event_results: List[List[Dict]]):
         """Generate final ranking CSV with player ages and event wins"""
         # Get player ages from database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, age FROM players WHERE current_status = 'active'")
-        player_ages = {row[0]: row[1] for row in cursor.fetchall()}
-        conn.close()
+        with self._connection() as conn:
+            player_ages = dict(conn.execute("SELECT id, age FROM players WHERE current_status = 'active'").fetchall())
         
         # Calculate event wins
         event_wins = {}
@@ -326,11 +338,8 @@ class RegularSeasonSimulator:
     def generate_bottom_players_csv(self, season_standings: List[Dict], all_event_results: List[List[Dict]]):
         """Generate bottom 50 players CSV for relegated players"""
         # Get player ages from database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, age FROM players WHERE current_status = 'active'")
-        player_ages = {row[0]: row[1] for row in cursor.fetchall()}
-        conn.close()
+        with self._connection() as conn:
+            player_ages = dict(conn.execute("SELECT id, age FROM players WHERE current_status = 'active'").fetchall())
         
         # Calculate event wins
         event_wins = {}
@@ -365,19 +374,34 @@ class RegularSeasonSimulator:
         
         print(f"📊 Bottom 50 players CSV saved: {output_path}")
     
-    def run_season(self, seed: int = None):
+    def run_season(self, seed: int = None, workers: int = 1, write_reports: bool = True, events_saved: int = 0,
+                   on_event_saved: Callable[[int], None] = None):
+        """
+        Simulate and save the season.
+        
+        The first `events_saved` events are already in the database (an
+        interrupted run) and are read back instead of simulated again. With
+        `on_event_saved`, every event is saved on its own and the callback
+        runs right after it (e.g. to checkpoint and commit); otherwise the
+        events and standings are saved in one transaction.
+        """
         print(f"🏆 REGULAR SEASON {self.season_num} SIMULATION")
         print("=" * 60)
         players = self.load_active_players(seed)
         if not players:
             print("❌ No active players found!")
             return False
-        all_event_results = []
+        all_event_results = [self.load_event_results(event_num) for event_num in range(1, events_saved + 1)]
+        if events_saved:
+            print(f"⏯️  Resuming after event {events_saved}: saved events read back from the database")
+        new_event_results = self.simulate_events(players, seed, workers=workers, first_event=events_saved + 1)
+        if on_event_saved:
+            for event_num, event_results in enumerate(new_event_results, events_saved + 1):
+                self.save_event_results(event_results, event_num)
+                on_event_saved(event_num)
+        all_event_results += new_event_results
         event_wins = {p.player_id: 0 for p in players}
-        for event_num in range(1, 36):
-            event_results = self.simulate_event(event_num, players, seed)
-            self.save_event_results(event_results, event_num)
-            all_event_results.append(event_results)
+        for event_results in all_event_results:
             # Track event winner
             winner_id = event_results[0]['player_id']
             event_wins[winner_id] += 1
@@ -385,32 +409,43 @@ class RegularSeasonSimulator:
         # Attach event wins to season standings
         for player in season_standings:
             player['event_wins'] = event_wins.get(player['player_id'], 0)
-        self.save_season_standings(season_standings)
+        if on_event_saved:
+            self.save_season_standings(season_standings)
+        else:
+            self.save_season_results(new_event_results, season_standings, first_event=events_saved + 1)
+        self.season_standings = season_standings
         
         # Generate CSV files
-        self.generate_final_ranking_csv(season_standings, all_event_results)
-        self.generate_event_leaderboard_csv(all_event_results)
-        self.generate_bottom_players_csv(season_standings, all_event_results)
+        if write_reports:
+            self.generate_final_ranking_csv(season_standings, all_event_results)
+            self.generate_event_leaderboard_csv(all_event_results)
+            self.generate_bottom_players_csv(season_standings, all_event_results)
         
         print(f"\n🎉 Season {self.season_num} simulation complete!")
         print(f"🏆 Season winner: {season_standings[0]['name']} ({season_standings[0]['total_points']} points)")
         return True
 
+def season_seed(season_num: int) -> int:
+    """Default seed of a season, different for every season"""
+    return season_num * 1000 + 42
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Simulate a regular season")
     parser.add_argument('--season', type=int, default=1, help='Season number (default: 1)')
     parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for event simulation (default: 1)')
+    parser.add_argument('--bulk-load', action='store_true', help='Write results with the bulk-load pragma profile (no fsync)')
     args = parser.parse_args()
     
     # Use season number as seed if no seed provided, ensuring different results per season
     if args.seed is None:
-        args.seed = args.season * 1000 + 42  # Different seed for each season
+        args.seed = season_seed(args.season)
     
     db_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'prehistory.db')
-    simulator = RegularSeasonSimulator(db_path, args.season)
+    simulator = RegularSeasonSimulator(db_path, args.season, bulk_load=args.bulk_load)
     
-    success = simulator.run_season(args.seed)
+    success = simulator.run_season(args.seed, workers=args.workers)
     if success:
         print("\n✅ Season simulation completed successfully!")
     else:
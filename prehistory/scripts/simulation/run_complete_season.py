@@ -8,25 +8,56 @@ This script orchestrates the complete season cycle:
 3. Cull bottom 50 players (mark as inactive)
 4. Generate 50 new players for next season
 
-All steps are validated and reported for transparency.
+Every step runs in this process through one shared database connection,
+as a single transaction: committed when the step succeeds, rolled back
+when it fails. All steps are validated and reported for transparency.
+
+Each step checkpoints its progress in the simulation_state table inside its
+own transaction (events are saved and checkpointed one at a time), so an
+interrupted run is simply started again: finished steps and saved events
+are skipped and the season resumes where it stopped, without prompts.
+
+With --fast-forward N, N seasons run back to back in an in-memory copy of
+the database, written back to prehistory.db once at the end (and at
+optional checkpoints) with the SQLite backup API.
 """
 
 import os
 import sys
 import sqlite3
-import subprocess
 import argparse
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(SCRIPTS_DIR, 'simulation'))
+sys.path.append(os.path.join(SCRIPTS_DIR, 'player_management'))
+sys.path.append(os.path.join(SCRIPTS_DIR, 'player_generation'))
+
+from regular_season_simulator import RegularSeasonSimulator, season_seed
+from age_up_players import age_players
+from cull_players_regular_season import relegate_players
+from generate_players import generate_players
+from season_checkpoint import SeasonProgress, load_progress, save_progress
+from core.migrations import SCHEMA_VERSION, schema_version
+from core.result_writer import BULK_LOAD_PRAGMAS, connect
+
+DB_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'prehistory.db')
 
 class SeasonRunner:
     """Orchestrates the complete season cycle"""
     
-    def __init__(self, season_num: int, skip_new_players: bool = False):
+    def __init__(self, season_num: int, skip_new_players: bool = False, workers: int = 1, db_path: str = None,
+                 bulk_load: bool = False, write_reports: bool = True):
         self.season_num = season_num
         self.skip_new_players = skip_new_players
-        self.db_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'prehistory.db')
-        self.scripts_dir = os.path.join(os.path.dirname(__file__), '..')
+        self.workers = workers
+        self.bulk_load = bulk_load
+        self.write_reports = write_reports  # CSV and markdown reports under reports/
+        self.db_path = db_path or DB_PATH
+        self.scripts_dir = SCRIPTS_DIR
+        self.conn = None  # shared by every step, open for the duration of run_complete_season
+        self.progress = SeasonProgress(season_num)  # checkpointed progress, loaded by run_complete_season
         
         # Track statistics
         self.stats = {
@@ -40,10 +71,9 @@ class SeasonRunner:
         }
     
     def validate_database(self) -> bool:
-        """Validate database exists and has required tables"""
+        """Validate database has required tables and the season's tournaments match its checkpoint"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self.conn.cursor()
             
             # Check if required tables exist
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('players', 'tournaments', 'tournament_results', 'season_player_stats')")
@@ -58,13 +88,13 @@ class SeasonRunner:
             cursor.execute("SELECT COUNT(*) FROM tournaments WHERE season_number = ?", (self.season_num,))
             existing_tournaments = cursor.fetchone()[0]
             
-            if existing_tournaments > 0:
-                print(f"⚠️  Season {self.season_num} already has {existing_tournaments} tournaments!")
-                response = input("Continue anyway? (y/N): ")
-                if response.lower() != 'y':
-                    return False
+            if existing_tournaments != self.progress.events_saved:
+                print(f"❌ Season {self.season_num} has {existing_tournaments} tournaments, but simulation_state "
+                      f"records {self.progress.events_saved} saved events; not resuming")
+                return False
+            if existing_tournaments:
+                print(f"⏯️  Resuming Season {self.season_num} after event {existing_tournaments}")
             
-            conn.close()
             return True
             
         except Exception as e:
@@ -73,8 +103,7 @@ class SeasonRunner:
     
     def get_player_counts(self) -> Tuple[int, int]:
         """Get current active and inactive player counts"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         cursor.execute("SELECT COUNT(*) FROM players WHERE current_status = 'active'")
         active_count = cursor.fetchone()[0]
@@ -82,9 +111,44 @@ class SeasonRunner:
         cursor.execute("SELECT COUNT(*) FROM players WHERE current_status != 'active'")
         inactive_count = cursor.fetchone()[0]
         
-        conn.close()
         return active_count, inactive_count
     
+    def _run_stage(self, name: str, stage: Callable[[], bool], checkpoint: str = None) -> bool:
+        """Run one step on the shared connection as a single transaction, checkpointed on success"""
+        try:
+            success = stage()
+            if success and checkpoint:
+                self._checkpoint(stage=checkpoint)
+        except Exception as e:
+            self.conn.rollback()
+            print(f"❌ {name} error: {e}")
+            return False
+        if success:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+            print(f"❌ {name} failed!")
+        return success
+    
+    def _checkpoint(self, stage: str = None, events_saved: int = None):
+        """Record progress in the current transaction (the caller commits)"""
+        progress = SeasonProgress(self.season_num, stage,
+                                  self.progress.events_saved if events_saved is None else events_saved)
+        save_progress(self.conn, progress)
+        self.progress = progress
+    
+    def _skip_done(self, stage: str, step: str) -> bool:
+        """Whether a step was checkpointed by an earlier run"""
+        if self.progress.done(stage):
+            print(f"⏭️  {step}: already done (checkpoint {self.progress.stage})")
+            return True
+        return False
+    
+    def _save_event_checkpoint(self, event_num: int):
+        """Commit a saved event together with its checkpoint"""
+        self._checkpoint(events_saved=event_num)
+        self.conn.commit()
+    
     def run_season_simulation(self) -> bool:
         """Run the season simulation"""
         print(f"🏆 STEP 1: Simulating Season {self.season_num}")
@@ -95,119 +159,86 @@ class SeasonRunner:
         self.stats['initial_active_players'] = active_count
         print(f"📊 Starting with {active_count} active players")
         
-        # Run season simulator
-        simulator_script = os.path.join(self.scripts_dir, 'simulation', 'regular_season_simulator.py')
-        cmd = [sys.executable, simulator_script, '--season', str(self.season_num)]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.path.dirname(self.db_path))
-            
-            if result.returncode != 0:
-                print(f"❌ Season simulation failed!")
-                print(f"Error: {result.stderr}")
-                return False
-            
-            print(result.stdout)
-            
-            # Extract season winner from output
-            for line in result.stdout.split('\n'):
-                if "Season winner:" in line:
-                    winner_info = line.split("Season winner:")[1].strip()
-                    self.stats['season_winner'] = winner_info.split("(")[0].strip()
-                    points_str = winner_info.split("(")[1].split(")")[0].split()[0]
-                    self.stats['season_points'] = int(points_str)
-                    break
-            
+        if self._skip_done('simulated', f"Season {self.season_num} simulation"):
+            self.stats['season_winner'], self.stats['season_points'] = self.conn.execute("""
+                SELECT p.name, s.total_season_points FROM season_player_stats s JOIN players p ON p.id = s.player_id
+                WHERE s.season_id = ? AND s.final_rank = 1
+            """, (self.season_num,)).fetchone()
             return True
-            
-        except Exception as e:
-            print(f"❌ Season simulation error: {e}")
+        
+        # Events commit one at a time with their checkpoint, the standings with the 'simulated' one
+        simulator = RegularSeasonSimulator(self.db_path, self.season_num, conn=self.conn)
+        if not self._run_stage("Season simulation",
+                               lambda: simulator.run_season(season_seed(self.season_num), workers=self.workers,
+                                                            write_reports=self.write_reports,
+                                                            events_saved=self.progress.events_saved,
+                                                            on_event_saved=self._save_event_checkpoint),
+                               checkpoint='simulated'):
             return False
+        
+        winner = simulator.season_standings[0]
+        self.stats['season_winner'] = winner['name']
+        self.stats['season_points'] = winner['total_points']
+        return True
     
     def age_all_players(self) -> bool:
         """Age all players by 1 year"""
         print(f"📈 STEP 2: Aging all players by 1 year")
         print("=" * 50)
+        if self._skip_done('aged', "Player aging"):
+            return True
         
         # Get player counts before aging
         active_count, inactive_count = self.get_player_counts()
         print(f"📊 Before aging: {active_count} active, {inactive_count} inactive players")
         
-        # Run aging script
-        aging_script = os.path.join(self.scripts_dir, 'player_management', 'age_up_players.py')
-        cmd = [sys.executable, aging_script]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.path.dirname(self.db_path))
-            
-            if result.returncode != 0:
-                print(f"❌ Player aging failed!")
-                print(f"Error: {result.stderr}")
-                return False
-            
-            print(result.stdout)
-            
-            # Verify aging worked
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM players")
-            total_players = cursor.fetchone()[0]
-            conn.close()
-            
-            self.stats['players_aged'] = total_players
-            print(f"✅ Aged {total_players} players successfully")
-            
+        def stage():
+            self.stats['players_aged'] = age_players(self.conn)
             return True
-            
-        except Exception as e:
-            print(f"❌ Player aging error: {e}")
+        
+        if not self._run_stage("Player aging", stage, checkpoint='aged'):
             return False
+        
+        print(f"✅ Aged {self.stats['players_aged']} players successfully")
+        return True
     
     def cull_bottom_players(self) -> bool:
         """Cull bottom 50 players"""
         print(f"🗑️  STEP 3: Culling bottom 50 players")
         print("=" * 50)
+        if self._skip_done('culled', "Player culling"):
+            return True
         
         # Get player counts before culling
         active_count, inactive_count = self.get_player_counts()
         print(f"📊 Before culling: {active_count} active, {inactive_count} inactive players")
         
-        # Run culling script
-        culling_script = os.path.join(self.scripts_dir, 'player_management', 'cull_players_regular_season.py')
-        cmd = [sys.executable, culling_script, '--season', str(self.season_num)]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.path.dirname(self.db_path))
-            
-            if result.returncode != 0:
-                print(f"❌ Player culling failed!")
-                print(f"Error: {result.stderr}")
+        def stage():
+            if not relegate_players(self.conn, self.season_num, 50, report=self.write_reports):
                 return False
-            
-            print(result.stdout)
-            
-            # Verify culling worked
-            active_count_after, inactive_count_after = self.get_player_counts()
-            culled_count = active_count - active_count_after
-            
+            culled_count = active_count - self.get_player_counts()[0]
             if culled_count != 50:
                 print(f"⚠️  Expected to cull 50 players, but culled {culled_count}")
                 return False
-            
             self.stats['players_culled'] = culled_count
-            print(f"✅ Culled {culled_count} players successfully")
-            print(f"📊 After culling: {active_count_after} active, {inactive_count_after} inactive players")
-            
             return True
-            
-        except Exception as e:
-            print(f"❌ Player culling error: {e}")
+        
+        if not self._run_stage("Player culling", stage,
+                               checkpoint='complete' if self.skip_new_players else 'culled'):
             return False
+        
+        active_count_after, inactive_count_after = self.get_player_counts()
+        print(f"✅ Culled {self.stats['players_culled']} players successfully")
+        print(f"📊 After culling: {active_count_after} active, {inactive_count_after} inactive players")
+        return True
     
     def generate_new_players(self) -> bool:
         """Generate 50 new players for next season (without aging existing players)"""
         print(f"👥 STEP 4: Generating 50 new players")
         print("=" * 50)
+        if self._skip_done('complete', "Player generation"):
+            self.stats['final_active_players'] = self.get_player_counts()[0]
+            return True
         
         # Get player counts before generation
         active_count, inactive_count = self.get_player_counts()
@@ -215,85 +246,36 @@ class SeasonRunner:
         
         # Create directory for next season's CSV files
         next_season = self.season_num + 1
-        next_season_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'reports', 'regular_seasons', f'season_{next_season}')
-        os.makedirs(next_season_dir, exist_ok=True)
-        print(f"📁 Created directory for Season {next_season}: {next_season_dir}")
-        
-        # Create a temporary modified version of generate_players.py that doesn't age players
-        # We'll do this by creating a wrapper script that skips the aging step
-        temp_script = self._create_temp_generation_script()
-        
-        try:
-            # Run our modified generation script
-            cmd = [sys.executable, temp_script, '--num', '50', '--season', str(next_season), '--event', '0', '--suffix', f'S{next_season}']
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=os.path.dirname(self.db_path))
-            
-            # Clean up temp script
-            os.remove(temp_script)
-            
-            if result.returncode != 0:
-                print(f"❌ Player generation failed!")
-                print(f"Error: {result.stderr}")
-                return False
-            
-            print(result.stdout)
-            
-            # Verify generation worked
-            active_count_after, inactive_count_after = self.get_player_counts()
-            generated_count = active_count_after - active_count
-            
+        if self.write_reports:
+            next_season_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'reports', 'regular_seasons', f'season_{next_season}')
+            os.makedirs(next_season_dir, exist_ok=True)
+            print(f"📁 Created directory for Season {next_season}: {next_season_dir}")
+        
+        def stage():
+            # Players were already aged in step 2
+            generate_players(num_players=50, introduction_season=next_season, introduction_event=0,
+                             name_suffix=f'S{next_season}', age_players=False, conn=self.conn,
+                             report=self.write_reports)
+            generated_count = self.get_player_counts()[0] - active_count
             if generated_count != 50:
                 print(f"⚠️  Expected to generate 50 players, but generated {generated_count}")
                 return False
-            
             self.stats['new_players_generated'] = generated_count
-            self.stats['final_active_players'] = active_count_after
-            print(f"✅ Generated {generated_count} new players successfully")
-            print(f"📊 After generation: {active_count_after} active, {inactive_count_after} inactive players")
-            
-            # Fix CSV formatting for new players file
-            self._fix_new_players_csv_format()
-            
             return True
-            
-        except Exception as e:
-            print(f"❌ Player generation error: {e}")
-            # Clean up temp script on error
-            if os.path.exists(temp_script):
-                os.remove(temp_script)
+        
+        if not self._run_stage("Player generation", stage, checkpoint='complete'):
             return False
-    
-    def _create_temp_generation_script(self) -> str:
-        """Create a temporary version of generate_players.py that skips aging"""
-        original_script = os.path.join(self.scripts_dir, 'player_generation', 'generate_players.py')
-        temp_script = os.path.join(os.path.dirname(__file__), 'temp_generate_players_no_aging.py')
-        
-        with open(original_script, 'r') as f:
-            content = f.read()
-        
-        # Remove the aging line from the generate_players function
-        # Find the line that says "cursor.execute("UPDATE players SET age = age + 1")"
-        lines = content.split('\n')
-        modified_lines = []
-        skip_next_line = False
-        
-        for line in lines:
-            if 'cursor.execute("UPDATE players SET age = age + 1")' in line:
-                # Skip this line and the next line (which is usually conn.commit())
-                skip_next_line = True
-                continue
-            elif skip_next_line and 'conn.commit()' in line:
-                skip_next_line = False
-                continue
-            else:
-                modified_lines.append(line)
         
-        modified_content = '\n'.join(modified_lines)
+        active_count_after, inactive_count_after = self.get_player_counts()
+        self.stats['final_active_players'] = active_count_after
+        print(f"✅ Generated {self.stats['new_players_generated']} new players successfully")
+        print(f"📊 After generation: {active_count_after} active, {inactive_count_after} inactive players")
         
-        with open(temp_script, 'w') as f:
-            f.write(modified_content)
+        # Fix CSV formatting for new players file
+        if self.write_reports:
+            self._fix_new_players_csv_format()
         
-        return temp_script
+        return True
     
     def _fix_new_players_csv_format(self):
         """Fix the CSV formatting for the new players file (convert pipes to commas)"""
@@ -337,8 +319,7 @@ class SeasonRunner:
         validation_results = []
         
         # 1. Check tournament count
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM tournaments WHERE season_number = ?", (self.season_num,))
         tournament_count = cursor.fetchone()[0]
         
@@ -436,13 +417,17 @@ class SeasonRunner:
             if not os.path.exists(os.path.join(csv_dir, file)):
                 missing_files.append(file)
         
-        if not missing_files:
+        if not self.write_reports:
+            validation_results.append(("⏭️  CSV files", "Skipped (reports disabled)"))
+        elif not missing_files:
             validation_results.append(("✅ CSV files", "All expected CSV files created"))
         else:
             validation_results.append(("❌ CSV files", f"Missing: {', '.join(missing_files)}"))
         
         # 8. Check new players CSV for next season (skip if --no-new-players flag is set)
-        if not self.skip_new_players:
+        if not self.write_reports:
+            validation_results.append(("⏭️  Next season CSV", "Skipped (reports disabled)"))
+        elif not self.skip_new_players:
             next_season_csv = os.path.join(os.path.dirname(__file__), '..', '..', 'reports', 'regular_seasons', f'season_{next_season}', f'season_{next_season}_new_players.csv')
             if os.path.exists(next_season_csv):
                 validation_results.append(("✅ Next season CSV", f"New players CSV created for Season {next_season}"))
@@ -451,7 +436,6 @@ class SeasonRunner:
         else:
             validation_results.append(("⏭️  Next season CSV", "Skipped (--no-new-players flag)"))
         
-        conn.close()
         
         # Print validation results
         print("🔍 VALIDATION RESULTS:")
@@ -528,14 +512,40 @@ class SeasonRunner:
         print(f"📊 Completion report saved: {report_path}")
         print('\n'.join(report))
     
-    def run_complete_season(self) -> bool:
-        """Run the complete season cycle"""
+    def run_complete_season(self, conn: sqlite3.Connection = None) -> bool:
+        """
+        Run the complete season cycle on one shared connection.
+        
+        `conn` is an open connection to run on (e.g. an in-memory copy of the
+        database, see fast_forward); by default db_path is opened and closed.
+        """
+        own_conn = conn is None
+        self.conn = connect(self.db_path, BULK_LOAD_PRAGMAS if self.bulk_load else None) if own_conn else conn
+        try:
+            return self._run_steps()
+        finally:
+            if own_conn:
+                self.conn.close()
+            self.conn = None
+    
+    def _run_steps(self) -> bool:
         print(f"🚀 STARTING COMPLETE SEASON {self.season_num} CYCLE")
         print("=" * 60)
         print(f"Database: {self.db_path}")
         print(f"Scripts: {self.scripts_dir}")
         print("=" * 60)
         
+        # Migrations are an explicit step; never change the schema of the database behind the user's back
+        version = schema_version(self.conn)
+        if version < SCHEMA_VERSION:
+            print(f"❌ Database schema is at version {version}, this runner needs {SCHEMA_VERSION}; "
+                  f"run python scripts/utilities/migrate_databases.py {self.db_path}")
+            return False
+        self.progress = load_progress(self.conn, self.season_num)
+        if self.progress.done('complete'):
+            print(f"⏭️  Season {self.season_num} already complete (simulation_state); nothing to do")
+            return True
+        
         # Step 0: Validate database
         if not self.validate_database():
             return False
@@ -561,22 +571,93 @@ class SeasonRunner:
             print("=" * 50)
             print("📊 No new players will be generated for next season")
             self.stats['new_players_generated'] = 0
+            self.stats['final_active_players'] = self.get_player_counts()[0]
+            if not self.progress.done('complete'):
+                # Culled by a run that was going to generate players
+                self._checkpoint(stage='complete')
+                self.conn.commit()
         
         # Step 5: Generate completion report
-        self.generate_completion_report()
+        if self.write_reports:
+            self.generate_completion_report()
+        else:
+            self.validate_complete_cycle()
         
         print(f"\n🎉 SEASON {self.season_num} COMPLETE CYCLE SUCCESSFUL!")
         print("=" * 60)
         return True
 
+def fast_forward(first_season: int, seasons: int, db_path: str = None, workers: int = 1,
+                 checkpoint_every: int = 0, skip_new_players: bool = False, write_reports: bool = True) -> bool:
+    """
+    Run `seasons` complete seasons from `first_season` in memory.
+    
+    The database is copied once into an in-memory SQLite database with the
+    backup API; every season's simulation, aging, culling and generation
+    runs there, and the result is backed up to disk at the end and after
+    every `checkpoint_every` seasons. Seasons already complete according
+    to simulation_state are skipped, so a failed or interrupted run is
+    resumed by running it again: on failure or Ctrl-C the in-memory
+    database, whose every committed step is checkpointed, is written back
+    first. A crash of the process loses the work since the last backup.
+    `skip_new_players` applies to the last season only.
+    """
+    db_path = db_path or DB_PATH
+    last_season = first_season + seasons - 1
+    disk = sqlite3.connect(db_path)
+    memory = sqlite3.connect(':memory:')
+    try:
+        disk.backup(memory)
+        print(f"⏩ Fast-forwarding seasons {first_season}-{last_season} in memory")
+        for season_num in range(first_season, last_season + 1):
+            runner = SeasonRunner(season_num, skip_new_players and season_num == last_season, workers,
+                                  db_path=db_path, write_reports=write_reports)
+            try:
+                success = runner.run_complete_season(conn=memory)
+            except KeyboardInterrupt:
+                memory.rollback()
+                memory.backup(disk)
+                print(f"⏸️  Fast-forward interrupted in season {season_num}; progress written to {db_path}")
+                raise
+            if not success:
+                memory.backup(disk)
+                print(f"❌ Fast-forward stopped at season {season_num}; progress written to {db_path}, "
+                      f"run again to resume")
+                return False
+            
+            completed = season_num - first_season + 1
+            if checkpoint_every and completed % checkpoint_every == 0 and season_num != last_season:
+                memory.backup(disk)
+                print(f"💾 Checkpoint: seasons {first_season}-{season_num} written to {db_path}")
+        
+        memory.backup(disk)
+        print(f"💾 Seasons {first_season}-{last_season} written to {db_path}")
+        return True
+    finally:
+        memory.close()
+        disk.close()
+
 def main():
     parser = argparse.ArgumentParser(description="Run complete season cycle")
     parser.add_argument('--season', type=int, required=True, help='Season number to run')
     parser.add_argument('--no-new-players', action='store_true', help='Skip new player generation (for final season)')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for event simulation (default: 1)')
+    parser.add_argument('--bulk-load', action='store_true', help='Write with the bulk-load pragma profile (no fsync)')
+    parser.add_argument('--fast-forward', type=int, metavar='N',
+                        help='Run N seasons from --season in memory, writing the database once at the end')
+    parser.add_argument('--checkpoint-every', type=int, default=0, metavar='K',
+                        help='With --fast-forward, also write the database every K seasons')
+    parser.add_argument('--no-reports', action='store_true', help='Skip the CSV and markdown reports')
     args = parser.parse_args()
     
-    runner = SeasonRunner(args.season, args.no_new_players)
-    success = runner.run_complete_season()
+    if args.fast_forward:
+        success = fast_forward(args.season, args.fast_forward, workers=args.workers,
+                               checkpoint_every=args.checkpoint_every, skip_new_players=args.no_new_players,
+                               write_reports=not args.no_reports)
+    else:
+        runner = SeasonRunner(args.season, args.no_new_players, args.workers, bulk_load=args.bulk_load,
+                              write_reports=not args.no_reports)
+        success = runner.run_complete_season()
     
     if success:
         print("\n✅ Complete season cycle finished successfully!")
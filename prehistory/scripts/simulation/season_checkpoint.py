@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Season checkpoints in the simulation_state table
+
+A complete season run records its progress in the single simulation_state
+row (id 1), in the same transaction as the writes it describes, so the
+recorded progress and the database can never disagree:
+
+- 'regular_season_N' with current_event = K: events 1..K of season N saved
+- 'regular_season_N_<stage>': stage of season N done, stages in STAGES order
+
+The row's status is 'running' until a season is complete. Nothing here
+commits; the caller's transaction does.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+# Season stages in run order; 'complete' follows culling when no players are generated
+STAGES = ('simulated', 'aged', 'culled', 'complete')
+
+PHASE_PREFIX = 'regular_season_'
+
+
+@dataclass
+class SeasonProgress:
+    """Checkpointed progress of one season"""
+    season: int
+    stage: Optional[str] = None  # last finished stage; None while events are being saved
+    events_saved: int = 0
+
+    def done(self, stage: str) -> bool:
+        return self.stage is not None and STAGES.index(self.stage) >= STAGES.index(stage)
+
+
+def phase_name(season_num: int, stage: Optional[str] = None) -> str:
+    return f"{PHASE_PREFIX}{season_num}" + (f"_{stage}" if stage else "")
+
+
+def load_progress(conn: sqlite3.Connection, season_num: int) -> SeasonProgress:
+    """Progress of a season as recorded in simulation_state"""
+    row = conn.execute("SELECT current_phase, current_season, current_event FROM simulation_state WHERE id = 1").fetchone()
+    if row is None or not (row[0] or '').startswith(PHASE_PREFIX):
+        return SeasonProgress(season_num)
+    phase, season, event = row
+    if season > season_num:
+        # A later season has been started, so this one was completed
+        return SeasonProgress(season_num, 'complete', event)
+    if season < season_num:
+        return SeasonProgress(season_num)
+    stage = phase[len(phase_name(season)):].lstrip('_') or None
+    if stage is not None and stage not in STAGES:
+        raise ValueError(f"Unknown simulation_state phase: {phase}")
+    return SeasonProgress(season_num, stage, event)
+
+
+def save_progress(conn: sqlite3.Connection, progress: SeasonProgress):
+    """Record progress in the caller's transaction"""
+    total_players, active_players = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(current_status = 'active'), 0) FROM players").fetchone()
+    values = (phase_name(progress.season, progress.stage), progress.season, progress.events_saved,
+              total_players, active_players, datetime.now().isoformat(),
+              'completed' if progress.stage == 'complete' else 'running')
+    updated = conn.execute('''
+        UPDATE simulation_state
+        SET current_phase = ?, current_season = ?, current_event = ?,
+            total_players = ?, active_players = ?, last_updated = ?, status = ?
+        WHERE id = 1
+    ''', values).rowcount
+    if not updated:
+        conn.execute('''
+            INSERT INTO simulation_state (
+                current_phase, current_season, current_event,
+                total_players, active_players, last_updated, status, id, start_date
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
+        ''', values + (values[5],))
@@ -6,16 +6,33 @@ Simulates 72-hole tournaments for the Gauntlet season with 600 players.
 
 import sqlite3
 import os
-import random
-import math
-from datetime import datetime, timedelta
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+from core.course_model import CourseModel
+from core.mental_state import MentalState
+from core.playoff import settle_result, shared_points
+from core.result_writer import BULK_LOAD_PRAGMAS, GAUNTLET_RESULTS, ResultWriter, connect
+from core.rng_streams import SimulationStreams
+from core.scorecard_store import save_scorecards
+from core.tournament_simulator import TournamentSimulator, hole_type_ratings
 
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), '../../../data/prehistory.db')
 
+# Gauntlet tournaments are season 0 of the prehistory
+GAUNTLET_SEASON = 0
+
 class GauntletTournamentSimulator:
-    def __init__(self):
+    def __init__(self, seed=None, bulk_load=False):
         self.db_path = DB_PATH
+        self.bulk_load = bulk_load  # write results with the bulk-load pragma profile
+        # Courses draw from a stream per (season, event), players from per-player
+        # counter streams; unseeded runs keep their entropy for reproduction
+        self.streams = SimulationStreams(seed)
+        self.courses = {}
         
     def get_all_players(self):
         """Get all active players from the database"""
@@ -33,92 +50,41 @@ class GauntletTournamentSimulator:
         conn.close()
         return players
     
-    def calculate_hole_difficulty(self):
-        """Generate a random difficulty rating for a hole (0-100)"""
+    def calculate_player_ratings(self, players):
+        """
+        Ratings for every player in the field, computed once per tournament.
+        
+        Rows are the get_all_players() tuples; skills start at column 4.
+        Returns an (n_players x 3) table of par-3/4/5 ratings: 70% physical
+        (weighted by hole type), 30% mental.
+        """
+        return hole_type_ratings(np.array([player[4:16] for player in players], dtype=np.float64))
+    
+    def calculate_hole_difficulty(self, rng, size=None):
+        """Generate random difficulty ratings for holes (0-100)"""
         # Base difficulty with some variation
-        base_difficulty = random.uniform(30, 85)
+        base_difficulty = rng.uniform(30, 85, size)
         # Add some randomness for variety
-        variation = random.uniform(-10, 10)
-        return max(0, min(100, base_difficulty + variation))
+        variation = rng.uniform(-10, 10, size)
+        return np.clip(base_difficulty + variation, 0, 100)
     
-    def calculate_player_performance(self, player_attrs, hole_difficulty):
+    def get_course(self, tournament_id, event_number):
         """
-        Calculate a player's performance on a hole based on their attributes vs. hole difficulty.
-        Returns a performance score that will be converted to a stroke count.
-        """
-        # Physical skills (weighted average)
-        physical_score = (
-            player_attrs['driving_power'] * 0.25 +
-            player_attrs['driving_accuracy'] * 0.25 +
-            player_attrs['approach_accuracy'] * 0.20 +
-            player_attrs['short_game'] * 0.15 +
-            player_attrs['putting'] * 0.15
-        )
-        
-        # Mental skills (weighted average)
-        mental_score = (
-            player_attrs['composure'] * 0.20 +
-            player_attrs['confidence'] * 0.15 +
-            player_attrs['focus'] * 0.20 +
-            player_attrs['risk_tolerance'] * 0.10 +
-            player_attrs['mental_fatigue'] * 0.10 +
-            player_attrs['consistency'] * 0.15 +
-            player_attrs['resilience'] * 0.10
-        )
+        Compiled course for a Gauntlet tournament, drawn once and cached by tournament.
         
-        # Overall player rating (70% physical, 30% mental)
-        player_rating = (physical_score * 0.7) + (mental_score * 0.3)
-        
-        # Performance calculation: player rating vs hole difficulty
-        # Higher player rating and lower hole difficulty = better performance
-        performance_ratio = player_rating / (hole_difficulty + 1)  # +1 to avoid division by zero
-        
-        # Convert to a performance score (0-100)
-        performance_score = min(100, max(0, performance_ratio * 50))
-        
-        # Add some randomness for realism
-        randomness = random.uniform(-15, 15)
-        final_performance = min(100, max(0, performance_score + randomness))
-        
-        return final_performance
-    
-    def performance_to_strokes(self, performance_score, hole_par=4):
-        """
-        Convert performance score to stroke count.
-        Higher performance = fewer strokes.
+        Gauntlet events have no real course, so the 18 holes are invented:
+        mostly par 4s, with some 3s on the first 4 holes and 5s on the last 4.
         """
-        # Performance score of 100 = par
-        # Performance score of 0 = par + 4 strokes
-        stroke_adjustment = (100 - performance_score) / 25  # 0-4 stroke range
-        strokes = hole_par + stroke_adjustment
-        
-        # Round to nearest whole number, minimum 1 stroke
-        return max(1, round(strokes))
-    
-    def simulate_player_round(self, player_attrs):
-        """Simulate a player's 18-hole round"""
-        round_score = 0
-        
-        for hole in range(18):
-            # Determine par for this hole (mostly par 4s, some 3s and 5s)
-            if hole < 4:  # First 4 holes
-                par = random.choice([3, 4, 4, 4])
-            elif hole < 14:  # Middle holes
-                par = random.choice([4, 4, 4, 4, 4, 4, 4, 4, 4, 4])
-            else:  # Last 4 holes
-                par = random.choice([4, 4, 5, 4])
-            
-            # Calculate hole difficulty
-            hole_difficulty = self.calculate_hole_difficulty()
-            
-            # Calculate player performance
-            performance = self.calculate_player_performance(player_attrs, hole_difficulty)
-            
-            # Convert to strokes
-            strokes = self.performance_to_strokes(performance, par)
-            round_score += strokes
-        
-        return round_score
+        if tournament_id not in self.courses:
+            rng = self.streams.generator(GAUNTLET_SEASON, event_number)
+            pars = np.concatenate([
+                rng.choice([3, 4, 4, 4], 4),
+                np.full(10, 4),
+                rng.choice([4, 4, 5, 4], 4)
+            ])
+            difficulty = self.calculate_hole_difficulty(rng, 18)
+            self.courses[tournament_id] = CourseModel.from_holes(tournament_id, f"Gauntlet Course {event_number}", pars, difficulty)
+        return self.courses[tournament_id]
     
     def simulate_tournament(self, tournament_name, tournament_id, event_number):
         """Simulate a complete 72-hole tournament"""
@@ -129,56 +95,47 @@ class GauntletTournamentSimulator:
         players = self.get_all_players()
         print(f"📊 Field size: {len(players)} players")
         
-        # Simulate tournament results
+        # Ratings are fixed for the tournament; confidence, pressure and fatigue move hole by hole
+        player_ids = np.array([player[0] for player in players])
+        ratings = self.calculate_player_ratings(players)
+        mental = MentalState.from_skills(np.array([player[4:16] for player in players], dtype=np.float64))
+        
+        # Simulate 4 rounds on the event's course, each hole for the whole field at once
+        course = self.get_course(tournament_id, event_number)
+        simulator = TournamentSimulator(course, self.streams, (GAUNTLET_SEASON, event_number))
+        result = simulator.simulate(player_ids, ratings, mental=mental)
+        
+        # Ties share a position; a tie for first goes to a sudden-death playoff
+        result, playoff = settle_result(simulator, result, ratings)
+        if playoff is not None:
+            print(f"⚔️  {len(playoff.players)}-player playoff won on hole {playoff.holes_played}")
+        round_scores = result.round_scores
+        total_scores = result.totals
+        # 1st gets 600, 2nd gets 599, etc.; tied players split the points of the
+        # places they share, rounded down
+        points = shared_points(result.positions, 600)
+        
+        # One row per player in finishing order, with the positions settled above
         tournament_results = []
-        
-        for player in players:
-            player_id, name, age, nationality = player[0:4]
-            player_attrs = {
-                'driving_power': player[4],
-                'driving_accuracy': player[5],
-                'approach_accuracy': player[6],
-                'short_game': player[7],
-                'putting': player[8],
-                'composure': player[9],
-                'confidence': player[10],
-                'focus': player[11],
-                'risk_tolerance': player[12],
-                'mental_fatigue': player[13],
-                'consistency': player[14],
-                'resilience': player[15]
-            }
-            
-            # Simulate 4 rounds
-            round_1 = self.simulate_player_round(player_attrs)
-            round_2 = self.simulate_player_round(player_attrs)
-            round_3 = self.simulate_player_round(player_attrs)
-            round_4 = self.simulate_player_round(player_attrs)
-            
-            total_score = round_1 + round_2 + round_3 + round_4
-            
+        for idx in result.order:
+            position = int(result.positions[idx])
+            round_1, round_2, round_3, round_4 = (int(score) for score in round_scores[idx])
             tournament_results.append({
-                'player_id': player_id,
-                'name': name,
-                'total_score': total_score,
+                'player_id': players[idx][0],
+                'name': players[idx][1],
+                'total_score': int(total_scores[idx]),
                 'round_1': round_1,
                 'round_2': round_2,
                 'round_3': round_3,
-                'round_4': round_4
+                'round_4': round_4,
+                'position': position,
+                'points_earned': int(points[idx]),
+                'made_cut': bool(result.made_cut[idx])  # No cut in the Gauntlet
             })
         
-        # Sort by total score (lower is better)
-        tournament_results.sort(key=lambda x: x['total_score'])
-        
-        # Assign positions and points
-        for i, result in enumerate(tournament_results):
-            position = i + 1
-            points_earned = 600 - i  # 1st gets 600, 2nd gets 599, etc.
-            result['position'] = position
-            result['points_earned'] = points_earned
-        
-        # Save results to database
-        self.save_tournament_results(tournament_id, tournament_results)
+        # Save results and the packed hole-by-hole scorecards to database
+        self.save_tournament_results(tournament_id, tournament_results,
+                                     scorecards=(player_ids, result.strokes, simulator.par))
         
         # Print top 10 results
         print(f"\n🏆 Top 10 Results:")
@@ -189,20 +146,18 @@ class GauntletTournamentSimulator:
         print(f"\n✅ Tournament simulation complete!")
         return tournament_results
     
-    def save_tournament_results(self, tournament_id, results):
-        """Save tournament results to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def save_tournament_results(self, tournament_id, results, scorecards=None):
+        """
+        Save tournament results to the database.
+        
+        `scorecards` is an optional (player_ids, strokes, par) tuple stored as
+        one packed row in the same transaction.
+        """
+        conn = connect(self.db_path, BULK_LOAD_PRAGMAS if self.bulk_load else None)
         
         try:
-            for result in results:
-                cursor.execute('''
-                    INSERT INTO tournament_results (
-                        tournament_id, player_id, position, total_score,
-                        round_1_score, round_2_score, round_3_score, round_4_score,
-                        points_earned, made_cut, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            with ResultWriter(conn) as writer:
+                writer.extend(GAUNTLET_RESULTS, [(
                     tournament_id,
                     result['player_id'],
                     result['position'],
@@ -212,9 +167,12 @@ class GauntletTournamentSimulator:
                     result['round_3'],
                     result['round_4'],
                     result['points_earned'],
-                    1,  # All players make cut in Gauntlet
-                    datetime.now().isoformat()
-                ))
+                    int(result['made_cut']),
+                    writer.timestamp
+                ) for result in results])
+            
+            if scorecards is not None:
+                save_scorecards(conn, tournament_id, *scorecards)
             
             conn.commit()
             print(f"💾 Saved {len(results)} tournament results to database")
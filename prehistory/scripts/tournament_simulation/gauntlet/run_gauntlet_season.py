@@ -6,16 +6,20 @@ Simulates all 10 Gauntlet tournaments and generates final leaderboard.
 
 import sqlite3
 import os
+import sys
 from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from gauntlet_tournament_simulator import GauntletTournamentSimulator
+from core.result_writer import GAUNTLET_SEASON_STATS, SEASON_EVENT_RESULTS, ResultWriter
 
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), '../../../data/prehistory.db')
 
 class GauntletSeasonRunner:
-    def __init__(self):
+    def __init__(self, seed=None):
         self.db_path = DB_PATH
-        self.simulator = GauntletTournamentSimulator()
+        self.simulator = GauntletTournamentSimulator(seed)
         
     def get_gauntlet_tournaments(self):
         """Get all Gauntlet tournaments from the database"""
@@ -84,28 +88,24 @@ class GauntletSeasonRunner:
     def save_season_player_stats(self, season_id, cumulative_results):
         """Save season player statistics"""
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         
         try:
-            for i, result in enumerate(cumulative_results):
-                player_id, name, age, nationality, total_points, events_played, wins, top_10s = result
-                
-                cursor.execute('''
-                    INSERT INTO season_player_stats (
-                        season_id, player_id, total_season_points, final_rank,
-                        events_played, wins, top_10s, made_cuts, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    season_id,
-                    player_id,
-                    total_points,
-                    i + 1,  # Final rank
-                    events_played,
-                    wins,
-                    top_10s,
-                    events_played,  # All players make cut in Gauntlet
-                    datetime.now().isoformat()
-                ))
+            with ResultWriter(conn) as writer:
+                rows = []
+                for i, result in enumerate(cumulative_results):
+                    player_id, name, age, nationality, total_points, events_played, wins, top_10s = result
+                    rows.append((
+                        season_id,
+                        player_id,
+                        total_points,
+                        i + 1,  # Final rank
+                        events_played,
+                        wins,
+                        top_10s,
+                        events_played,  # All players make cut in Gauntlet
+                        writer.timestamp
+                    ))
+                writer.extend(GAUNTLET_SEASON_STATS, rows)
             
             conn.commit()
             print(f"💾 Saved season player stats for {len(cumulative_results)} players")
@@ -137,22 +137,11 @@ class GauntletSeasonRunner:
             
             results = cursor.fetchall()
             
-            for result in results:
-                tournament_id, player_id, event_rank, points_earned, total_score = result
-                
-                cursor.execute('''
-                    INSERT INTO season_event_results (
-                        season_id, tournament_id, player_id, event_rank, points_earned, total_score, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    season_id,
-                    tournament_id,
-                    player_id,
-                    event_rank,
-                    points_earned,
-                    total_score,
-                    datetime.now().isoformat()
-                ))
+            with ResultWriter(conn) as writer:
+                writer.extend(SEASON_EVENT_RESULTS, [
+                    (season_id, tournament_id, player_id, event_rank, points_earned, total_score, writer.timestamp)
+                    for tournament_id, player_id, event_rank, points_earned, total_score in results
+                ])
             
             conn.commit()
             print(f"💾 Saved event-by-event results for the season")
@@ -175,6 +164,7 @@ class GauntletSeasonRunner:
             return
         
         print(f"📅 Found {len(tournaments)} tournaments to simulate")
+        print(f"🎲 Random seed: {self.simulator.streams.seed}")
         print()
         
         # Simulate each tournament
@@ -232,7 +222,12 @@ class GauntletSeasonRunner:
 
 def main():
     """Main function"""
-    runner = GauntletSeasonRunner()
+    import argparse
+    parser = argparse.ArgumentParser(description="Simulate the Gauntlet season")
+    parser.add_argument('--seed', type=int, help='Random seed for reproducibility')
+    args = parser.parse_args()
+    
+    runner = GauntletSeasonRunner(args.seed)
     results = runner.run_gauntlet_season()
     
     if results:
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Simulator throughput benchmarks.
+
+Times the simulators on synthetic fields (75, 156, 600 and 5,000 players by
+default), each on its own scratch copy of the prehistory.db schema:
+
+- regular_season_event: one 72-hole regular-season event, saved
+- gauntlet_tournament: one Gauntlet tournament with the mental game, saved
+  with its scorecards
+- regular_season: a full 35-event season with standings, saved
+- prehistory: 10 complete seasons back to back (simulation, aging, culling
+  and new players) through SeasonRunner on one connection
+- monday_qualifiers: a season of 35 Monday qualifiers, the field entering
+  each one, played in one batch (run_qualifiers)
+- outcome_engine: 3,000 Monte Carlo simulations of the field (OutcomeEngine),
+  counted as 72 player-holes per player and simulation
+
+Each benchmark reports wall time, player-holes/sec, peak traced memory
+(tracemalloc, which includes NumPy buffers) and the time spent writing to
+SQLite, as JSON:
+
+    python scripts/benchmarks/simulator_benchmarks.py --output baseline.json
+    python scripts/benchmarks/simulator_benchmarks.py --compare baseline.json --threshold 0.15
+
+In compare mode every benchmark whose throughput dropped, or whose peak
+memory or SQLite time grew, by more than the threshold is flagged and the
+script exits with status 1. It also exits with status 1 when a documented
+target is missed: the outcome engine's THROUGHPUT_TARGET simulations/sec at
+THROUGHPUT_FIELD_SIZE players, and the SECONDS_TARGETS wall times.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+sys.path.append(REPO_DIR)
+sys.path.append(os.path.join(REPO_DIR, 'prehistory', 'scripts', 'simulation'))
+sys.path.append(os.path.join(REPO_DIR, 'prehistory', 'scripts', 'tournament_simulation', 'gauntlet'))
+sys.path.append(os.path.join(REPO_DIR, 'prehistory', 'scripts', 'player_generation'))
+
+from core.course_model import CourseModel
+from core.field_simulator import COMPOSURE_INDEX, SKILL_COLUMNS, total_skill
+from core.migrations import migrate
+from core.outcome_engine import THROUGHPUT_FIELD_SIZE, THROUGHPUT_TARGET, OutcomeEngine
+from core.qualifiers import monday_qualifier, run_qualifiers
+from core.rng_streams import SimulationStreams
+from gauntlet_tournament_simulator import GauntletTournamentSimulator
+from regular_season_simulator import RegularSeasonSimulator
+import generate_players
+import run_complete_season
+
+SNAPSHOT_DB = os.path.join(REPO_DIR, 'prehistory', 'data', 'prehistory.db')
+
+FIELD_SIZES = [75, 156, 600, 5000]
+EVENT_HOLES = 72
+SEASON_EVENTS = 35
+QUALIFIER_HOLES = 18
+QUALIFIER_PARS = [4, 4, 3, 5, 4, 4, 3, 4, 5, 4, 4, 3, 5, 4, 4, 3, 4, 5]
+PREHISTORY_SEASONS = 10
+OUTCOME_SIMULATIONS = 3000
+BENCHMARK_SEED = 1234
+
+# Longest wall time, in seconds, a benchmark may take at a field size
+SECONDS_TARGETS = {
+    ('gauntlet_tournament', 600): 5.0,
+    ('monday_qualifiers', 156): 1.0
+}
+
+# Tables emptied in the scratch database before a benchmark
+SCRATCH_TABLES = ['players', 'tournaments', 'tournament_results', 'season_player_stats', 'simulation_state']
+
+
+def make_field_db(tmp_dir: str, field_size: int, seed: int = BENCHMARK_SEED) -> str:
+    """Scratch copy of prehistory.db whose active players are a synthetic field"""
+    db_path = os.path.join(tmp_dir, f'benchmark_{field_size}.db')
+    shutil.copy(SNAPSHOT_DB, db_path)
+    rng = np.random.default_rng(seed)
+    skills = np.round(rng.uniform(40, 90, (field_size, len(SKILL_COLUMNS))), 1)
+    conn = sqlite3.connect(db_path)
+    for table in SCRATCH_TABLES:
+        conn.execute(f'DELETE FROM {table}')
+    conn.executemany(f'''
+        INSERT INTO players (id, name, age, nationality, {', '.join(SKILL_COLUMNS)}, current_status)
+        VALUES (?, ?, ?, ?, {', '.join('?' * len(SKILL_COLUMNS))}, 'active')
+    ''', [(i + 1, f'Benchmark Player {i + 1}', 25, 'USA', *row) for i, row in enumerate(skills.tolist())])
+    conn.commit()
+    migrate(conn)
+    conn.close()
+    return db_path
+
+
+class SQLiteTimer:
+    """Accumulates the time spent in wrapped database-writing calls"""
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def wrap(self, function: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.seconds += time.perf_counter() - start
+        return timed
+
+    @contextmanager
+    def patched(self, targets: Sequence[Tuple[object, str]]):
+        """Time the (owner, attribute) functions while the block runs"""
+        originals = [(owner, name, getattr(owner, name)) for owner, name in targets]
+        for owner, name, function in originals:
+            setattr(owner, name, self.wrap(function))
+        try:
+            yield self
+        finally:
+            for owner, name, function in originals:
+                setattr(owner, name, function)
+
+
+class TimedConnection(sqlite3.Connection):
+    """Connection whose commits count as SQLite write time"""
+    timer: Optional[SQLiteTimer] = None
+
+    def commit(self):
+        start = time.perf_counter()
+        try:
+            super().commit()
+        finally:
+            if self.timer is not None:
+                self.timer.seconds += time.perf_counter() - start
+
+
+# Database writes of a complete season besides commits
+SEASON_WRITES = [
+    (RegularSeasonSimulator, 'save_event_results'),
+    (RegularSeasonSimulator, 'save_season_standings'),
+    (run_complete_season, 'age_players'),
+    (run_complete_season, 'relegate_players'),
+    (generate_players, 'insert_player')
+]
+
+
+def _season(db_path: str, season_num: int, timer: SQLiteTimer, seed: int) -> int:
+    """Simulate and save one regular season; returns player-holes simulated"""
+    simulator = RegularSeasonSimulator(db_path, season_num)
+    players = simulator.load_active_players(seed)
+    events = simulator.simulate_events(players, seed + season_num, num_events=SEASON_EVENTS)
+    timer.wrap(simulator.save_season_results)(events, simulator.calculate_season_standings(events))
+    return len(events) * len(players) * EVENT_HOLES
+
+
+def bench_regular_season_event(db_path: str, timer: SQLiteTimer, seed: int) -> int:
+    simulator = RegularSeasonSimulator(db_path, season_num=1)
+    players = simulator.load_active_players(seed)
+    event_results = simulator.simulate_event(1, players, seed)
+    timer.wrap(simulator.save_event_results)(event_results, 1)
+    return len(players) * EVENT_HOLES
+
+
+def bench_gauntlet_tournament(db_path: str, timer: SQLiteTimer, seed: int) -> int:
+    simulator = GauntletTournamentSimulator(seed)
+    simulator.db_path = db_path
+    simulator.save_tournament_results = timer.wrap(simulator.save_tournament_results)
+    results = simulator.simulate_tournament("Benchmark Gauntlet", 1, 1)
+    return sum(EVENT_HOLES if result['made_cut'] else EVENT_HOLES // 2 for result in results)
+
+
+def bench_regular_season(db_path: str, timer: SQLiteTimer, seed: int) -> int:
+    return _season(db_path, 1, timer, seed)
+
+
+def bench_prehistory(db_path: str, timer: SQLiteTimer, seed: int) -> int:
+    """Complete seasons (seeded per season by SeasonRunner); the field size stays constant"""
+    conn = sqlite3.connect(db_path, factory=TimedConnection)
+    conn.timer = timer
+    player_holes = 0
+    try:
+        with timer.patched(SEASON_WRITES):
+            for season_num in range(1, PREHISTORY_SEASONS + 1):
+                active = conn.execute("SELECT COUNT(*) FROM players WHERE current_status = 'active'").fetchone()[0]
+                runner = run_complete_season.SeasonRunner(season_num, db_path=db_path, write_reports=False)
+                if not runner.run_complete_season(conn=conn):
+                    raise RuntimeError(f"Season {season_num} failed")
+                player_holes += SEASON_EVENTS * active * EVENT_HOLES
+    finally:
+        conn.close()
+    return player_holes
+
+
+def _field_skills(db_path: str) -> np.ndarray:
+    conn = sqlite3.connect(db_path)
+    try:
+        return np.array(conn.execute(f"SELECT {', '.join(SKILL_COLUMNS)} FROM players ORDER BY id").fetchall())
+    finally:
+        conn.close()
+
+
+def bench_monday_qualifiers(db_path: str, timer: SQLiteTimer, seed: int) -> int:
+    skills = _field_skills(db_path)
+    player_ids, ratings = np.arange(1, len(skills) + 1), total_skill(skills)
+    courses = [CourseModel.from_holes(c, f'Benchmark Course {c}', QUALIFIER_PARS, np.linspace(35, 75, QUALIFIER_HOLES))
+               for c in range(1, 4)]
+    qualifiers = [monday_qualifier(event, courses[event % len(courses)], player_ids, ratings)
+                  for event in range(1, SEASON_EVENTS + 1)]
+    run_qualifiers(qualifiers, SimulationStreams(seed), (1,))
+    return len(qualifiers) * len(player_ids) * QUALIFIER_HOLES
+
+
+def bench_outcome_engine(db_path: str, timer: SQLiteTimer, seed: int) -> int:
+    skills = _field_skills(db_path)
+    outcome = OutcomeEngine().run(np.arange(1, len(skills) + 1), total_skill(skills), skills[:, COMPOSURE_INDEX],
+                                  simulations=OUTCOME_SIMULATIONS, seed=seed)
+    return outcome.simulations * len(skills) * EVENT_HOLES
+
+
+BENCHMARKS: Dict[str, Callable[[str, SQLiteTimer, int], int]] = {
+    'regular_season_event': bench_regular_season_event,
+    'gauntlet_tournament': bench_gauntlet_tournament,
+    'regular_season': bench_regular_season,
+    'prehistory': bench_prehistory,
+    'monday_qualifiers': bench_monday_qualifiers,
+    'outcome_engine': bench_outcome_engine
+}
+
+
+def run_benchmark(name: str, field_size: int, seed: int = BENCHMARK_SEED) -> Dict:
+    """Run one benchmark on a fresh synthetic field and measure it"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = make_field_db(tmp_dir, field_size, seed)
+        timer = SQLiteTimer()
+        tracemalloc.start()
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            player_holes = BENCHMARKS[name](db_path, timer, seed)
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        shutil.rmtree(tmp_dir)
+    return {
+        'benchmark': name,
+        'field_size': field_size,
+        'seconds': round(seconds, 4),
+        'player_holes': player_holes,
+        'player_holes_per_sec': round(player_holes / seconds, 1),
+        'peak_memory_mb': round(peak / 2 ** 20, 2),
+        'sqlite_write_seconds': round(timer.seconds, 4)
+    }
+
+
+def run_benchmarks(names: List[str], field_sizes: List[int], seed: int = BENCHMARK_SEED) -> Dict:
+    """Run every benchmark at every field size"""
+    results = []
+    for name in names:
+        for field_size in field_sizes:
+            result = run_benchmark(name, field_size, seed)
+            print(f"⏱️  {name:<22} {field_size:>5} players  {result['seconds']:8.3f}s  "
+                  f"{result['player_holes_per_sec']:>14,.0f} player-holes/s  "
+                  f"{result['peak_memory_mb']:8.1f} MB  SQLite {result['sqlite_write_seconds']:.3f}s", file=sys.stderr)
+            results.append(result)
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'machine': {
+            'python': platform.python_version(), 'numpy': np.__version__,
+            'platform': platform.platform(), 'processor': platform.processor()
+        },
+        'seed': seed,
+        'results': results
+    }
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[str]:
+    """
+    Regressions of `current` against `baseline`, as readable lines.
+
+    A benchmark regresses when its throughput falls, or its peak memory or
+    SQLite write time rises, by more than `threshold` (relative).
+    Benchmarks missing from either run are skipped.
+    """
+    previous = {(r['benchmark'], r['field_size']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        before = previous.get((result['benchmark'], result['field_size']))
+        if before is None:
+            continue
+        label = f"{result['benchmark']} ({result['field_size']} players)"
+        throughput = result['player_holes_per_sec'] / before['player_holes_per_sec'] - 1
+        if throughput < -threshold:
+            regressions.append(f"{label}: throughput {throughput:+.1%} "
+                               f"({before['player_holes_per_sec']:,.0f} -> {result['player_holes_per_sec']:,.0f} player-holes/s)")
+        for metric, unit in (('peak_memory_mb', 'MB'), ('sqlite_write_seconds', 's')):
+            # Ignore noise on measurements too small to matter
+            if before[metric] > 0 and result[metric] - before[metric] > 0.01 and result[metric] / before[metric] - 1 > threshold:
+                regressions.append(f"{label}: {metric} {result[metric] / before[metric] - 1:+.1%} "
+                                   f"({before[metric]} -> {result[metric]} {unit})")
+    return regressions
+
+
+def missed_targets(current: Dict) -> List[str]:
+    """Documented throughput targets missed by `current`, as readable lines"""
+    missed = []
+    for result in current['results']:
+        if result['benchmark'] == 'outcome_engine' and result['field_size'] == THROUGHPUT_FIELD_SIZE:
+            simulations_per_sec = result['player_holes_per_sec'] / (result['field_size'] * EVENT_HOLES)
+            if simulations_per_sec < THROUGHPUT_TARGET:
+                missed.append(f"outcome_engine ({result['field_size']} players): {simulations_per_sec:,.0f} "
+                              f"simulations/s, target {THROUGHPUT_TARGET:,}")
+        target = SECONDS_TARGETS.get((result['benchmark'], result['field_size']))
+        if target is not None and result['seconds'] > target:
+            missed.append(f"{result['benchmark']} ({result['field_size']} players): {result['seconds']:.2f}s, "
+                          f"target {target:.2f}s")
+    return missed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark simulator throughput across field sizes")
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        help='Benchmarks to run (default: all)')
+    parser.add_argument('--sizes', nargs='+', type=int, default=FIELD_SIZES, help='Field sizes (default: 75 156 600 5000)')
+    parser.add_argument('--seed', type=int, default=BENCHMARK_SEED, help='Seed for fields and simulation')
+    parser.add_argument('--output', help='Write the JSON results to this file (default: stdout)')
+    parser.add_argument('--compare', help='Baseline JSON to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Relative change flagged as a regression (default: 0.10)')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.benchmarks, args.sizes, args.seed)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"💾 Benchmark results saved to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(results, indent=2))
+
+    missed = missed_targets(results)
+    for line in missed:
+        print(f"❌ {line}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_results(json.load(f), results, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) against {args.compare}:", file=sys.stderr)
+            for line in regressions:
+                print(f"   {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"✅ No regressions against {args.compare} (threshold {args.threshold:.0%})", file=sys.stderr)
+    if missed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Fit simulator constants to target scoring distributions.
+
+Runs a grid search with common random numbers (core/calibration.py) over
+the prehistory's active players:
+
+- stroke model: randomness x performance points per stroke, on a Gauntlet course,
+  against scoring average, winning score and top-rated win share
+- field model: event_luck_factor x randomness_factor, against top-rated win share
+
+    python scripts/calibration/calibrate_simulators.py --runs 2000 --output calibration.json
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+import numpy as np
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+sys.path.append(REPO_DIR)
+sys.path.append(os.path.join(REPO_DIR, 'prehistory', 'scripts', 'tournament_simulation', 'gauntlet'))
+
+from core.calibration import (CalibrationTargets, calibrate_field_model, calibrate_stroke_model,
+                              parameter_grid)
+from core.field_simulator import COMPOSURE_INDEX, SKILL_COLUMNS, total_skill
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import hole_type_ratings
+from gauntlet_tournament_simulator import GauntletTournamentSimulator
+
+DB_PATH = os.path.join(REPO_DIR, 'prehistory', 'data', 'prehistory.db')
+
+STROKE_GRID = {'randomness': [10.0, 15.0, 20.0, 25.0], 'performance_per_stroke': [20.0, 25.0, 30.0, 35.0, 40.0]}
+FIELD_GRID = {'event_luck_factor': [0.10, 0.15, 0.20, 0.25, 0.30], 'randomness_factor': [0.4, 0.6, 0.8, 1.0]}
+
+
+def load_skills(db_path: str) -> np.ndarray:
+    """(n_players x 12) skill matrix of the active players"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(f'''
+            SELECT {', '.join(SKILL_COLUMNS)}
+            FROM players
+            WHERE current_status = 'active'
+            ORDER BY id
+        ''').fetchall()
+    finally:
+        conn.close()
+    return np.array(rows, dtype=np.float64)
+
+
+def print_points(title, points, limit=5):
+    print(f"\n🎯 {title} (best {limit} of {len(points)})")
+    for point in points[:limit]:
+        metrics = ', '.join(f"{name} {value:.3f}" for name, value in point.metrics.items())
+        print(f"   loss {point.loss:10.3f}  {point.params}  {metrics}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate simulator constants against target scoring distributions")
+    parser.add_argument('--db', default=DB_PATH, help='Players database (default: prehistory.db)')
+    parser.add_argument('--runs', type=int, default=1000, help='Simulated events per parameter set')
+    parser.add_argument('--seed', type=int, default=1, help='Seed of the common random numbers')
+    parser.add_argument('--scoring-average', type=float, default=71.0, help='Target strokes per round')
+    parser.add_argument('--winning-to-par', type=float, default=-15.0, help='Target 72-hole winning score to par')
+    parser.add_argument('--top-rated-win-share', type=float, default=0.30, help='Target share of wins by the top 10 rated')
+    parser.add_argument('--output', help='Write all evaluated points as JSON')
+    args = parser.parse_args()
+
+    skills = load_skills(args.db)
+    print(f"📊 Calibrating on {len(skills)} active players, {args.runs} events per parameter set")
+    streams = SimulationStreams(args.seed)
+    targets = CalibrationTargets(args.scoring_average, args.winning_to_par, args.top_rated_win_share)
+
+    course = GauntletTournamentSimulator(args.seed).get_course(0, 1)
+    stroke_points = calibrate_stroke_model(course, hole_type_ratings(skills), parameter_grid(**STROKE_GRID),
+                                           targets, streams, args.runs)
+    field_points = calibrate_field_model(total_skill(skills), skills[:, COMPOSURE_INDEX], parameter_grid(**FIELD_GRID),
+                                         targets, streams, args.runs)
+    print_points("Stroke model", stroke_points)
+    print_points("Field model", field_points)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'targets': targets.targets(), 'runs': args.runs, 'seed': args.seed,
+                'stroke_model': [vars(point) for point in stroke_points],
+                'field_model': [vars(point) for point in field_points]
+            }, f, indent=2)
+        print(f"\n💾 Calibration results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Apply the schema migrations (core/migrations.py) to our databases.
+
+Migrates every given database, or every known one that exists, and with
+--check fails when a hot query still scans a whole table.
+
+    python scripts/utilities/migrate_databases.py --check
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+sys.path.append(REPO_DIR)
+
+from core.migrations import full_table_scans, migrate, schema_version
+
+DATABASES = (
+    os.path.join(REPO_DIR, 'prehistory', 'data', 'prehistory.db'),
+    os.path.join(REPO_DIR, 'data', 'golf_tournaments.db'),
+    os.path.join(REPO_DIR, 'data', 'golf_players.db'),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply schema migrations to the simulation databases")
+    parser.add_argument('databases', nargs='*', help='Database files (default: every known database that exists)')
+    parser.add_argument('--check', action='store_true', help='Fail if a hot query still scans a whole table')
+    args = parser.parse_args()
+
+    failed = False
+    for db_path in args.databases or [path for path in DATABASES if os.path.exists(path)]:
+        conn = sqlite3.connect(db_path)
+        try:
+            created = migrate(conn)
+            print(f"✅ {db_path}: schema version {schema_version(conn)}, {len(created)} indexes created")
+            if args.check:
+                for name, steps in full_table_scans(conn).items():
+                    failed = True
+                    print(f"❌ {name}: {'; '.join(steps)}")
+        finally:
+            conn.close()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
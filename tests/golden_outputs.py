@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Golden-output harness for the simulators.
+
+Runs the regular-season simulator, the Gauntlet tournament simulator and the
+payout calculator at fixed seeds on a scratch copy of a frozen prehistory.db
+snapshot and reduces their output to a compact digest: per-event top-10
+rankings, hashes of the full rankings, totals and season standings, and
+summary statistics of the score distributions. The digest is stored in
+tests/golden/digests.json and later runs are compared against it:
+
+    python tests/golden_outputs.py                   # exact: rankings and hashes must match
+    python tests/golden_outputs.py --tolerance 0.02  # statistical: summary stats within 2%
+    python tests/golden_outputs.py --update          # re-record after an intended change
+
+Exact mode proves an optimization did not change a single result. Tolerance
+mode is for engines that are statistically equivalent but not bit-identical
+(different stream layout, float summation order): only the summary
+statistics are compared, relative to the recorded values.
+
+The snapshot is a copy of prehistory.db kept in tests/golden/ because season
+runs and migrations write to the live database; the digest records its hash
+so a changed snapshot is reported rather than read as simulator drift.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional
+
+import numpy as np
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(REPO_DIR)
+sys.path.append(os.path.join(REPO_DIR, 'prehistory', 'scripts', 'simulation'))
+sys.path.append(os.path.join(REPO_DIR, 'prehistory', 'scripts', 'tournament_simulation', 'gauntlet'))
+
+from core.payout_calculator import PayoutCalculator
+from gauntlet_tournament_simulator import GauntletTournamentSimulator
+from regular_season_simulator import RegularSeasonSimulator
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+SNAPSHOT_DB = os.path.join(GOLDEN_DIR, 'prehistory_snapshot.db')
+DIGEST_PATH = os.path.join(GOLDEN_DIR, 'digests.json')
+
+GOLDEN_SEED = 20240101
+REGULAR_SEASON_EVENTS = 35
+GAUNTLET_EVENTS = 3
+# Gauntlet tournament ids used on the scratch database
+GAUNTLET_TOURNAMENT_BASE = 9000
+TOP_N = 10
+
+# Payout scenarios: (event type, tournament name, purse)
+PAYOUT_SCENARIOS = [
+    ('standard', None, 9000000),
+    ('invitational', None, 20000000),
+    ('major', 'The Sovereign Tournament', 23000000)
+]
+
+
+def sha256(values) -> str:
+    """Hash of a sequence of values in a platform-independent text form"""
+    return hashlib.sha256(json.dumps(values, separators=(',', ':')).encode()).hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def distribution_stats(values) -> Dict[str, float]:
+    """Summary statistics compared in tolerance mode"""
+    values = np.asarray(values, dtype=np.float64)
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    return {
+        'mean': round(float(values.mean()), 6), 'std': round(float(values.std()), 6),
+        'best': round(float(values.min() if values.size else 0), 6),
+        'p10': round(float(p10), 6), 'p50': round(float(p50), 6), 'p90': round(float(p90), 6)
+    }
+
+
+def event_digest(ranking: List[int], totals: List[float]) -> Dict:
+    """Digest of one event: ranking in finishing order and totals in the same order"""
+    ranking = [int(player_id) for player_id in ranking]
+    totals = [round(float(t), 6) for t in totals]
+    return {
+        'top': ranking[:TOP_N],
+        'ranking_sha256': sha256(ranking),
+        'totals_sha256': sha256(totals),
+        'stats': distribution_stats(totals)
+    }
+
+
+def regular_season_digest(db_path: str, seed: int = GOLDEN_SEED, num_events: int = REGULAR_SEASON_EVENTS) -> Dict:
+    """Events and season standings of a regular season on the snapshot's active players"""
+    simulator = RegularSeasonSimulator(db_path, season_num=1)
+    with redirect_stdout(io.StringIO()):
+        players = simulator.load_active_players(seed)
+        events = simulator.simulate_events(players, seed, num_events=num_events)
+    standings = simulator.calculate_season_standings(events)
+    # Standings sort by points only; hash them in a tie-independent order
+    points = sorted((int(s['player_id']), int(s['total_points'])) for s in standings)
+    standings_points = sorted((s['total_points'] for s in standings), reverse=True)
+    return {
+        'events': [event_digest([r['player_id'] for r in event], [-r['performance'] for r in event])
+                   for event in events],
+        'standings_sha256': sha256(points),
+        'standings_stats': distribution_stats(standings_points)
+    }
+
+
+def gauntlet_digest(db_path: str, seed: int = GOLDEN_SEED, num_events: int = GAUNTLET_EVENTS) -> Dict:
+    """Gauntlet tournaments (played and saved on the scratch database)"""
+    events = []
+    for event_number in range(1, num_events + 1):
+        simulator = GauntletTournamentSimulator(seed)
+        simulator.db_path = db_path
+        with redirect_stdout(io.StringIO()):
+            results = simulator.simulate_tournament(f"Golden Gauntlet {event_number}",
+                                                    GAUNTLET_TOURNAMENT_BASE + event_number, event_number)
+        digest = event_digest([r['player_id'] for r in results], [r['total_score'] for r in results])
+        digest['positions_sha256'] = sha256([[int(r['player_id']), int(r['position']), int(r['points_earned'])] for r in results])
+        events.append(digest)
+    return {'events': events}
+
+
+def payout_leaderboard(field_size: int = 70) -> List[Dict]:
+    """Fixed made-cut leaderboard with ties at 2nd, 10th and 40th"""
+    positions = list(range(1, field_size + 1))
+    for start, count in ((2, 2), (10, 3), (40, 4)):
+        positions[start - 1:start - 1 + count] = [start] * count
+    return [{'player_id': 100 + i, 'name': f'Player {i}', 'position': position, 'made_cut': True}
+            for i, position in enumerate(positions)]
+
+
+def payout_digest() -> Dict:
+    """Payouts of every scenario on the fixed leaderboard"""
+    digests = {}
+    for event_type, tournament_name, purse in PAYOUT_SCENARIOS:
+        with redirect_stdout(io.StringIO()):
+            payouts = PayoutCalculator().calculate_final_payouts(payout_leaderboard(), purse, event_type, tournament_name)
+        amounts = [p['amount'] for p in payouts]
+        digests[tournament_name or event_type] = {
+            'top': amounts[:TOP_N],
+            'payouts_sha256': sha256([[int(p['player_id']), int(p['position']), int(p['amount'])] for p in payouts]),
+            'stats': {'total': float(sum(amounts)), 'winner': float(amounts[0]), 'paid': float(len(amounts))}
+        }
+    return digests
+
+
+def build_digests(seed: int = GOLDEN_SEED, snapshot: str = SNAPSHOT_DB) -> Dict:
+    """Run every simulator on a scratch copy of the snapshot and digest the output"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir, 'prehistory.db')
+        shutil.copy(snapshot, db_path)
+        return {
+            'snapshot_sha256': file_sha256(snapshot),
+            'seed': seed,
+            'regular_season': regular_season_digest(db_path, seed),
+            'gauntlet': gauntlet_digest(db_path, seed),
+            'payouts': payout_digest()
+        }
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+# Digest entries identifying the run; they must match in every mode
+IDENTITY_KEYS = ('snapshot_sha256', 'seed')
+
+
+def compare_digests(expected, actual, tolerance: Optional[float] = None, path: str = '',
+                    in_stats: bool = False) -> List[str]:
+    """
+    Differences between two digests, as readable lines (empty = no drift).
+
+    With `tolerance` (relative), only summary statistics (the '*stats' entries)
+    are compared, within the tolerance; rankings and hashes are ignored.
+    The snapshot hash and seed always have to match.
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in sorted(set(expected) | set(actual)):
+            key_path = f"{path}.{key}" if path else key
+            if key not in expected or key not in actual:
+                differences.append(f"{key_path}: only in {'actual' if key in actual else 'expected'}")
+            elif key in IDENTITY_KEYS and not path:
+                differences.extend(compare_digests(expected[key], actual[key], None, key_path))
+            else:
+                differences.extend(compare_digests(expected[key], actual[key], tolerance, key_path,
+                                                   in_stats or key.endswith('stats')))
+        return differences
+    if isinstance(expected, list) and isinstance(actual, list):
+        if tolerance is not None and not in_stats and path.endswith('.top'):
+            return []
+        if len(expected) != len(actual):
+            return [f"{path}: length {len(expected)} != {len(actual)}"]
+        differences = []
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            differences.extend(compare_digests(e, a, tolerance, f"{path}[{i}]", in_stats))
+        return differences
+    if tolerance is not None:
+        if not in_stats:
+            return []
+        if abs(actual - expected) > tolerance * max(abs(expected), 1.0):
+            return [f"{path}: {actual} not within {tolerance:.1%} of {expected}"]
+        return []
+    return [] if expected == actual else [f"{path}: expected {expected!r}, got {actual!r}"]
+
+
+def load_digests(path: str = DIGEST_PATH) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_digests(digests: Dict, path: str = DIGEST_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(digests, f, indent=2)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare simulator output against the golden digests")
+    parser.add_argument('--update', action='store_true', help='Re-record the golden digests')
+    parser.add_argument('--tolerance', type=float, help='Compare summary statistics within this relative tolerance')
+    parser.add_argument('--digests', default=DIGEST_PATH, help='Digest file (default: tests/golden/digests.json)')
+    args = parser.parse_args()
+
+    actual = build_digests()
+    if args.update:
+        save_digests(actual, args.digests)
+        print(f"✅ Golden digests recorded in {args.digests}")
+        return
+
+    differences = compare_digests(load_digests(args.digests), actual, args.tolerance)
+    mode = f"tolerance {args.tolerance:.1%}" if args.tolerance is not None else "exact"
+    if differences:
+        print(f"❌ {len(differences)} difference(s) from the golden digests ({mode}):")
+        for line in differences:
+            print(f"   {line}")
+        sys.exit(1)
+    print(f"✅ Simulator output matches the golden digests ({mode})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Shared builders for the simulator tests
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'scripts', 'tournament_simulation', 'gauntlet'))
+
+from core.course_model import CourseModel
+from gauntlet_tournament_simulator import GauntletTournamentSimulator
+
+PREHISTORY_DB = os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'data', 'prehistory.db')
+
+# Par 72: two par-36 nines
+PARS = [4, 4, 3, 5, 4, 4, 3, 4, 5, 4, 4, 3, 5, 4, 4, 3, 4, 5]
+
+
+def make_course(course_id=1, name='Test Course', difficulty=(40, 70)):
+    """18-hole course on PARS whose difficulty rises evenly from the first hole to the last"""
+    return CourseModel.from_holes(course_id, name, PARS, np.linspace(*difficulty, 18))
+
+
+def make_simulator(seed=7):
+    """Gauntlet simulator on a scratch copy of prehistory.db with all 600 players active"""
+    tmp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(tmp_dir, 'prehistory.db')
+    shutil.copy(PREHISTORY_DB, db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE players SET current_status = 'active'")
+    conn.commit()
+    conn.close()
+    simulator = GauntletTournamentSimulator(seed)
+    simulator.db_path = db_path
+    return simulator, tmp_dir
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the batched calibration harness
+"""
+
+import numpy as np
+
+from core.calibration import (CalibrationTargets, calibrate_field_model, calibrate_stroke_model,
+                              parameter_grid, stroke_model_metrics)
+from core.field_simulator import COMPOSURE_INDEX, total_skill
+from core.rng_streams import SimulationStreams
+from helpers import make_course
+
+
+def make_field(n_players=40):
+    skills = np.random.default_rng(6).uniform(40, 90, (n_players, 12))
+    course = make_course(1, 'Calibration Course', (35, 75))
+    return course, skills
+
+
+def test_common_random_numbers():
+    """Repeated parameter sets see identical draws; metrics move monotonically with the parameters"""
+    course, _ = make_field()
+    ratings = np.random.default_rng(1).uniform(55, 80, (40, 3))
+    grid = [{'performance_per_stroke': 20.0}, {'performance_per_stroke': 30.0}, {'performance_per_stroke': 20.0}]
+    metrics = stroke_model_metrics(course, ratings, grid, SimulationStreams(3), runs=150, batch_runs=40)
+    print(f"   {metrics}")
+    assert metrics[0] == metrics[2]
+    assert metrics[1]['scoring_average'] < metrics[0]['scoring_average']
+    assert metrics[1]['winning_to_par'] < metrics[0]['winning_to_par']
+    assert 0 <= metrics[0]['top_rated_win_share'] <= 1
+
+
+def test_stroke_model_grid_recovers_known_parameters():
+    """Targets produced by one grid point are fitted best by that point"""
+    course, _ = make_field()
+    ratings = np.random.default_rng(1).uniform(55, 80, (40, 3))
+    truth = {'randomness': 20.0, 'performance_per_stroke': 30.0}
+    known = stroke_model_metrics(course, ratings, [truth], SimulationStreams(3), runs=200)[0]
+    targets = CalibrationTargets(**known)
+
+    grid = parameter_grid(randomness=[10.0, 15.0, 20.0, 25.0], performance_per_stroke=[25.0, 30.0, 35.0])
+    points = calibrate_stroke_model(course, ratings, grid, targets, SimulationStreams(3), runs=200)
+    print(f"   Best fit: {points[0].params} (loss {points[0].loss:.4f})")
+    assert points[0].params == truth
+    assert points[0].loss == 0.0
+    assert all(a.loss <= b.loss for a, b in zip(points, points[1:]))
+
+
+def test_field_model_fits_win_share():
+    """The regular-season model is fitted on the top-rated win share only"""
+    _, skills = make_field(60)
+    grid = parameter_grid(event_luck_factor=[0.1, 0.25, 0.4], randomness_factor=[0.4, 0.8])
+    targets = CalibrationTargets(scoring_average=71.0, top_rated_win_share=0.5)
+    points = calibrate_field_model(total_skill(skills), skills[:, COMPOSURE_INDEX], grid, targets,
+                                   SimulationStreams(5), runs=300)
+    for point in points:
+        assert set(point.metrics) == {'top_rated_win_share'}
+        assert np.isclose(point.loss, ((point.metrics['top_rated_win_share'] - 0.5) / 0.05) ** 2)
+    shares = {tuple(point.params.values()): point.metrics['top_rated_win_share'] for point in points}
+    # More event luck spreads the wins around
+    assert shares[(0.4, 0.4)] < shares[(0.1, 0.4)]
+
+
+if __name__ == "__main__":
+    test_common_random_numbers()
+    test_stroke_model_grid_recovers_known_parameters()
+    test_field_model_fits_win_share()
+    print("✅ Calibration tests passed")
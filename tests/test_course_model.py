@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled course model and the course-driven tournament simulator
+"""
+
+import os
+import sqlite3
+import tempfile
+
+import numpy as np
+
+from core.course_model import load_course_model, clear_course_cache, CourseModel
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import TournamentSimulator
+
+PARS = [4, 5, 3, 4, 4, 3, 4, 5, 4, 4, 4, 3, 5, 4, 4, 3, 4, 4]
+
+
+def create_course_db(path):
+    """Small golf_courses.db with one course"""
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE courses (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE course_characteristics (
+            course_id INTEGER, design_strategy REAL, narrowness_factor REAL, hazard_density REAL,
+            green_speed REAL, turf_firmness REAL, rough_length REAL, elevation REAL, terrain_difficulty REAL
+        );
+        CREATE TABLE holes (
+            course_id INTEGER, hole_number INTEGER, par INTEGER, yardage INTEGER,
+            handicap INTEGER, difficulty_modifier REAL
+        );
+    ''')
+    conn.execute("INSERT INTO courses VALUES (1, 'Test National')")
+    conn.execute("INSERT INTO course_characteristics VALUES (1, 0.5, 0.6, 0.5, 0.7, 0.5, 0.4, 250, 0.3)")
+    yardage = {3: 190, 4: 430, 5: 560}
+    for hole, par in enumerate(PARS, 1):
+        conn.execute("INSERT INTO holes VALUES (1, ?, ?, ?, ?, 1.0)", (hole, par, yardage[par], hole))
+    conn.commit()
+    conn.close()
+
+
+def test_course_compiles_and_caches():
+    """Holes load into contiguous arrays once; later loads come from the cache"""
+    clear_course_cache()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'golf_courses.db')
+        create_course_db(db_path)
+
+        course = load_course_model(1, db_path)
+        print(f"⛳ {course.name}: par {course.total_par}, difficulty {course.difficulty.min():.1f}-{course.difficulty.max():.1f}")
+        assert list(course.par) == PARS
+        assert course.total_par == sum(PARS)
+        assert course.par.flags['C_CONTIGUOUS'] and course.difficulty.flags['C_CONTIGUOUS']
+        assert course.factors['green_speed'] == 0.7
+        # Stroke index 1 is the hardest hole on an otherwise uniform course
+        assert np.argmax(course.difficulty) == 0 and np.argmin(course.difficulty) == 17
+
+        os.remove(db_path)
+        assert load_course_model(1, db_path) is course
+    clear_course_cache()
+
+
+def test_simulator_uses_course_pars():
+    """Event holes repeat the course; better players score lower on average"""
+    course = CourseModel.from_holes(5, 'Synthetic', PARS, np.full(18, 55.0))
+    simulator = TournamentSimulator(course, SimulationStreams(3), (1, 1))
+    assert simulator.total_holes == 72
+    assert list(simulator.par[18:36]) == PARS
+
+    ratings = np.array([45.0, 75.0] * 100)
+    result = simulator.simulate(np.arange(200), ratings)
+    assert result.strokes.shape == (200, 72)
+    assert np.array_equal(result.round_scores.sum(axis=1), result.totals)
+    assert result.totals[1::2].mean() < result.totals[0::2].mean()
+
+    # Any hole can be replayed on its own
+    np.testing.assert_array_equal(simulator.simulate_hole(np.arange(200), ratings, 40), result.strokes[:, 39])
+
+
+if __name__ == "__main__":
+    test_course_compiles_and_caches()
+    test_simulator_uses_course_pars()
+    print("✅ Course model tests passed")
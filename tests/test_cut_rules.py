@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for cut processing after round 2
+"""
+
+import sqlite3
+
+import numpy as np
+
+from core.cut_rules import apply_cut, cut_line_score
+from core.live_simulation import LiveTournament
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import TournamentSimulator
+from helpers import make_course
+
+
+def test_position_cut_keeps_ties():
+    """Top N and ties advance; 'none' and oversized cuts keep everyone"""
+    scores = np.array([140, 138, 145, 141, 141, 150])
+    assert list(apply_cut(scores, 'position', 3)) == [True, True, False, True, True, False]
+    assert cut_line_score(scores, 'position', 3) == 141
+    assert apply_cut(scores, 'none', None).all()
+    assert apply_cut(scores, 'position', 10).all()
+
+    # Batched: each row is cut on its own
+    batch = np.array([[1, 2, 3, 4], [4, 3, 3, 1]])
+    assert apply_cut(batch, 'position', 2).tolist() == [[True, True, False, False], [False, True, True, True]]
+
+    try:
+        apply_cut(scores, 'score', 2)
+        assert False, "unknown cut type should raise"
+    except ValueError:
+        pass
+
+
+def test_only_survivors_play_the_weekend():
+    """Missed-cut players have no weekend strokes and rank below everyone who made it"""
+    course = make_course(2, 'Cut Course', (40, 75))
+    rng = np.random.default_rng(8)
+    player_ids = np.arange(1, 157)
+    ratings = rng.uniform(50, 80, (156, 3))
+    streams = SimulationStreams(21)
+
+    result = TournamentSimulator(course, streams, (1, 1), cut_type='position', cut_value=65).simulate(player_ids, ratings)
+    uncut = TournamentSimulator(course, streams, (1, 1)).simulate(player_ids, ratings)
+
+    made = result.made_cut
+    print(f"   {made.sum()} of {len(made)} players made the cut")
+    assert made.sum() >= 65 and made.sum() < 156
+    assert np.all(result.round_scores[~made, 2:] == 0)
+    assert np.all(result.round_scores[made, 2:] > 0)
+    assert result.positions[made].max() < result.positions[~made].min()
+    # Survivors play exactly the holes they would have without a cut
+    np.testing.assert_array_equal(result.strokes[made], uncut.strokes[made])
+    np.testing.assert_array_equal(result.round_scores[:, :2], uncut.round_scores[:, :2])
+    assert uncut.made_cut.all()
+
+
+def test_two_round_event_has_no_cut():
+    """A configured cut is only made when rounds are left to play after it"""
+    course = make_course(2, 'Cut Course', (40, 75))
+    player_ids = np.arange(1, 41)
+    ratings = np.random.default_rng(8).uniform(50, 80, (40, 3))
+    simulator = TournamentSimulator(course, SimulationStreams(21), (1, 2), rounds=2, cut_type='position', cut_value=10)
+
+    result = simulator.simulate(player_ids, ratings)
+    assert result.made_cut.all()
+    assert np.all(result.round_scores > 0)
+    assert np.all(np.diff(result.totals[result.order]) >= 0)
+
+
+def test_live_tournament_applies_cut():
+    """The live simulation cuts after round 2 and matches the batch result"""
+    course = make_course(3, 'Live Cut', (45, 70))
+    rng = np.random.default_rng(4)
+    player_ids = np.arange(10, 40)
+    ratings = rng.uniform(55, 75, 30)
+
+    conn = sqlite3.connect(':memory:')
+    live = LiveTournament.start(conn, 6, course, player_ids, ratings, seed=5, cut_type='position', cut_value=12)
+    live.play_wave()
+    live.play_wave()
+    resumed = LiveTournament.resume(conn, 6, course=course)
+    assert resumed.made_cut.sum() >= 12 and not resumed.made_cut.all()
+    while not resumed.is_complete:
+        resumed.step()
+
+    batch = TournamentSimulator(course, SimulationStreams(5), (6,), cut_type='position',
+                                cut_value=12).simulate(player_ids, ratings)
+    np.testing.assert_array_equal(resumed.made_cut, batch.made_cut)
+    np.testing.assert_array_equal(resumed.strokes, batch.totals)
+    board = resumed.leaderboard()
+    assert [row['made_cut'] for row in board] == sorted((row['made_cut'] for row in board), reverse=True)
+
+
+if __name__ == "__main__":
+    test_position_cut_keeps_ties()
+    test_only_survivors_play_the_weekend()
+    test_two_round_event_has_no_cut()
+    test_live_tournament_applies_cut()
+    print("✅ Cut rule tests passed")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized Gauntlet tournament simulator
+"""
+
+import io
+import os
+import shutil
+import sys
+from contextlib import redirect_stdout
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'scripts', 'tournament_simulation', 'gauntlet'))
+
+from core.tournament_simulator import TournamentSimulator
+from gauntlet_tournament_simulator import GauntletTournamentSimulator
+from helpers import make_simulator
+
+
+def test_ratings_match_weighted_attributes():
+    """Array ratings equal the 70/30 physical (by par type) / mental weighted sums"""
+    simulator = GauntletTournamentSimulator(1)
+    row = (1, 'A', 25, 'USA', 80, 70, 60, 50, 40, 90, 80, 70, 60, 50, 40, 30)
+    par_4_physical = 80 * 0.30 + 70 * 0.30 + 60 * 0.30 + 50 * 0.05 + 40 * 0.05
+    mental = 90 * 0.20 + 80 * 0.15 + 70 * 0.20 + 60 * 0.10 + 50 * 0.10 + 40 * 0.15 + 30 * 0.10
+    ratings = simulator.calculate_player_ratings([row])
+    assert ratings.shape == (1, 3)
+    np.testing.assert_allclose(ratings[0, 1], par_4_physical * 0.7 + mental * 0.3)
+
+
+def test_strokes_match_scalar_rule():
+    """Vectorized stroke conversion follows max(1, round(par + (100 - perf) / 25))"""
+    performance = np.array([[100.0, 62.5, 37.5, 0.0]])
+    pars = np.array([4, 4, 3, 5])
+    expected = [[max(1, round(par + (100 - perf) / 25)) for perf, par in zip(performance[0], pars)]]
+    np.testing.assert_array_equal(TournamentSimulator.performance_to_strokes(performance, pars), expected)
+
+
+def test_course_is_drawn_once_per_tournament():
+    """Every round of a Gauntlet event is played on the same cached course"""
+    simulator = GauntletTournamentSimulator(3)
+    course = simulator.get_course(77, 4)
+    assert simulator.get_course(77, 4) is course
+    assert course.holes == 18
+    assert set(course.par[4:14]) == {4}
+    assert np.all((course.difficulty >= 0) & (course.difficulty <= 100))
+
+
+def test_full_field_tournament_is_reproducible():
+    """A 600-player event is ranked by total and reproduces at a fixed seed"""
+    simulator, tmp_dir = make_simulator()
+    try:
+        with redirect_stdout(io.StringIO()):
+            first = simulator.simulate_tournament("Gauntlet Test", 901, 1)
+
+        assert len(first) == 600
+        positions = [r['position'] for r in first]
+        assert positions[:2] == [1, 2]
+        # Tied totals share the best position (competition ranking)
+        for i, r in enumerate(first[1:], start=1):
+            expected = positions[i - 1] if r['total_score'] == first[i - 1]['total_score'] and i > 1 else i + 1
+            assert r['position'] == expected
+        assert all(r['total_score'] == r['round_1'] + r['round_2'] + r['round_3'] + r['round_4'] for r in first)
+        assert first[0]['total_score'] <= first[-1]['total_score']
+
+        rerun = GauntletTournamentSimulator(7)
+        rerun.db_path = simulator.db_path
+        with redirect_stdout(io.StringIO()):
+            second = rerun.simulate_tournament("Gauntlet Test", 902, 1)
+        assert [(r['player_id'], r['total_score']) for r in first] == [(r['player_id'], r['total_score']) for r in second]
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    test_ratings_match_weighted_attributes()
+    test_strokes_match_scalar_rule()
+    test_course_is_drawn_once_per_tournament()
+    test_full_field_tournament_is_reproducible()
+    print("✅ Gauntlet simulator tests passed")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for the golden-output harness: simulator output must not drift
+"""
+
+import copy
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'scripts', 'simulation'))
+
+from golden_outputs import SNAPSHOT_DB, build_digests, compare_digests, file_sha256, load_digests
+from core.migrations import migrate
+from run_complete_season import SeasonRunner
+
+PREHISTORY_DB = os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'data', 'prehistory.db')
+
+
+def test_simulators_match_golden_digests():
+    """Regular season, Gauntlet and payouts reproduce the recorded digests exactly"""
+    differences = compare_digests(load_digests(), build_digests())
+    for line in differences[:10]:
+        print(f"   {line}")
+    assert differences == []
+
+
+def test_tolerance_mode_compares_statistics_only():
+    """Hash and ranking changes are drift in exact mode only; stats must stay within tolerance"""
+    expected = load_digests()
+    actual = copy.deepcopy(expected)
+    actual['gauntlet']['events'][0]['ranking_sha256'] = '0' * 64
+    actual['gauntlet']['events'][0]['top'].reverse()
+    actual['gauntlet']['events'][0]['stats']['mean'] *= 1.005
+
+    changed = {line.split(':')[0] for line in compare_digests(expected, actual)}
+    assert {'gauntlet.events[0].ranking_sha256', 'gauntlet.events[0].stats.mean',
+            'gauntlet.events[0].top[0]'} <= changed
+    assert all(path.startswith('gauntlet.events[0].') for path in changed)
+    assert compare_digests(expected, actual, tolerance=0.01) == []
+
+    actual['regular_season']['standings_stats']['std'] *= 1.05
+    differences = compare_digests(expected, actual, tolerance=0.01)
+    print(f"   {differences}")
+    assert differences == [f"regular_season.standings_stats.std: {actual['regular_season']['standings_stats']['std']} "
+                           f"not within 1.0% of {expected['regular_season']['standings_stats']['std']}"]
+
+
+def test_snapshot_and_seed_always_match():
+    """A different snapshot or seed is reported even in tolerance mode"""
+    expected = load_digests()
+    actual = dict(expected, snapshot_sha256='f' * 64, seed=expected['seed'] + 1)
+    assert [line.split(':')[0] for line in compare_digests(expected, actual, tolerance=0.5)] == ['seed', 'snapshot_sha256']
+
+
+def test_golden_digests_survive_a_migrated_season_run():
+    """Migrating and running a season on a prehistory.db leaves the frozen snapshot and the digests alone"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir, 'prehistory.db')
+        shutil.copy(PREHISTORY_DB, db_path)
+        before = file_sha256(db_path)
+        conn = sqlite3.connect(db_path)
+        migrate(conn)
+        conn.close()
+        assert SeasonRunner(99, db_path=db_path, write_reports=False).run_complete_season()
+        assert file_sha256(db_path) != before
+        
+        assert os.path.abspath(SNAPSHOT_DB) != os.path.abspath(PREHISTORY_DB)
+        assert file_sha256(SNAPSHOT_DB) == load_digests()['snapshot_sha256']
+        assert compare_digests(load_digests(), build_digests()) == []
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    test_simulators_match_golden_digests()
+    test_tolerance_mode_compares_statistics_only()
+    test_snapshot_and_seed_always_match()
+    test_golden_digests_survive_a_migrated_season_run()
+    print("✅ Golden-output tests passed")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming leaderboard generator API
+"""
+
+import numpy as np
+
+from core.field_simulator import FieldSimulator
+from core.leaderboard import LeaderboardTracker, stream_field_result, stream_leaderboard
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import TournamentSimulator
+from helpers import make_course
+
+
+def make_event(cut_value=30):
+    course = make_course(1, 'Stream Course')
+    simulator = TournamentSimulator(course, SimulationStreams(14), (1,), cut_type='position', cut_value=cut_value)
+    ids = np.arange(1, 61)
+    ratings = np.random.default_rng(2).uniform(55, 75, (60, 3))
+    return simulator, ids, ratings
+
+
+def test_tracker_positions_ties_and_movers():
+    """Positions share ties, order keeps tied players in previous order, movement is tracked"""
+    tracker = LeaderboardTracker(4)
+    first = tracker.update(np.array([0, -1, -1, 2]), event_hole=1)
+    assert list(first.order) == [1, 2, 0, 3]
+    assert list(first.positions) == [3, 1, 1, 4]
+    assert list(first.tied) == [False, True, True, False]
+
+    second = tracker.update(np.array([-3, -1, 0, 2]), event_hole=2)
+    assert list(second.order) == [0, 1, 2, 3]
+    assert list(second.movement) == [2, -1, -2, 0]
+    assert list(second.movers()['up']) == [0]
+    assert list(second.movers()['down']) == [2, 1]
+    assert second.rows(np.array([10, 11, 12, 13]))[0]['player_id'] == 10
+
+
+def test_hole_snapshots_match_final_result():
+    """One snapshot per hole; the last one agrees with TournamentSimulator.simulate"""
+    simulator, ids, ratings = make_event()
+    snapshots = list(stream_leaderboard(simulator, ids, ratings))
+    result = simulator.simulate(ids, ratings)
+
+    assert [s.event_hole for s in snapshots] == list(range(1, 73))
+    final = snapshots[-1]
+    np.testing.assert_array_equal(final.made_cut, result.made_cut)
+    np.testing.assert_array_equal(final.to_par, result.totals - np.where(result.made_cut, 288, 144))
+    # Weekend players lead; within groups the order is by score
+    assert np.all(final.made_cut[final.order[:result.made_cut.sum()]])
+    ranked = final.to_par[final.order[:result.made_cut.sum()]]
+    assert np.all(np.diff(ranked) >= 0)
+
+    # The cut shows from the end of round 2
+    assert snapshots[34].made_cut.all() and not snapshots[35].made_cut.all()
+    # Snapshots are independent of later holes
+    assert snapshots[0].holes_played.max() == 1
+
+
+def test_round_snapshots_and_field_replay():
+    """every='round' yields four snapshots; FieldSimulator events replay to their ranking"""
+    simulator, ids, ratings = make_event(cut_value=None)
+    rounds = list(stream_leaderboard(simulator, ids, ratings, every='round'))
+    assert [s.round_number for s in rounds] == [1, 2, 3, 4]
+    assert [s.event_hole for s in rounds] == [18, 36, 54, 72]
+
+    rng = np.random.default_rng(4)
+    field = FieldSimulator().simulate(rng.uniform(55, 70, 40), rng.uniform(40, 90, 40), rng=np.random.default_rng(1))
+    replay = list(stream_field_result(field))
+    assert len(replay) == 4
+    final_positions = replay[-1].positions
+    assert final_positions[field.order[0]] == 1
+    assert np.all(np.diff(np.rint(field.totals[replay[-1].order])) <= 0)
+
+
+if __name__ == "__main__":
+    test_tracker_positions_ties_and_movers()
+    test_hole_snapshots_match_final_result()
+    test_round_snapshots_and_field_replay()
+    print("✅ Leaderboard tests passed")
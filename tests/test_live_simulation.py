@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for resumable hole-by-hole live tournament simulation
+"""
+
+import sqlite3
+
+import numpy as np
+
+from core.live_simulation import LiveTournament, tee_waves
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import TournamentSimulator
+from helpers import make_course, PARS
+
+
+def make_field(size=30):
+    rng = np.random.default_rng(5)
+    return np.arange(100, 100 + size), rng.uniform(55, 75, (size, 3))
+
+
+def test_full_live_event_matches_batch_simulation():
+    """Stepping hole by hole reproduces TournamentSimulator.simulate exactly"""
+    course = make_course(7, 'Live Links')
+    player_ids, ratings = make_field()
+    conn = sqlite3.connect(':memory:')
+    live = LiveTournament.start(conn, 12, course, player_ids, ratings, seed=77)
+    while not live.is_complete:
+        live.step()
+
+    batch = TournamentSimulator(course, SimulationStreams(77), (12,)).simulate(player_ids, ratings)
+    np.testing.assert_array_equal(live.strokes, batch.totals)
+    np.testing.assert_array_equal(live.round_scores, batch.round_scores)
+    assert live.status == 'complete'
+    assert live.step() == 0
+
+
+def test_restart_resumes_without_replaying():
+    """A fresh object loaded from SQLite continues to the same final scores"""
+    course = make_course(7, 'Live Links')
+    player_ids, ratings = make_field()
+    waves = tee_waves(np.repeat(np.arange(1, 11), 3))
+    assert list(np.bincount(waves)) == [15, 15]
+
+    uninterrupted = LiveTournament.start(sqlite3.connect(':memory:'), 3, course, player_ids, ratings, waves, seed=9)
+    for _ in range(4):
+        uninterrupted.play_wave(0)
+        uninterrupted.play_wave(1)
+
+    conn = sqlite3.connect(':memory:')
+    live = LiveTournament.start(conn, 3, course, player_ids, ratings, waves, seed=9)
+    live.play_wave(0)
+    for _ in range(5):
+        live.step(wave=1)
+    # Morning wave is finished for the round and waits for the afternoon wave
+    assert live.step(wave=0) == 0
+
+    resumed = LiveTournament.resume(conn, 3, course=course)
+    assert resumed.current_round == 1
+    np.testing.assert_array_equal(resumed.holes_played[waves == 1], 5)
+    while not resumed.is_complete:
+        resumed.play_wave(1)
+        resumed.play_wave(0)
+    np.testing.assert_array_equal(resumed.strokes, uninterrupted.strokes)
+    assert LiveTournament.resume(conn, 999, course=course) is None
+
+
+def test_leaderboard_scores_to_par():
+    """Leaderboard is sorted by score to par and shares positions on ties"""
+    course = make_course(7, 'Live Links')
+    player_ids, ratings = make_field(12)
+    live = LiveTournament.start(sqlite3.connect(':memory:'), 1, course, player_ids, ratings, seed=2)
+    for _ in range(9):
+        live.step()
+
+    board = live.leaderboard()
+    scores = [row['to_par'] for row in board]
+    assert scores == sorted(scores)
+    assert all(row['thru'] == 9 and row['round'] == 1 for row in board)
+    for previous, row in zip(board, board[1:]):
+        if row['to_par'] == previous['to_par']:
+            assert row['position'] == previous['position']
+    by_id = {row['player_id']: row for row in board}
+    i = 0
+    assert by_id[int(player_ids[i])]['to_par'] == live.strokes[i] - sum(PARS[:9])
+
+
+if __name__ == "__main__":
+    test_full_live_event_matches_batch_simulation()
+    test_restart_resumes_without_replaying()
+    test_leaderboard_scores_to_par()
+    print("✅ Live simulation tests passed")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized mental game (confidence, pressure, fatigue)
+"""
+
+import sqlite3
+
+import numpy as np
+
+from core.field_simulator import SKILL_COLUMNS
+from core.live_simulation import LiveTournament
+from core.mental_state import MentalState
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import TournamentSimulator
+from helpers import make_course
+
+
+def make_skills(size, seed=3):
+    return np.random.default_rng(seed).uniform(40, 90, (size, len(SKILL_COLUMNS)))
+
+
+def test_state_updates_as_arrays():
+    """Birdies raise confidence, bogeys lower it less for resilient players; fatigue builds and recovers"""
+    skills = np.full((3, len(SKILL_COLUMNS)), 50.0)
+    skills[2, SKILL_COLUMNS.index('resilience')] = 100.0
+    mental = MentalState.from_skills(skills)
+    assert mental.confidence.dtype == np.float32
+
+    mental.update(np.array([-1, 1, 1]))
+    assert mental.confidence[0] > 0 > mental.confidence[2] > mental.confidence[1]
+    assert np.all(mental.fatigue > 0)
+    fatigue = mental.fatigue.copy()
+    mental.start_round()
+    np.testing.assert_allclose(mental.fatigue, fatigue * 0.5)
+
+    # Pressure: closing holes and the final round, felt less with high composure
+    assert mental.hole_pressure(5, 1, 4) == 0
+    assert mental.hole_pressure(17, 4, 4) > mental.hole_pressure(17, 3, 4) > 0
+    skills[1, SKILL_COLUMNS.index('composure')] = 95.0
+    calm = MentalState.from_skills(skills)
+    multiplier = calm.rating_multiplier(1.0)
+    assert multiplier[1] > multiplier[0]
+
+    restored = MentalState.from_arrays(mental.to_arrays())
+    np.testing.assert_array_equal(restored.confidence, mental.confidence)
+    np.testing.assert_array_equal(mental.subset(np.array([2])).resilience, [1.0])
+
+
+def test_mental_game_in_tournament():
+    """Mental state changes scores and is reproducible"""
+    course = make_course(1, 'Mental Course')
+    skills = make_skills(600)
+    ids = np.arange(1, 601)
+    ratings = np.random.default_rng(1).uniform(55, 75, 600)
+    simulator = TournamentSimulator(course, SimulationStreams(5), (0, 1), cut_type='position', cut_value=65)
+
+    plain = simulator.simulate(ids, ratings)
+    first = simulator.simulate(ids, ratings, mental=MentalState.from_skills(skills))
+    second = simulator.simulate(ids, ratings, mental=MentalState.from_skills(skills))
+
+    np.testing.assert_array_equal(first.strokes, second.strokes)
+    assert not np.array_equal(first.strokes, plain.strokes)
+
+
+def test_live_mental_state_matches_batch():
+    """The live simulation saves mental state and reproduces the batch run"""
+    course = make_course(2, 'Mental Live')
+    skills = make_skills(24, seed=9)
+    ids = np.arange(50, 74)
+    ratings = np.random.default_rng(2).uniform(55, 75, (24, 3))
+    waves = np.repeat([0, 1], 12)
+
+    conn = sqlite3.connect(':memory:')
+    live = LiveTournament.start(conn, 8, course, ids, ratings, waves, seed=4, cut_type='position',
+                                cut_value=10, mental=MentalState.from_skills(skills))
+    live.play_wave(0)
+    live.step(wave=1)
+    live = LiveTournament.resume(conn, 8, course=course)
+    while not live.is_complete:
+        live.play_wave(1)
+        live.play_wave(0)
+
+    batch = TournamentSimulator(course, SimulationStreams(4), (8,), cut_type='position', cut_value=10)
+    result = batch.simulate(ids, ratings, waves, mental=MentalState.from_skills(skills))
+    np.testing.assert_array_equal(live.strokes, result.totals)
+
+
+if __name__ == "__main__":
+    test_state_updates_as_arrays()
+    test_mental_game_in_tournament()
+    test_live_mental_state_matches_batch()
+    print("✅ Mental state tests passed")
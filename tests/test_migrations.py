@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for schema migrations and the hot query plan check
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+
+from core.migrations import HOT_QUERIES, MIGRATIONS, full_table_scans, migrate, schema_version
+
+PREHISTORY_DB = os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'data', 'prehistory.db')
+
+
+def test_hot_queries_use_indexes():
+    """Every hot query scans a table before the migrations and none does after"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir, 'prehistory.db')
+        shutil.copy(PREHISTORY_DB, db_path)
+        conn = sqlite3.connect(db_path)
+        before = full_table_scans(conn)
+        print(f"   Full scans before migrating: {len(before)} of {len(HOT_QUERIES)} queries")
+        assert before
+        
+        created = migrate(conn)
+        assert schema_version(conn) == MIGRATIONS[-1].version
+        assert 'idx_tournament_results_tournament_id' in created
+        assert full_table_scans(conn) == {}
+        assert migrate(conn) == []
+        
+        # The check fails as soon as an index goes missing
+        conn.execute("DROP INDEX idx_season_player_stats_season_id_player_id")
+        assert 'season standings' in full_table_scans(conn)
+        conn.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_indexes_follow_each_schema():
+    """Only tables and columns a database has are indexed; tables added later get theirs on the next run"""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE tournaments (id INTEGER PRIMARY KEY, season INTEGER, season_event TEXT)')
+    conn.execute('CREATE TABLE tournament_fields (tournament_id INTEGER, player_id INTEGER)')
+    assert migrate(conn) == ['idx_tournament_fields_tournament_id']
+    assert schema_version(conn) == 1
+    
+    conn.execute('CREATE TABLE tournament_results (id INTEGER PRIMARY KEY, tournament_id INTEGER, player_name TEXT)')
+    assert migrate(conn) == ['idx_tournament_results_tournament_id']
+    assert 'event results' not in full_table_scans(conn)
+    assert conn.execute("SELECT COUNT(*) FROM schema_migrations").fetchone()[0] == len(MIGRATIONS)
+
+
+if __name__ == "__main__":
+    test_hot_queries_use_indexes()
+    test_indexes_follow_each_schema()
+    print("✅ Migration tests passed")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the Monte Carlo tournament outcome engine
+"""
+
+import numpy as np
+
+from core.outcome_engine import OutcomeEngine
+
+
+def make_field(size, seed=1):
+    """Synthetic field: ids, skill ratings and composure"""
+    rng = np.random.default_rng(seed)
+    return np.arange(1, size + 1), rng.uniform(55, 70, size), rng.uniform(30, 95, size)
+
+
+def test_probabilities_are_consistent():
+    """Win sums to 1, top-N to N, made cut to the cut size; positions form a distribution"""
+    ids, skill, composure = make_field(80)
+    outcome = OutcomeEngine(cut_size=40).run(ids, skill, composure, simulations=2000, seed=11)
+
+    print(f"📊 {outcome.simulations} simulations at {outcome.simulations_per_second:,.0f}/sec")
+    assert abs(outcome.win.sum() - 1.0) < 1e-9
+    assert abs(outcome.top_n[5].sum() - 5.0) < 1e-9
+    assert abs(outcome.top_n[10].sum() - 10.0) < 1e-9
+    assert abs(outcome.made_cut.sum() - 40.0) < 1e-9
+    np.testing.assert_allclose(outcome.position_distribution.sum(axis=0), 1.0)
+    np.testing.assert_allclose(outcome.position_distribution.sum(axis=1), 1.0)
+    assert np.all(outcome.top_n[5] >= outcome.win)
+    assert np.all(outcome.top_n[10] >= outcome.top_n[5])
+
+
+def test_missed_cut_players_finish_below_the_cut():
+    """Nobody who missed the cut finishes inside it: P(top N and missed cut) == 0"""
+    ids, skill, composure = make_field(60)
+    outcome = OutcomeEngine(cut_size=30, top_n=(10, 30)).run(ids, skill, composure, simulations=1000, seed=5)
+    cumulative = np.cumsum(outcome.position_distribution, axis=1)
+    for n in (10, 30):
+        # P(top N) <= P(made cut) for every player when only survivors can finish top N
+        assert np.all(outcome.top_n[n] <= outcome.made_cut + 1e-12)
+    # Survivors take exactly the first 30 places in every simulation
+    np.testing.assert_allclose(cumulative[:, 29], outcome.made_cut)
+
+
+def test_stronger_players_are_favoured():
+    """The best-rated player should have a higher win probability than the worst"""
+    ids, skill, composure = make_field(50)
+    outcome = OutcomeEngine().run(ids, skill, composure, simulations=2000, seed=3)
+    best, worst = np.argmax(skill), np.argmin(skill)
+    assert outcome.win[best] > outcome.win[worst]
+    assert outcome.expected_position[best] < outcome.expected_position[worst]
+    assert outcome.as_rows()[0]['win'] == outcome.win.max()
+
+
+def test_fixed_seed_is_reproducible():
+    """Same seed and batch size give identical probabilities"""
+    ids, skill, composure = make_field(30)
+    engine = OutcomeEngine(batch_size=100)
+    first = engine.run(ids, skill, composure, simulations=500, seed=9)
+    second = engine.run(ids, skill, composure, simulations=500, seed=9)
+    np.testing.assert_array_equal(first.position_distribution, second.position_distribution)
+
+
+if __name__ == "__main__":
+    test_probabilities_are_consistent()
+    test_missed_cut_players_finish_below_the_cut()
+    test_stronger_players_are_favoured()
+    test_fixed_seed_is_reproducible()
+    print("✅ Outcome engine tests passed")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for sudden-death playoffs and tied finishing positions
+"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from core.playoff import settle_result, shared_points, sudden_death, tied_positions
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import TournamentSimulator
+from helpers import make_course
+
+
+def make_event(seed=21):
+    course = make_course(1, 'Playoff Course')
+    simulator = TournamentSimulator(course, SimulationStreams(seed), (1,))
+    ids = np.arange(1, 41)
+    ratings = np.random.default_rng(3).uniform(55, 75, (40, 3))
+    return simulator, ids, ratings
+
+
+def forced_tie(simulator, ids, ratings, tied=(4, 9, 17)):
+    """Simulated result with the given field indices tied for first"""
+    result = simulator.simulate(ids, ratings)
+    totals = result.totals.copy()
+    best = totals.min() - 1
+    totals[list(tied)] = best
+    order = np.lexsort((totals, ~result.made_cut))
+    return replace(result, totals=totals, order=order)
+
+
+def test_tied_positions():
+    """Ties share the best position and missed cuts rank below the weekend field"""
+    totals = np.array([280, 278, 280, 285, 140, 278])
+    made_cut = np.array([True, True, True, True, False, True])
+    positions = tied_positions(totals, made_cut)
+    print(f"📊 Positions: {list(positions)}")
+    assert list(positions) == [3, 1, 3, 5, 6, 1]
+    assert list(tied_positions(np.array([70, 71, 72]))) == [1, 2, 3]
+
+
+def test_tied_players_split_points_rounded_down():
+    """2-way tie for 2nd: (599 + 598) / 2 rounds down to 598; 3-way tie for 4th shares 597, 596, 595"""
+    positions = np.array([1, 2, 2, 4, 4, 4, 7])
+    points = shared_points(positions, 600)
+    print(f"📊 Points: {list(points)}")
+    assert list(points) == [600, 598, 598, 596, 596, 596, 594]
+
+
+def test_only_tied_players_play_off():
+    """Sudden death is played by the tied players only and is reproducible"""
+    simulator, ids, ratings = make_event()
+    playoff = sudden_death(simulator, ids, ratings, np.array([4, 9, 17]))
+    print(f"⚔️  Playoff won by field index {playoff.winner} after {playoff.holes_played} hole(s)")
+
+    assert playoff.winner in (4, 9, 17)
+    assert playoff.holes_played >= 1
+    assert all(len(scores) <= 3 for scores in playoff.hole_scores)
+    assert playoff.eliminated_on[list(playoff.players).index(playoff.winner)] == 0
+    assert np.all(np.delete(playoff.eliminated_on, list(playoff.players).index(playoff.winner)) > 0)
+    # Playoff holes replay the finishing hole by default
+    assert all(np.all(scores >= 1) for scores in playoff.hole_scores)
+
+    again = sudden_death(simulator, ids, ratings, np.array([4, 9, 17]))
+    assert again.winner == playoff.winner and again.holes_played == playoff.holes_played
+
+
+def test_settle_result_puts_playoff_winner_first():
+    """The playoff winner is first; the other playoff players are tied second"""
+    simulator, ids, ratings = make_event()
+    result, playoff = settle_result(simulator, forced_tie(simulator, ids, ratings), ratings)
+
+    assert playoff is not None
+    assert result.order[0] == playoff.winner
+    assert result.positions[playoff.winner] == 1
+    losers = [i for i in (4, 9, 17) if i != playoff.winner]
+    assert list(result.positions[losers]) == [2, 2]
+    assert np.all(result.positions[result.order[3:]] >= 4)
+    assert np.all(np.diff(result.positions[result.order]) >= 0)
+
+
+def test_no_playoff_without_a_tie_for_first():
+    """A clear winner needs no playoff; other ties keep shared positions"""
+    simulator, ids, ratings = make_event()
+    result = simulator.simulate(ids, ratings)
+    totals = result.totals.copy()
+    totals[result.order[0]] = totals.min() - 1
+    result, playoff = settle_result(simulator, replace(result, totals=totals, order=np.argsort(totals, kind='stable')),
+                                    ratings)
+    assert playoff is None
+    assert result.positions[result.order[0]] == 1
+    assert np.array_equal(result.positions, tied_positions(totals, result.made_cut))
+
+
+if __name__ == "__main__":
+    test_tied_positions()
+    test_tied_players_split_points_rounded_down()
+    test_only_tied_players_play_off()
+    test_settle_result_puts_playoff_winner_first()
+    test_no_playoff_without_a_tie_for_first()
+    print("✅ Playoff tests passed")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for batched Monday qualifiers and Q-School
+"""
+
+import sqlite3
+
+import numpy as np
+
+from core.qualifiers import (MONDAY_ENTRY_METHOD, _rank, monday_qualifier, q_school, run_qualifiers,
+                             save_monday_qualifiers)
+from core.rng_streams import SimulationStreams
+from helpers import make_course
+
+
+def season_of_qualifiers(events=35, entrants=200):
+    rng = np.random.default_rng(5)
+    return [
+        monday_qualifier(100 + e, make_course(e % 3 + 1, difficulty=(35, 75)),
+                         np.arange(1, entrants + 1) + 1000 * e, rng.uniform(50, 80, (entrants, 3)))
+        for e in range(events)
+    ]
+
+
+def test_season_of_monday_qualifiers():
+    """35 qualifiers of 200 entrants are played in one batch; four advance from each"""
+    qualifiers = season_of_qualifiers()
+    results = run_qualifiers(qualifiers, SimulationStreams(8), (1,))
+
+    assert [r.qualifier_id for r in results] == [q.qualifier_id for q in qualifiers]
+    for result in results:
+        assert result.strokes.shape == (200, 18)
+        assert sorted(result.positions) == list(range(1, 201))
+        assert result.advanced.sum() == 4
+        advancers = result.advancers()
+        assert len(advancers) == 4
+        best = result.totals.min()
+        assert result.totals[result.order[0]] == best
+        assert np.all(result.totals[result.advanced] <= result.totals[~result.advanced].min())
+
+
+def test_qualifier_reproduces_regardless_of_batch():
+    """A qualifier's result depends only on its own entrants, id and the stream key"""
+    qualifiers = season_of_qualifiers(events=6, entrants=50)
+    streams = SimulationStreams(8)
+    batched = run_qualifiers(qualifiers, streams, (1,))
+    alone = run_qualifiers([qualifiers[3]], streams, (1,))[0]
+    np.testing.assert_array_equal(batched[3].strokes, alone.strokes)
+    np.testing.assert_array_equal(batched[3].positions, alone.positions)
+    assert not np.array_equal(batched[2].strokes, batched[3].strokes)
+
+
+def test_q_school_and_monday_spots():
+    """Q-School plays four rounds and five advance; a Monday qualifier of equal ratings still admits four"""
+    course = make_course(difficulty=(35, 75))
+    ids = np.arange(1, 301)
+    ratings = np.full(300, 65.0)
+    monday = monday_qualifier(7, course, ids[:40], ratings[:40])
+    school = q_school(1, course, ids, ratings)
+    monday_result, school_result = run_qualifiers([monday, school], SimulationStreams(3), (2,))
+
+    assert school_result.strokes.shape == (300, 72)
+    assert school_result.advanced.sum() == 5
+    assert monday_result.advanced.sum() == 4
+
+
+def tied_for_fourth(winner_holes, loser_holes=()):
+    """Cards of three leaders and two players on 72: the first tied card is 'loser', the second 'winner'"""
+    leaders = np.full((3, 18), 3)
+    loser = np.full(18, 4)
+    winner = np.full(18, 4)
+    for hole, strokes in loser_holes:
+        loser[hole - 1] = strokes
+    for hole, strokes in winner_holes:
+        winner[hole - 1] = strokes
+    assert loser.sum() == winner.sum() == 72
+    return np.vstack([leaders, loser, winner])
+
+
+def test_ties_for_last_spot_go_to_matching_cards():
+    """Back nine, last six, last three, last hole, then a draw decide a tie for the fourth spot"""
+    cards = [
+        tied_for_fourth([(1, 5), (10, 3)]),    # back nine 35 to 36
+        tied_for_fourth([(10, 5), (13, 3)]),   # back nine level, last six 23 to 24
+        tied_for_fourth([(13, 5), (16, 3)]),   # last six level, last three 11 to 12
+        tied_for_fourth([(16, 5), (18, 3)]),   # last three level, last hole 3 to 4
+    ]
+    strokes = np.vstack(cards)
+    event = np.repeat(np.arange(len(cards)), 5)
+    positions = _rank(strokes, event, np.zeros(len(strokes)))
+    print(f"🏌️  Card-off positions: {positions.reshape(len(cards), 5).tolist()}")
+    assert positions.reshape(len(cards), 5).tolist() == [[1, 2, 3, 5, 4]] * len(cards)
+
+    # Identical cards: the draw decides, whatever the field order
+    identical = tied_for_fourth([])
+    event = np.zeros(5, dtype=np.int64)
+    assert list(_rank(identical, event, np.array([0.1, 0.2, 0.3, 0.9, 0.4]))[3:]) == [5, 4]
+    assert list(_rank(identical, event, np.array([0.1, 0.2, 0.3, 0.4, 0.9]))[3:]) == [4, 5]
+
+
+def test_advancers_are_written_to_the_field():
+    """Only the advancing players are appended to tournament_fields, replacing earlier qualifiers"""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('''
+        CREATE TABLE tournament_fields (
+            tournament_id INTEGER, player_id INTEGER, entry_method TEXT,
+            starting_position INTEGER, group_number INTEGER, group_position INTEGER, tee_time TEXT
+        )
+    ''')
+    conn.executemany('INSERT INTO tournament_fields VALUES (100, ?, ?, ?, ?, ?, ?)',
+                     [(i, 'full_status', i, (i - 1) // 3 + 1, (i - 1) % 3 + 1, '09:00') for i in range(1, 8)])
+    results = run_qualifiers(season_of_qualifiers(events=2, entrants=30), SimulationStreams(4), (1,))
+
+    assert save_monday_qualifiers(conn, results) == 8
+    assert save_monday_qualifiers(conn, results) == 8
+    conn.commit()
+    rows = conn.execute('''
+        SELECT player_id, starting_position, group_number, group_position, tee_time
+        FROM tournament_fields WHERE tournament_id = 100 AND entry_method = ?
+        ORDER BY starting_position
+    ''', (MONDAY_ENTRY_METHOD,)).fetchall()
+    print(f"📋 Monday qualifiers added: {rows}")
+    assert [r[0] for r in rows] == list(results[0].advancers())
+    assert [r[1] for r in rows] == [8, 9, 10, 11]
+    assert [(r[2], r[3]) for r in rows] == [(4, 1), (4, 2), (4, 3), (5, 1)]
+    assert rows[0][4] == '09:09'
+    assert conn.execute('SELECT COUNT(*) FROM tournament_fields').fetchone()[0] == 15
+    conn.close()
+
+
+if __name__ == "__main__":
+    test_season_of_monday_qualifiers()
+    test_qualifier_reproduces_regardless_of_batch()
+    test_q_school_and_monday_spots()
+    test_ties_for_last_spot_go_to_matching_cards()
+    test_advancers_are_written_to_the_field()
+    print("✅ Qualifier tests passed")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test script to verify parallel event execution matches the serial season run
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'scripts', 'simulation'))
+
+from core.field_simulator import SKILL_COLUMNS
+from regular_season_simulator import PlayerSkills, RegularSeasonSimulator
+
+
+def make_field(size):
+    """Synthetic field with spread-out skills"""
+    players = []
+    for i in range(size):
+        data = {'id': 1000 + i, 'name': f'Player {i}', 'age': 25, 'nationality': 'USA'}
+        data.update({column: 40.0 + (i * 7 + j * 3) % 55 for j, column in enumerate(SKILL_COLUMNS)})
+        players.append(PlayerSkills(data))
+    return players
+
+
+def test_parallel_season_matches_serial():
+    """--workers N must merge results in event order, identical to the serial run"""
+    players = make_field(60)
+    simulator = RegularSeasonSimulator(':memory:', season_num=4)
+
+    serial = simulator.simulate_events(players, season_seed=4042, num_events=8)
+    parallel = simulator.simulate_events(players, season_seed=4042, num_events=8, workers=3)
+
+    print(f"   Serial winners:   {[event[0]['player_id'] for event in serial]}")
+    print(f"   Parallel winners: {[event[0]['player_id'] for event in parallel]}")
+    assert serial == parallel
+
+
+if __name__ == "__main__":
+    test_parallel_season_matches_serial()
+    print("✅ Parallel season test passed")
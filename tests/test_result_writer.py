@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for buffered bulk result writes
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'scripts', 'simulation'))
+
+from core.result_writer import BULK_LOAD_PRAGMAS, SEASON_STANDINGS, ResultWriter, connect
+from regular_season_simulator import RegularSeasonSimulator, season_seed
+
+PREHISTORY_DB = os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'data', 'prehistory.db')
+
+SEASON = 99
+
+RESULTS_QUERY = '''
+    SELECT t.event_number, tr.player_id, tr.position, tr.total_score, tr.points_earned
+    FROM tournament_results tr
+    JOIN tournaments t ON tr.tournament_id = t.id
+    WHERE t.season_number = ?
+    ORDER BY tr.id
+'''
+
+
+def test_rows_flushed_only_on_success():
+    """Buffered rows reach the table in one executemany per table, or not at all"""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE season_player_stats (season_id, player_id, total_season_points, final_rank, events_played)')
+    with ResultWriter(conn) as writer:
+        writer.extend(SEASON_STANDINGS, [(1, i, 100 - i, i + 1, 35) for i in range(50)])
+        assert conn.execute('SELECT COUNT(*) FROM season_player_stats').fetchone()[0] == 0
+    assert writer.rows_written == 50
+    assert conn.execute('SELECT SUM(final_rank) FROM season_player_stats').fetchone()[0] == sum(range(1, 51))
+
+    try:
+        with ResultWriter(conn) as writer:
+            writer.add(SEASON_STANDINGS, (2, 1, 10, 1, 35))
+            raise RuntimeError("interrupted")
+    except RuntimeError:
+        pass
+    assert writer.rows_written == 0
+    assert conn.execute('SELECT COUNT(*) FROM season_player_stats WHERE season_id = 2').fetchone()[0] == 0
+
+
+def test_season_results_match_per_event_saves():
+    """One-transaction season writes store exactly the rows of per-event saves"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        rows = {}
+        for mode in ('per_event', 'season'):
+            db_path = os.path.join(tmp_dir, f'{mode}.db')
+            shutil.copy(PREHISTORY_DB, db_path)
+            simulator = RegularSeasonSimulator(db_path, SEASON, bulk_load=(mode == 'season'))
+            players = simulator.load_active_players()
+            events = simulator.simulate_events(players, season_seed(SEASON))
+            standings = simulator.calculate_season_standings(events)
+            start = time.perf_counter()
+            if mode == 'per_event':
+                for event_num, event_results in enumerate(events, 1):
+                    simulator.save_event_results(event_results, event_num)
+                simulator.save_season_standings(standings)
+            else:
+                simulator.save_season_results(events, standings)
+            print(f"   {mode}: {(time.perf_counter() - start) * 1000:.1f} ms")
+            conn = sqlite3.connect(db_path)
+            rows[mode] = (conn.execute(RESULTS_QUERY, (SEASON,)).fetchall(),
+                          conn.execute('SELECT * FROM season_player_stats WHERE season_id = ? ORDER BY id',
+                                       (SEASON,)).fetchall())
+            conn.close()
+        assert len(rows['season'][0]) == 35 * len(players)
+        assert rows['season'][0] == rows['per_event'][0]
+        # Standings rows equal apart from the autoincrement id
+        assert [row[1:] for row in rows['season'][1]] == [row[1:] for row in rows['per_event'][1]]
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_bulk_load_pragmas():
+    """connect() applies the pragma profile to the new connection"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        conn = connect(os.path.join(tmp_dir, 'bulk.db'), BULK_LOAD_PRAGMAS)
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == 0
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'memory'
+        conn.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    test_rows_flushed_only_on_success()
+    test_season_results_match_per_event_saves()
+    test_bulk_load_pragmas()
+    print("✅ Result writer tests passed")
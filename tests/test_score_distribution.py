@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script for analytical score distributions, cross-checked against the Monte Carlo simulator
+"""
+
+import numpy as np
+
+from core.rng_streams import SimulationStreams
+from core.score_distribution import convolve_holes, hole_pmfs, tournament_distribution
+from core.tournament_simulator import TournamentSimulator
+from core.weather import TournamentWeather
+from helpers import make_course
+
+
+def make_event(n_players=16, weather=None):
+    course = make_course(1, 'Distribution Course', (35, 75))
+    simulator = TournamentSimulator(course, SimulationStreams(19), (1,), weather=weather)
+    ratings = np.random.default_rng(4).uniform(50, 90, (n_players, 3))
+    return simulator, np.arange(n_players), ratings
+
+
+def sampled_totals(simulator, ratings, runs):
+    """Monte Carlo totals (runs x players): each run is the field under fresh player ids"""
+    n_players = len(ratings)
+    ids = (np.arange(runs)[:, None] * 1000 + np.arange(n_players)).ravel()
+    result = simulator.simulate(ids, np.tile(ratings, (runs, 1)))
+    return result.totals.reshape(runs, n_players), result.strokes.reshape(runs, n_players, -1)
+
+
+def test_hole_pmfs_match_sampled_strokes():
+    """Per-hole PMFs sum to one and match sampled stroke frequencies"""
+    simulator, _, ratings = make_event(4)
+    pmfs = hole_pmfs(simulator, ratings)
+    np.testing.assert_allclose(pmfs.sum(axis=2), 1.0)
+
+    _, strokes = sampled_totals(simulator, ratings, 20000)
+    over_par = strokes - simulator.par
+    for k in range(pmfs.shape[2]):
+        frequency = (over_par == k).mean(axis=0)
+        assert np.abs(frequency - pmfs[:, :, k]).max() < 0.015
+
+
+def test_fft_and_direct_convolution_agree():
+    """Both convolution methods give the same total distribution"""
+    simulator, _, ratings = make_event(6)
+    pmfs = hole_pmfs(simulator, ratings)
+    np.testing.assert_allclose(convolve_holes(pmfs, 'fft'), convolve_holes(pmfs, 'direct'), atol=1e-12)
+
+
+def test_outcomes_match_monte_carlo():
+    """Exact win and top-5 probabilities agree with a simulated field"""
+    weather = TournamentWeather(*(np.full((4, 1), value) for value in (85.0, 18.0, 0.3, 70.0, 60.0)))
+    simulator, ids, ratings = make_event(weather=weather)
+    distribution = tournament_distribution(simulator, ids, ratings)
+    outcomes = distribution.outcomes(top_n=(5,))
+
+    runs = 6000
+    totals, _ = sampled_totals(simulator, ratings, runs)
+    winners = totals == totals.min(axis=1, keepdims=True)
+    sampled_win = (winners / winners.sum(axis=1, keepdims=True)).mean(axis=0)
+    strictly_better = (totals[:, None, :] < totals[:, :, None]).sum(axis=2)
+    sampled_top_5 = (strictly_better < 5).mean(axis=0)
+
+    print(f"   Exact win:   {np.round(outcomes['win'], 3)}")
+    print(f"   Sampled win: {np.round(sampled_win, 3)}")
+    assert np.isclose(outcomes['win'].sum(), 1.0)
+    assert outcomes['top_5'].sum() >= 5 - 1e-9
+    assert np.abs(outcomes['win'] - sampled_win).max() < 0.025
+    assert np.abs(outcomes['top_5'] - sampled_top_5).max() < 0.03
+    assert np.abs(distribution.mean() - totals.mean(axis=0)).max() < 0.3
+    assert np.abs(distribution.std() - totals.std(axis=0)).max() < 0.3
+    np.testing.assert_allclose(distribution.round_pmf.sum(axis=2), 1.0)
+
+
+def test_ties_for_first_are_split():
+    """Identical players share the win evenly and are all in the top N"""
+    simulator, _, _ = make_event()
+    ratings = np.full((3, 3), 70.0)
+    distribution = tournament_distribution(simulator, np.arange(3), ratings)
+    np.testing.assert_allclose(distribution.win_probability(), 1 / 3)
+    np.testing.assert_allclose(distribution.top_n_probability(3), 1.0)
+
+
+if __name__ == "__main__":
+    test_hole_pmfs_match_sampled_strokes()
+    test_fft_and_direct_convolution_agree()
+    test_outcomes_match_monte_carlo()
+    test_ties_for_first_are_split()
+    print("✅ Score distribution tests passed")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for the lookup-table score model
+"""
+
+import tempfile
+
+import numpy as np
+
+from core.rng_streams import SimulationStreams
+from core.score_distribution import stroke_pmf
+from core.score_table import SCORE_MIN, ScoreTable, ScoreTableSpec, clear_score_table_cache, get_score_table
+from core.tournament_simulator import TournamentSimulator
+from helpers import make_course
+
+
+def test_cells_hold_the_model_distribution():
+    """Each cell is the CDF of the analytical stroke PMF at the bin centre, sampled correctly"""
+    table = ScoreTable.build()
+    cdf = table.cells(70.0, 35.0)
+    pmf = stroke_pmf(np.clip(70.0 / 36.0 * 50, 0, 100), 15.0, 25.0)
+    np.testing.assert_allclose(np.diff(cdf, prepend=0.0)[-SCORE_MIN:], pmf)
+    assert np.all(np.diff(table.cdf, axis=2) >= 0) and np.all(table.cdf[..., -1] == 1.0)
+    assert list(table.outcomes[:3]) == [-2, -1, 0]
+
+    u = np.random.default_rng(2).random(100000)
+    strokes = table.strokes(np.full(len(u), 70.0), 35.0, 4, u)
+    frequency = np.bincount(strokes - 4 - SCORE_MIN, minlength=len(cdf)) / len(u)
+    print(f"   Sampled: {np.round(frequency, 3)}")
+    assert np.abs(frequency - np.diff(cdf, prepend=0.0)).max() < 0.01
+
+
+def test_simulator_with_table_matches_arithmetic():
+    """Same streams, same strokes except near bin edges"""
+    course = make_course(1, 'Table Course', (35, 75))
+    ratings = np.random.default_rng(4).uniform(50, 90, (500, 3))
+    ids = np.arange(len(ratings))
+    arithmetic = TournamentSimulator(course, SimulationStreams(19), (1,)).simulate(ids, ratings)
+    lookup = TournamentSimulator(course, SimulationStreams(19), (1,), score_table=get_score_table()).simulate(ids, ratings)
+
+    mismatch = (arithmetic.strokes != lookup.strokes).mean()
+    print(f"   Strokes differing from the arithmetic model: {mismatch:.4%}")
+    assert mismatch < 0.01
+    assert abs(arithmetic.totals.mean() - lookup.totals.mean()) < 0.1
+
+    try:
+        TournamentSimulator(course, SimulationStreams(19), (1,), randomness=20.0, score_table=get_score_table())
+        assert False, "Mismatched score table accepted"
+    except ValueError:
+        pass
+
+
+def test_disk_cache_round_trip():
+    """Tables are saved once and reloaded from the cache directory"""
+    spec = ScoreTableSpec(randomness=10.0, rating_step=1.0, difficulty_step=1.0)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        clear_score_table_cache()
+        built = get_score_table(spec, cache_dir)
+        assert get_score_table(spec, cache_dir) is built
+        clear_score_table_cache()
+        loaded = get_score_table(spec, cache_dir)
+        assert loaded is not built
+        assert loaded.spec == spec
+        np.testing.assert_array_equal(loaded.cdf, built.cdf)
+    clear_score_table_cache()
+
+
+if __name__ == "__main__":
+    test_cells_hold_the_model_distribution()
+    test_simulator_with_table_matches_arithmetic()
+    test_disk_cache_round_trip()
+    print("✅ Score table tests passed")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for packed hole-by-hole scorecard storage
+"""
+
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from core.rng_streams import SimulationStreams
+from core.scorecard_store import NOT_PLAYED, load_scorecards, save_scorecards
+from core.tournament_simulator import TournamentSimulator
+from helpers import make_course, make_simulator
+
+
+def simulate_event():
+    course = make_course(1, 'Card Course')
+    ids = np.arange(1, 41)
+    ratings = np.random.default_rng(3).uniform(55, 75, 40)
+    simulator = TournamentSimulator(course, SimulationStreams(2), (1,), cut_type='position', cut_value=20)
+    return simulator, ids, simulator.simulate(ids, ratings)
+
+
+def test_round_trip_and_decoders():
+    """Stored int8 scores decode to the same strokes, rounds and standings"""
+    simulator, ids, result = simulate_event()
+    conn = sqlite3.connect(':memory:')
+    save_scorecards(conn, 5, ids, result.strokes, simulator.par)
+    cards = load_scorecards(conn, 5)
+
+    assert cards.to_par.dtype == np.int8
+    np.testing.assert_array_equal(cards.player_ids, ids)
+    np.testing.assert_array_equal(cards.strokes(), result.strokes)
+    np.testing.assert_array_equal(cards.round_scores(), result.round_scores)
+    np.testing.assert_array_equal(cards.holes_played, np.where(result.made_cut, 72, 36))
+    assert np.all(cards.to_par[~result.made_cut, 36:] == NOT_PLAYED)
+    assert load_scorecards(conn, 6) is None
+
+    # Final leaderboard ranks weekend players first, lowest total first
+    order, positions = cards.leaderboard_at(72)
+    finishers = order[:result.made_cut.sum()]
+    assert np.all(result.made_cut[finishers])
+    assert np.all(np.diff(result.totals[finishers]) >= 0)
+
+    # Leaderboard after round 1 is by 18-hole score relative to par, with shared positions on ties
+    _, positions = cards.leaderboard_at(18)
+    round_1 = result.round_scores[:, 0]
+    for i in range(len(ids)):
+        assert positions[i] == 1 + np.sum(round_1 < round_1[i])
+
+    np.testing.assert_allclose(cards.scoring_average(), np.where(result.made_cut, result.totals / 4, result.totals / 2))
+    stats = cards.hole_stats()
+    assert stats['average_to_par'].shape == (18,)
+    shares = sum(stats[name] for name in ('eagle_or_better', 'birdie', 'par', 'bogey', 'double_or_worse'))
+    np.testing.assert_allclose(shares, 1.0)
+
+
+def test_load_is_read_only():
+    """Looking up scorecards in a database without the table returns None and writes nothing"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir, 'empty.db')
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE tournaments (id INTEGER PRIMARY KEY)')
+        conn.close()
+        conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+        assert load_scorecards(conn, 1) is None
+        conn.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_gauntlet_saves_scorecards():
+    """Each Gauntlet event stores one scorecard row matching its results"""
+    simulator, tmp_dir = make_simulator(seed=3)
+    try:
+        with redirect_stdout(io.StringIO()):
+            results = simulator.simulate_tournament("Gauntlet Event #1", 1, 1)
+        conn = sqlite3.connect(simulator.db_path)
+        cards = load_scorecards(conn, 1)
+        rows = conn.execute('SELECT COUNT(*) FROM tournament_scorecards').fetchone()[0]
+        conn.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    assert rows == 1
+    totals = dict(zip(cards.player_ids.tolist(), cards.strokes().sum(axis=1).tolist()))
+    assert all(totals[r['player_id']] == r['total_score'] for r in results)
+    assert len(cards.player_ids) == len(results) == 600
+
+
+if __name__ == "__main__":
+    test_round_trip_and_decoders()
+    test_load_is_read_only()
+    test_gauntlet_saves_scorecards()
+    print("✅ Scorecard store tests passed")
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Test script for the in-process complete season stages on one shared connection
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+PREHISTORY_SCRIPTS = os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'scripts')
+sys.path.append(os.path.join(PREHISTORY_SCRIPTS, 'simulation'))
+
+from run_complete_season import SeasonRunner, fast_forward
+from age_up_players import age_players
+from cull_players_regular_season import relegate_players
+from generate_players import generate_players
+from regular_season_simulator import RegularSeasonSimulator, season_seed
+from season_checkpoint import load_progress
+from core.migrations import migrate
+
+PREHISTORY_DB = os.path.join(os.path.dirname(__file__), '..', 'prehistory', 'data', 'prehistory.db')
+
+SEASON = 99
+
+
+def scratch_db(migrated=True):
+    """Scratch copy of prehistory.db, migrated to the current schema; returns (tmp_dir, db_path)"""
+    tmp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(tmp_dir, 'prehistory.db')
+    shutil.copy(PREHISTORY_DB, db_path)
+    if migrated:
+        conn = sqlite3.connect(db_path)
+        migrate(conn)
+        conn.close()
+    return tmp_dir, db_path
+
+
+def simulate_short_season(conn, db_path, num_events=3):
+    """Simulate and save a few events plus standings on the shared connection"""
+    simulator = RegularSeasonSimulator(db_path, SEASON, conn=conn)
+    players = simulator.load_active_players()
+    events = simulator.simulate_events(players, season_seed(SEASON), num_events=num_events)
+    for event_num, event_results in enumerate(events, 1):
+        simulator.save_event_results(event_results, event_num)
+    simulator.save_season_standings(simulator.calculate_season_standings(events))
+    return len(players)
+
+
+def count(conn, sql, *params):
+    return conn.execute(sql, params).fetchone()[0]
+
+
+def test_simulator_writes_stay_in_shared_transaction():
+    """With a shared connection the simulator never commits; the owner decides"""
+    tmp_dir, db_path = scratch_db()
+    try:
+        conn = sqlite3.connect(db_path)
+        simulate_short_season(conn, db_path)
+        assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = ?", SEASON) == 3
+        conn.rollback()
+        assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = ?", SEASON) == 0
+
+        n_players = simulate_short_season(conn, db_path)
+        conn.commit()
+        conn.close()
+        other = sqlite3.connect(db_path)
+        assert count(other, "SELECT COUNT(*) FROM season_player_stats WHERE season_id = ?", SEASON) == n_players
+        other.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_player_stages_on_one_connection():
+    """Culling, aging and generation (without aging) as plain function calls"""
+    tmp_dir, db_path = scratch_db()
+    try:
+        conn = sqlite3.connect(db_path)
+        n_players = simulate_short_season(conn, db_path)
+        total = count(conn, "SELECT COUNT(*) FROM players")
+        ages = count(conn, "SELECT SUM(age) FROM players")
+
+        assert relegate_players(conn, SEASON, 50, report=False)
+        assert count(conn, "SELECT COUNT(*) FROM players WHERE current_status = 'active'") == n_players - 50
+
+        assert age_players(conn) == total
+        assert count(conn, "SELECT SUM(age) FROM players") == ages + total
+
+        new_ids = generate_players(num_players=5, introduction_season=SEASON + 1, name_suffix=f'S{SEASON + 1}',
+                                   age_players=False, conn=conn, report=False)
+        assert len(new_ids) == 5
+        assert count(conn, "SELECT SUM(age) FROM players WHERE id NOT IN (?, ?, ?, ?, ?)", *new_ids) == ages + total
+        assert count(conn, "SELECT COUNT(*) FROM players WHERE name LIKE ? AND age BETWEEN 19 AND 22",
+                     f'%S{SEASON + 1}') == 5
+        conn.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_failed_stage_rolls_back():
+    """A stage that raises or reports failure leaves nothing behind"""
+    tmp_dir, db_path = scratch_db()
+    try:
+        runner = SeasonRunner(SEASON, db_path=db_path)
+        runner.conn = sqlite3.connect(db_path)
+        ages = count(runner.conn, "SELECT SUM(age) FROM players")
+
+        def failing_stage():
+            age_players(runner.conn)
+            raise RuntimeError("interrupted")
+
+        assert not runner._run_stage("Failing stage", failing_stage)
+        assert not runner._run_stage("Rejected stage", lambda: age_players(runner.conn) and False)
+        assert count(runner.conn, "SELECT SUM(age) FROM players") == ages
+
+        assert runner._run_stage("Aging", lambda: age_players(runner.conn) > 0)
+        runner.conn.close()
+        other = sqlite3.connect(db_path)
+        assert count(other, "SELECT SUM(age) FROM players") > ages
+        other.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_fast_forward_writes_back_once():
+    """Seasons run in memory; the database file gets the final state, or the last checkpoint on failure"""
+    tmp_dir, db_path = scratch_db()
+    age_all_players = SeasonRunner.age_all_players
+    try:
+        assert fast_forward(11, 2, db_path, write_reports=False)
+        conn = sqlite3.connect(db_path)
+        for season in (11, 12):
+            assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = ?", season) == 35
+            assert count(conn, "SELECT COUNT(*) FROM players WHERE name LIKE ?", f'%S{season + 1}') == 50
+        assert count(conn, "SELECT COUNT(*) FROM players WHERE current_status = 'active'") == 100
+        conn.close()
+
+        # Season 14 fails at aging; its checkpointed simulation is written back
+        SeasonRunner.age_all_players = lambda runner: runner.season_num != 14 and age_all_players(runner)
+        assert not fast_forward(13, 3, db_path, checkpoint_every=1, write_reports=False)
+        conn = sqlite3.connect(db_path)
+        assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = 13") == 35
+        assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = 14") == 35
+        assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = 15") == 0
+        assert load_progress(conn, 14).stage == 'simulated'
+        conn.close()
+        
+        # Running the same job again resumes at season 14's aging
+        SeasonRunner.age_all_players = age_all_players
+        assert fast_forward(13, 3, db_path, write_reports=False)
+        conn = sqlite3.connect(db_path)
+        for season in (13, 14, 15):
+            assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = ?", season) == 35
+            assert count(conn, "SELECT COUNT(*) FROM players WHERE name LIKE ?", f'%S{season + 1}') == 50
+        assert load_progress(conn, 15).stage == 'complete'
+        conn.close()
+    finally:
+        SeasonRunner.age_all_players = age_all_players
+        shutil.rmtree(tmp_dir)
+
+
+def test_interrupted_season_resumes():
+    """An interrupted season resumes after its last saved event and matches an uninterrupted run"""
+    tmp_dir, db_path = scratch_db()
+    reference_path = os.path.join(tmp_dir, 'reference.db')
+    shutil.copy(db_path, reference_path)
+    save_event_results = RegularSeasonSimulator.save_event_results
+    simulate_event = RegularSeasonSimulator.simulate_event
+    standings_query = "SELECT player_id, total_season_points, final_rank FROM season_player_stats WHERE season_id = ? ORDER BY final_rank"
+    try:
+        assert SeasonRunner(SEASON, db_path=reference_path, write_reports=False).run_complete_season()
+        
+        def crash_at_event_20(simulator, event_results, event_num):
+            if event_num == 20:
+                raise RuntimeError("interrupted")
+            save_event_results(simulator, event_results, event_num)
+        
+        RegularSeasonSimulator.save_event_results = crash_at_event_20
+        assert not SeasonRunner(SEASON, db_path=db_path, write_reports=False).run_complete_season()
+        RegularSeasonSimulator.save_event_results = save_event_results
+        conn = sqlite3.connect(db_path)
+        assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = ?", SEASON) == 19
+        progress = load_progress(conn, SEASON)
+        assert progress.stage is None and progress.events_saved == 19
+        conn.close()
+        
+        # Resumes without prompting; events 1-19 are not simulated or saved again
+        simulated = []
+        RegularSeasonSimulator.simulate_event = lambda simulator, event_num, *args: (
+            simulated.append(event_num) or simulate_event(simulator, event_num, *args))
+        assert SeasonRunner(SEASON, db_path=db_path, write_reports=False).run_complete_season()
+        assert simulated == list(range(20, 36))
+        # A finished season is left alone
+        assert SeasonRunner(SEASON, db_path=db_path, write_reports=False).run_complete_season()
+        assert simulated == list(range(20, 36))
+        
+        conn = sqlite3.connect(db_path)
+        reference = sqlite3.connect(reference_path)
+        assert count(conn, "SELECT COUNT(DISTINCT event_number) FROM tournaments WHERE season_number = ?", SEASON) == 35
+        assert count(conn, "SELECT COUNT(*) FROM tournaments WHERE season_number = ?", SEASON) == 35
+        assert conn.execute(standings_query, (SEASON,)).fetchall() == reference.execute(standings_query, (SEASON,)).fetchall()
+        assert conn.execute("SELECT current_phase, status FROM simulation_state WHERE id = 1").fetchone() == \
+            (f'regular_season_{SEASON}_complete', 'completed')
+        conn.close()
+        reference.close()
+    finally:
+        RegularSeasonSimulator.save_event_results = save_event_results
+        RegularSeasonSimulator.simulate_event = simulate_event
+        shutil.rmtree(tmp_dir)
+
+
+def test_runner_requires_migrated_schema():
+    """An unmigrated database is refused and left untouched"""
+    tmp_dir, db_path = scratch_db(migrated=False)
+    try:
+        with open(db_path, 'rb') as f:
+            before = f.read()
+        assert not SeasonRunner(SEASON, db_path=db_path, write_reports=False).run_complete_season()
+        with open(db_path, 'rb') as f:
+            assert f.read() == before
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    test_simulator_writes_stay_in_shared_transaction()
+    test_player_stages_on_one_connection()
+    test_failed_stage_rolls_back()
+    test_fast_forward_writes_back_once()
+    test_interrupted_season_resumes()
+    test_runner_requires_migrated_schema()
+    print("✅ Season runner tests passed")
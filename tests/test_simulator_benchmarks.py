@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the simulator throughput benchmark suite
+"""
+
+import copy
+import io
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts', 'benchmarks'))
+
+import simulator_benchmarks
+from simulator_benchmarks import (SQLiteTimer, bench_prehistory, compare_results, make_field_db, missed_targets,
+                                  run_benchmarks)
+
+
+def test_benchmarks_report_json_metrics():
+    """Small fields run every per-event benchmark and report machine-readable metrics"""
+    results = run_benchmarks(['regular_season_event', 'gauntlet_tournament'], [75])
+    json.dumps(results)
+    assert [(r['benchmark'], r['field_size']) for r in results['results']] == [
+        ('regular_season_event', 75), ('gauntlet_tournament', 75)]
+    for result in results['results']:
+        print(f"   {result}")
+        assert result['player_holes'] == 75 * 72
+        assert result['player_holes_per_sec'] > 0
+        assert result['peak_memory_mb'] > 0
+        assert 0 < result['sqlite_write_seconds'] < result['seconds']
+
+
+def test_prehistory_runs_complete_seasons():
+    """The prehistory benchmark ages, culls and replaces players every season, not just simulates"""
+    tmp_dir = tempfile.mkdtemp()
+    seasons = simulator_benchmarks.PREHISTORY_SEASONS
+    try:
+        simulator_benchmarks.PREHISTORY_SEASONS = 2
+        db_path = make_field_db(tmp_dir, 60)
+        timer = SQLiteTimer()
+        with redirect_stdout(io.StringIO()):
+            assert bench_prehistory(db_path, timer, 1) == 2 * 35 * 60 * 72
+        assert timer.seconds > 0
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM players WHERE current_status = 'active'").fetchone()[0] == 60
+        assert conn.execute("SELECT COUNT(*) FROM players WHERE current_status != 'active'").fetchone()[0] == 100
+        assert conn.execute("SELECT COUNT(*) FROM players WHERE name LIKE '%S3'").fetchone()[0] == 50
+        # The original field (age 25) was aged once per season
+        assert conn.execute("SELECT DISTINCT age FROM players WHERE id <= 60").fetchall() == [(27,)]
+        conn.close()
+    finally:
+        simulator_benchmarks.PREHISTORY_SEASONS = seasons
+        shutil.rmtree(tmp_dir)
+
+
+def test_compare_flags_regressions():
+    """Throughput drops and memory/SQLite growth beyond the threshold are flagged"""
+    baseline = {'results': [
+        {'benchmark': 'regular_season', 'field_size': 600, 'player_holes_per_sec': 1000000.0,
+         'peak_memory_mb': 10.0, 'sqlite_write_seconds': 0.5},
+        {'benchmark': 'prehistory', 'field_size': 600, 'player_holes_per_sec': 1000000.0,
+         'peak_memory_mb': 10.0, 'sqlite_write_seconds': 5.0}
+    ]}
+    current = copy.deepcopy(baseline)
+    assert compare_results(baseline, current) == []
+
+    current['results'][0]['player_holes_per_sec'] = 850000.0
+    current['results'][1]['peak_memory_mb'] = 12.0
+    current['results'][1]['sqlite_write_seconds'] = 5.2
+    regressions = compare_results(baseline, current, threshold=0.10)
+    print(f"   {regressions}")
+    assert len(regressions) == 2
+    assert regressions[0].startswith('regular_season (600 players): throughput -15.0%')
+    assert regressions[1].startswith('prehistory (600 players): peak_memory_mb +20.0%')
+    assert compare_results(baseline, current, threshold=0.25) == []
+
+
+def test_outcome_engine_throughput_target():
+    """The outcome engine's simulations/sec target is checked on the benchmark results, not in the test run"""
+    def result(simulations_per_sec, field_size=156):
+        return {'benchmark': 'outcome_engine', 'field_size': field_size,
+                'player_holes_per_sec': simulations_per_sec * field_size * 72}
+
+    assert missed_targets({'results': [result(1500), result(10, field_size=5000)]}) == []
+    missed = missed_targets({'results': [result(800)]})
+    print(f"   {missed}")
+    assert missed == ['outcome_engine (156 players): 800 simulations/s, target 1,000']
+
+
+def test_seconds_targets():
+    """Benchmarks with a documented wall time are flagged when they run longer"""
+    def result(seconds, field_size=600):
+        return {'benchmark': 'gauntlet_tournament', 'field_size': field_size, 'seconds': seconds,
+                'player_holes_per_sec': 1.0}
+
+    assert missed_targets({'results': [result(1.2), result(60.0, field_size=5000)]}) == []
+    assert missed_targets({'results': [result(7.5)]}) == ['gauntlet_tournament (600 players): 7.50s, target 5.00s']
+
+
+def test_monday_qualifiers_benchmark():
+    """A season of Monday qualifiers is counted as 18 holes per entrant and qualifier"""
+    results = run_benchmarks(['monday_qualifiers'], [156])
+    result = results['results'][0]
+    print(f"   {result}")
+    assert result['player_holes'] == 35 * 156 * 18
+    assert result['sqlite_write_seconds'] == 0
+
+
+if __name__ == "__main__":
+    test_benchmarks_report_json_metrics()
+    test_prehistory_runs_complete_seasons()
+    test_compare_flags_regressions()
+    test_outcome_engine_throughput_target()
+    test_seconds_targets()
+    test_monday_qualifiers_benchmark()
+    print("✅ Benchmark suite tests passed")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script for the par-type skill weight matrices
+"""
+
+import numpy as np
+
+from core.course_model import CourseModel
+from core.rng_streams import SimulationStreams
+from core.skill_weights import load_skill_weights, effective_skills, par_type_index
+from core.tournament_simulator import TournamentSimulator, hole_type_ratings
+
+
+def test_weights_match_specification():
+    """Config weights follow the par-3/4/5 table in the simulation spec"""
+    weights = load_skill_weights()
+    np.testing.assert_allclose(weights, [
+        [0.10, 0.20, 0.60, 0.05, 0.05],
+        [0.30, 0.30, 0.30, 0.05, 0.05],
+        [0.40, 0.25, 0.25, 0.05, 0.05],
+    ])
+
+
+def test_effective_skill_table():
+    """One matrix product gives each player's skill per par type"""
+    approach_specialist = [40, 60, 95, 70, 70, 50, 50, 50, 50, 50, 50, 50]
+    bomber = [95, 50, 60, 50, 50, 50, 50, 50, 50, 50, 50, 50]
+    table = effective_skills(np.array([approach_specialist, bomber]))
+    assert table.shape == (2, 3)
+    # The approach specialist is better on par 3s, the bomber on par 5s
+    assert table[0, 0] > table[1, 0]
+    assert table[1, 2] > table[0, 2]
+    assert list(par_type_index(np.array([3, 4, 5, 4]))) == [0, 1, 2, 1]
+
+
+def test_simulator_looks_up_par_type_rating():
+    """With a per-par-type table, each hole uses its own column"""
+    pars = [3] * 9 + [5] * 9
+    course = CourseModel.from_holes(1, 'Split', pars, np.full(18, 55.0))
+    simulator = TournamentSimulator(course, SimulationStreams(4), (1, 1), rounds=1)
+    ratings = np.array([[80.0, 60.0, 40.0]])
+    ids = np.array([9])
+
+    par_3 = simulator.hole_performance(ids, ratings, 1)
+    np.testing.assert_array_equal(par_3, simulator.hole_performance(ids, np.array([80.0]), 1))
+    par_5 = simulator.hole_performance(ids, ratings, 10)
+    np.testing.assert_array_equal(par_5, simulator.hole_performance(ids, np.array([40.0]), 10))
+    assert hole_type_ratings(np.full((4, 12), 50.0)).shape == (4, 3)
+
+
+if __name__ == "__main__":
+    test_weights_match_specification()
+    test_effective_skill_table()
+    test_simulator_looks_up_par_type_rating()
+    print("✅ Skill weight tests passed")
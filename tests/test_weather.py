@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test script for round weather modifiers from course monthly normals
+"""
+
+import os
+import sqlite3
+import tempfile
+
+import numpy as np
+
+from core.live_simulation import LiveTournament
+from core.rng_streams import SimulationStreams
+from core.tournament_simulator import TournamentSimulator
+from core.weather import DEFAULT_NORMALS, TournamentWeather, WEATHER_COLUMNS, tournament_weather
+from helpers import make_course
+
+
+def make_weather_db(path):
+    """Courses DB with monthly normals for course 1: calm June, stormy July"""
+    conn = sqlite3.connect(path)
+    conn.execute(f'''
+        CREATE TABLE course_monthly_weather (
+            course_id INTEGER, month INTEGER, {', '.join(f'{c} REAL' for c in WEATHER_COLUMNS)}
+        )
+    ''')
+    conn.execute('INSERT INTO course_monthly_weather VALUES (1, 6, 20, 6, 0, 45, 62, 72, 82)')
+    conn.execute('INSERT INTO course_monthly_weather VALUES (1, 7, 90, 25, 100, 90, 75, 88, 101)')
+    conn.commit()
+    conn.close()
+
+
+def calm_weather(rounds=4, waves=1):
+    shape = (rounds, waves)
+    return TournamentWeather(np.full(shape, 70.0), np.zeros(shape), np.zeros(shape),
+                             np.full(shape, 50.0), np.zeros(shape))
+
+
+def test_weather_from_monthly_normals():
+    """Rounds use the normals of the month they are played in; waves differ in temp and wind"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'golf_courses.db')
+        make_weather_db(db_path)
+        streams = SimulationStreams(3)
+        weather = tournament_weather(1, '2025-06-29', streams, (1,), waves=2, db_path=db_path)
+        again = tournament_weather(1, '2025-06-29', SimulationStreams(3), (1,), waves=2, db_path=db_path)
+
+    assert weather.temp.shape == (4, 2)
+    np.testing.assert_array_equal(weather.wind, again.wind)
+    # Rounds 1-2 are in June (dry), rounds 3-4 in July (always raining)
+    assert np.all(weather.rain[:2] == 0) and np.all(weather.rain[2:] > 0)
+    assert np.all(weather.difficulty_multiplier[2:] > weather.difficulty_multiplier[:2].max())
+    assert np.all(weather.player_multiplier[2:] < weather.player_multiplier[:2].min())
+    # Afternoon wave is warmer and windier
+    assert np.all(weather.temp[:, 1] > weather.temp[:, 0])
+    assert np.all(weather.wind[:, 1] >= weather.wind[:, 0])
+
+    difficulty, player = weather.hole_multipliers(18, np.array([0, 1, 1]))
+    assert difficulty.shape == (3, 72)
+    assert difficulty[1, 40] == weather.difficulty_multiplier[2, 1]
+    assert player[0, 0] == weather.player_multiplier[0, 0]
+
+
+def test_unscheduled_event_uses_default_normals():
+    """Without a start date every round is drawn around DEFAULT_NORMALS; no courses DB is read"""
+    weather = tournament_weather(1, None, SimulationStreams(3), (1,), waves=2, db_path='/nonexistent/golf_courses.db')
+    again = tournament_weather(1, None, SimulationStreams(3), (1,), waves=2, db_path='/nonexistent/golf_courses.db')
+
+    assert weather.temp.shape == (4, 2)
+    np.testing.assert_array_equal(weather.temp, again.temp)
+    assert np.all(np.abs(weather.temp[:, 0] - DEFAULT_NORMALS['mean_temp']) < 25)
+
+
+def test_weather_scales_scoring():
+    """Calm weather changes nothing; bad weather raises scores for the whole field"""
+    course = make_course(1, 'Weather Course')
+    rng = np.random.default_rng(6)
+    player_ids = np.arange(1, 101)
+    ratings = rng.uniform(55, 75, (100, 3))
+    streams = SimulationStreams(12)
+
+    base = TournamentSimulator(course, streams, (1,)).simulate(player_ids, ratings)
+    calm = TournamentSimulator(course, streams, (1,), weather=calm_weather()).simulate(player_ids, ratings)
+    np.testing.assert_array_equal(base.strokes, calm.strokes)
+
+    shape = (4, 2)
+    storm = TournamentWeather(np.full(shape, 45.0), np.full(shape, 30.0), np.ones(shape),
+                              np.full(shape, 100.0), np.full(shape, 100.0))
+    waves = player_ids % 2
+    stormy = TournamentSimulator(course, streams, (1,), weather=storm).simulate(player_ids, ratings, waves)
+    print(f"   Mean total: calm {base.totals.mean():.1f}, storm {stormy.totals.mean():.1f}")
+    assert stormy.totals.mean() > base.totals.mean() + 4
+
+
+def test_live_state_keeps_weather():
+    """Weather is saved with the live state and restored on resume"""
+    course = make_course(1, 'Weather Course')
+    weather = calm_weather(waves=2)
+    weather.wind[1, 1] = 22.0
+    weather = TournamentWeather(weather.temp, weather.wind, weather.rain, weather.humidity, weather.cloud_cover)
+
+    conn = sqlite3.connect(':memory:')
+    live = LiveTournament.start(conn, 4, course, np.arange(1, 7), np.full(6, 65.0),
+                                waves=[0, 0, 0, 1, 1, 1], seed=1, weather=weather)
+    live.step()
+    resumed = LiveTournament.resume(conn, 4, course=course)
+    np.testing.assert_array_equal(resumed.weather.wind, weather.wind)
+    np.testing.assert_array_equal(resumed.weather.player_multiplier, weather.player_multiplier)
+
+
+if __name__ == "__main__":
+    test_weather_from_monthly_normals()
+    test_unscheduled_event_uses_default_normals()
+    test_weather_scales_scoring()
+    test_live_state_keeps_weather()
+    print("✅ Weather tests passed")